@@ -0,0 +1,271 @@
+"""
+Batch Transform for Monday.com Item Duplicator
+Maps a whole page of items column by column instead of item by item
+"""
+
+import json_codec
+from typing import Dict, List, Tuple, Union
+
+from item_model import ColumnValue, Item
+from relation_remap import is_relation_column
+
+# Marks a value that is not valid JSON (mapped from its text, like the per-item path)
+_INVALID = object()
+
+
+def decode_column(raw_values: List[str]) -> List:
+    """
+    Decode a column's JSON values with one decode call
+
+    Falls back to decoding value by value if the joined array doesn't parse
+    into exactly one element per value.
+
+    Returns:
+        Decoded values, with _INVALID for values that are not valid JSON
+    """
+    try:
+        decoded = json_codec.loads("[" + ",".join(raw_values) + "]")
+        if len(decoded) == len(raw_values):
+            return decoded
+    except json_codec.JSONDecodeError:
+        pass
+
+    decoded = []
+    for raw in raw_values:
+        try:
+            decoded.append(json_codec.loads(raw))
+        except json_codec.JSONDecodeError:
+            decoded.append(_INVALID)
+    return decoded
+
+
+def _invalid_values(raw_values) -> set:
+    """Raw values that are not valid JSON"""
+    invalid = set()
+    for raw in raw_values:
+        try:
+            json_codec.loads(raw)
+        except json_codec.JSONDecodeError:
+            invalid.add(raw)
+    return invalid
+
+
+class ColumnarTransform:
+    """
+    Produces the same payloads as MondayItemDuplicator.map_column_values for a page of items
+
+    The page is pivoted into one array per mapped column and each column goes
+    through a single converter: JSON values are decoded in one call per column,
+    text columns are not decoded at all, and status labels, dropdown options and
+    linked items are translated once per distinct value instead of once per item.
+    """
+
+    def __init__(
+        self,
+        duplicator,
+        column_mapping: Dict[str, str],
+        column_names: Dict[str, str],
+        source_board_name: str = "Source",
+        dest_board_name: str = "Destination",
+        source_board_id: int = None,
+        dest_board_id: int = None,
+        unknown_labels: str = "skip"
+    ):
+        """
+        Initialize batch transform
+
+        Args:
+            duplicator: MondayItemDuplicator providing translations and relation remapping
+            column_mapping: Dict mapping source column IDs to destination column IDs
+            column_names: Dict mapping column IDs to display names
+            source_board_id: Source board ID (enables label/option translation)
+            dest_board_id: Destination board ID (enables label/option translation)
+            unknown_labels: Policy for labels missing on the destination ("skip", "create", "error")
+        """
+        self.duplicator = duplicator
+        self.column_mapping = column_mapping
+        self.column_names = column_names
+        self.source_board_name = source_board_name
+        self.dest_board_name = dest_board_name
+        self.source_board_id = source_board_id
+        self.dest_board_id = dest_board_id
+        self.unknown_labels = unknown_labels
+
+    def transform(self, items: List[Item]) -> List[Union[Tuple[Dict, Dict[str, str]], Exception]]:
+        """
+        Map a page of items
+
+        Returns:
+            One entry per item, in order: (column values payload, summary line
+            per destination column), or the Exception that made the item fail
+        """
+        payloads = [{} for _ in items]
+        summaries = [{} for _ in items]
+        errors: List = [None] * len(items)
+
+        # Pivot: one pass over the page collects each mapped column's non-empty
+        # values and the rows they belong to
+        pivot = {source_col_id: ([], []) for source_col_id in self.column_mapping}
+        for row, item in enumerate(items):
+            for source_col_id, col in item.columns.items():
+                bucket = pivot.get(source_col_id)
+                if bucket is not None and col.value and col.value != "null":
+                    bucket[0].append(row)
+                    bucket[1].append(col)
+
+        for source_col_id, dest_col_id in self.column_mapping.items():
+            rows, columns = pivot[source_col_id]
+            if not rows:
+                continue
+
+            source_name = self.column_names.get(source_col_id, source_col_id)
+            dest_name = self.column_names.get(dest_col_id, dest_col_id)
+            prefix = f"✅ {source_name} ({self.source_board_name}) → {dest_name} ({self.dest_board_name}): "
+
+            # Scatter the converted values back to their items
+            column_type = columns[0].type
+            if is_relation_column(column_type):
+                column_type = "board_relation"
+            converter = getattr(self, "_convert_" + column_type, self._convert_other)
+            results = converter(source_col_id, dest_col_id, columns, prefix)
+            for row, result in zip(rows, results):
+                if result.__class__ is tuple:
+                    payloads[row][dest_col_id] = result[0]
+                    summaries[row][dest_col_id] = result[1]
+                elif result is not None and errors[row] is None:
+                    # The first failing column fails the item, like the per-item path
+                    errors[row] = result
+
+        return [
+            error if error is not None else (payload, summary)
+            for payload, summary, error in zip(payloads, summaries, errors)
+        ]
+
+    def _table(self, source_col_id: str, dest_col_id: str):
+        """Status/dropdown translation table for a column pair (None without both boards)"""
+        if self.source_board_id and self.dest_board_id:
+            return self.duplicator.translations.get(self.source_board_id, source_col_id, self.dest_board_id, dest_col_id)
+        return None
+
+    # Converters return one entry per value: (payload value, summary line),
+    # None to leave the column out, or the Exception that fails the item.
+
+    @staticmethod
+    def _convert_text(source_col_id, dest_col_id, columns: List[ColumnValue], prefix: str):
+        """Text columns map their text as is (no JSON decoding needed)"""
+        return [(col.text, f"{prefix}'{col.text}'") for col in columns]
+
+    def _convert_link(self, source_col_id, dest_col_id, columns: List[ColumnValue], prefix: str):
+        """Link columns use the URL as both link and display text"""
+        results = []
+        for col, value in zip(columns, decode_column([col.value for col in columns])):
+            if value is _INVALID:
+                results.append((col.text, f"{prefix}'{col.text}'"))
+                continue
+            try:
+                url = value.get("url", "")
+            except AttributeError as e:
+                results.append(e)
+                continue
+            results.append(({"url": url, "text": url}, prefix + url))
+        return results
+
+    def _convert_board_relation(self, source_col_id, dest_col_id, columns: List[ColumnValue], prefix: str):
+        """Board relation columns remap linked items once per distinct set of linked items"""
+        relations = self.duplicator.relations
+        targets = None
+        remapped: Dict[tuple, object] = {}
+
+        results = []
+        for col, value in zip(columns, decode_column([col.value for col in columns])):
+            if value is _INVALID:
+                results.append((col.text, f"{prefix}'{col.text}'"))
+                continue
+            try:
+                item_ids = tuple(int(linked["linkedPulseId"]) for linked in value.get("linkedPulseIds", []))
+            except Exception as e:
+                results.append(e)
+                continue
+
+            unresolved = []
+            mapped_ids = item_ids
+            if item_ids and self.dest_board_id:
+                if item_ids not in remapped:
+                    try:
+                        if targets is None:
+                            targets = relations.target_boards(self.dest_board_id, dest_col_id)
+                        remapped[item_ids] = relations.remap(list(item_ids), targets)
+                    except Exception as e:
+                        remapped[item_ids] = e
+                if isinstance(remapped[item_ids], Exception):
+                    results.append(remapped[item_ids])
+                    continue
+                mapped_ids, unresolved = remapped[item_ids]
+
+            if mapped_ids:
+                note = f" ({len(unresolved)} unresolved)" if unresolved else ""
+                results.append(({"item_ids": list(mapped_ids)}, f"{prefix}{len(mapped_ids)} linked item(s){note}"))
+            else:
+                results.append(None)
+        return results
+
+    def _convert_status(self, source_col_id, dest_col_id, columns: List[ColumnValue], prefix: str):
+        """Status columns translate each distinct label once and share its result"""
+        table = self._table(source_col_id, dest_col_id)
+        # Status values are interned, so the distinct raw values and labels are few
+        invalid = _invalid_values({col.value for col in columns})
+        valid_columns = [col for col in columns if col.value not in invalid] if invalid else columns
+
+        results_by_text: Dict[str, object] = {}
+        for text in dict.fromkeys(col.text for col in valid_columns):
+            try:
+                label = table.translate_label(text, self.unknown_labels) if table else text
+            except Exception as e:
+                results_by_text[text] = e
+                continue
+            results_by_text[text] = None if label is None else ({"label": label}, prefix + label)
+
+        if not invalid:
+            return [results_by_text[col.text] for col in columns]
+        return [
+            (col.text, f"{prefix}'{col.text}'") if col.value in invalid else results_by_text[col.text]
+            for col in columns
+        ]
+
+    _convert_color = _convert_status
+
+    def _convert_dropdown(self, source_col_id, dest_col_id, columns: List[ColumnValue], prefix: str):
+        """Dropdown columns extract and translate option IDs once per distinct value"""
+        table = self._table(source_col_id, dest_col_id)
+        converted: Dict[str, object] = {}
+        for raw in dict.fromkeys(col.value for col in columns):
+            value = decode_column([raw])[0]
+            try:
+                if value is _INVALID:
+                    converted[raw] = _INVALID
+                else:
+                    ids = value.get("ids", [])
+                    if ids and table:
+                        converted[raw] = table.translate_ids(ids, self.unknown_labels)
+                    else:
+                        converted[raw] = {"ids": ids} if ids else None
+            except Exception as e:
+                converted[raw] = e
+
+        results = []
+        for col in columns:
+            value = converted[col.value]
+            if value is _INVALID:
+                results.append((col.text, f"{prefix}'{col.text}'"))
+            elif value is None or isinstance(value, Exception):
+                results.append(value)
+            else:
+                results.append((value, prefix + col.text))
+        return results
+
+    def _convert_other(self, source_col_id, dest_col_id, columns: List[ColumnValue], prefix: str):
+        """Other columns pass their decoded value through"""
+        return [
+            (col.text, f"{prefix}'{col.text}'") if value is _INVALID else (value, prefix + col.text)
+            for col, value in zip(columns, decode_column([col.value for col in columns]))
+        ]
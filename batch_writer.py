@@ -0,0 +1,523 @@
+"""
+Batch Writer for Monday.com Item Duplicator
+Sends creates and updates as aliased mutations, sized adaptively per destination board
+"""
+
+import html
+import json_codec
+import re
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Union
+import requests
+from intent_log import Intent
+from resilience import CircuitOpen, is_ambiguous
+
+# Monday.com rejects a single query above 5,000,000 complexity points
+MAX_QUERY_COMPLEXITY = 5_000_000
+
+# Error text that means "send less per request" rather than "this operation is invalid"
+THROTTLE_MARKERS = (
+    "complexity",
+    "rate limit",
+    "ratelimit",
+    "too many requests",
+    "status 429",
+    "status 502",
+    "status 503",
+    "status 504",
+    "timeout",
+    "timed out",
+)
+
+
+@dataclass
+class WriteOp:
+    """One create_item, create_subitem, change_multiple_column_values, create_update or archive_item operation"""
+    kind: str  # "create", "create_subitem", "update", "create_update" or "archive"
+    column_values: Dict
+    item_name: str
+    group_id: Optional[str] = None
+    item_id: Optional[str] = None
+    create_labels: bool = False
+    source_item_id: Optional[str] = None
+    parent_item_id: Optional[str] = None
+    body: Optional[str] = None
+
+
+class AdaptiveBatchSizer:
+    """
+    Additive-increase / multiplicative-decrease batch size for one board
+
+    The size grows by one operation after every full batch that succeeds
+    and is halved on throttling or timeouts. It is also capped by the
+    measured complexity cost and latency per operation, so wide payloads
+    settle on smaller batches than narrow ones.
+    """
+
+    def __init__(
+        self,
+        initial: int = 5,
+        minimum: int = 1,
+        maximum: int = 50,
+        target_latency: float = 10.0,
+        complexity_budget: int = MAX_QUERY_COMPLEXITY // 2,
+        smoothing: float = 0.3
+    ):
+        """
+        Initialize batch sizer
+
+        Args:
+            initial: Batch size before anything is measured
+            minimum: Smallest batch size
+            maximum: Largest batch size
+            target_latency: Response time in seconds a batch should stay under
+            complexity_budget: Complexity points a batch should stay under
+            smoothing: Weight of the newest measurement in the moving averages
+        """
+        self.size = float(initial)
+        self.minimum = minimum
+        self.maximum = maximum
+        self.target_latency = target_latency
+        self.complexity_budget = complexity_budget
+        self.smoothing = smoothing
+
+        # Moving averages per operation (None until measured)
+        self.cost_per_op: Optional[float] = None
+        self.latency_per_op: Optional[float] = None
+        self.error_rate = 0.0
+
+        self._lock = threading.Lock()
+
+    def _average(self, current: Optional[float], sample: float) -> float:
+        """Exponential moving average"""
+        if current is None:
+            return sample
+        return current + self.smoothing * (sample - current)
+
+    def next_size(self) -> int:
+        """Get the size of the next batch"""
+        with self._lock:
+            size = int(self.size)
+            if self.cost_per_op:
+                size = min(size, int(self.complexity_budget / self.cost_per_op))
+            if self.latency_per_op:
+                size = min(size, int(self.target_latency / self.latency_per_op))
+            return max(self.minimum, min(self.maximum, size))
+
+    def record_success(self, count: int, latency: float, complexity: Optional[int] = None, failed: int = 0):
+        """
+        Record a batch that went through
+
+        Args:
+            count: Operations in the batch
+            latency: Response time in seconds
+            complexity: Complexity points reported for the batch
+            failed: Operations in the batch rejected individually
+        """
+        with self._lock:
+            self.latency_per_op = self._average(self.latency_per_op, latency / count)
+            if complexity:
+                self.cost_per_op = self._average(self.cost_per_op, complexity / count)
+            self.error_rate = self._average(self.error_rate, failed / count)
+
+            # Only a full batch that stayed healthy proves a bigger one might work
+            if count >= int(self.size) and self.error_rate < 0.2 and latency < self.target_latency:
+                self.size = min(self.maximum, self.size + 1)
+
+    def record_throttle(self, count: int):
+        """Record a batch rejected for complexity, rate limits or a timeout"""
+        with self._lock:
+            self.size = max(self.minimum, min(self.size, count) / 2)
+            self.error_rate = self._average(self.error_rate, 1.0)
+
+
+class SharedBatchSizer(AdaptiveBatchSizer):
+    """
+    Batch sizer whose learned size is shared by several processes
+
+    Each process keeps its own sizer, but every full batch that succeeds in
+    any process grows the shared size by one, and a process whose size is
+    behind the shared one catches up before sizing its next batch. Workers started with this
+    sizer (e.g. through a multiprocessing.Pool initializer) therefore grow
+    from the size learned so far instead of each starting again from the
+    initial size. A throttled process halves its own size and publishes it,
+    so shards started later begin below the limit. Measured costs and
+    latencies stay per process.
+    """
+
+    def __init__(self, **options):
+        """
+        Initialize shared batch sizer
+
+        Args:
+            **options: As for AdaptiveBatchSizer
+        """
+        import multiprocessing
+
+        super().__init__(**options)
+        self._shared = multiprocessing.Value("d", self.size)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def next_size(self) -> int:
+        """Get the size of the next batch, catching up with the shared size first"""
+        with self._shared.get_lock():
+            shared = self._shared.value
+        with self._lock:
+            if shared > self.size:
+                self.size = shared
+        return super().next_size()
+
+    def record_success(self, count: int, latency: float, complexity: Optional[int] = None, failed: int = 0):
+        """Record a batch that went through; a full batch in any process grows the shared size"""
+        before = self.size
+        super().record_success(count, latency, complexity, failed)
+        if self.size > before:
+            with self._shared.get_lock():
+                self._shared.value = min(self.maximum, max(self._shared.value + 1, self.size))
+
+    def record_throttle(self, count: int):
+        """Record a rejected batch and publish the reduced size"""
+        super().record_throttle(count)
+        with self._shared.get_lock():
+            self._shared.value = self.size
+
+
+class BatchWriter:
+    """Writes items to destination boards with aliased mutations"""
+
+    def __init__(self, duplicator, max_retries: int = 4, backoff_seconds: float = 2.0, **sizer_options):
+        """
+        Initialize batch writer
+
+        Args:
+            duplicator: MondayItemDuplicator used to send requests
+            max_retries: Attempts per batch after throttling before giving up
+            backoff_seconds: Base wait after throttling (doubles per attempt)
+            **sizer_options: Passed to each board's AdaptiveBatchSizer
+        """
+        self.duplicator = duplicator
+        self.max_retries = max_retries
+        self.backoff_seconds = backoff_seconds
+        self.sizer_options = sizer_options
+
+        self.sizers: Dict[int, AdaptiveBatchSizer] = {}
+        self._lock = threading.Lock()
+
+    def sizer(self, board_id: int) -> AdaptiveBatchSizer:
+        """Get (or create) the batch sizer of a destination board"""
+        with self._lock:
+            if board_id not in self.sizers:
+                self.sizers[board_id] = AdaptiveBatchSizer(**self.sizer_options)
+            return self.sizers[board_id]
+
+    @staticmethod
+    def build_mutation(board_id: int, ops: List[WriteOp]):
+        """
+        Build one aliased mutation for a batch of operations
+
+        Returns:
+            Tuple of (query, variables)
+        """
+        params = []
+        fields = ["complexity { query }"]
+        variables = {}
+
+        # create_subitem, create_update and archive_item take no board ID, and GraphQL rejects unused variables
+        if any(op.kind in ("create", "update") for op in ops):
+            params.append("$boardId: ID!")
+            variables["boardId"] = str(board_id)
+
+        for index, op in enumerate(ops):
+            if op.kind == "create_update":
+                variables[f"item{index}"] = str(op.item_id)
+                variables[f"body{index}"] = op.body
+                params += [f"$item{index}: ID!", f"$body{index}: String!"]
+                fields.append(f"op{index}: create_update(item_id: $item{index}, body: $body{index}) {{ id }}")
+                continue
+
+            if op.kind == "archive":
+                variables[f"item{index}"] = str(op.item_id)
+                params.append(f"$item{index}: ID!")
+                fields.append(f"op{index}: archive_item(item_id: $item{index}) {{ id name }}")
+                continue
+
+            variables[f"values{index}"] = json_codec.dumps(op.column_values)
+            variables[f"labels{index}"] = op.create_labels
+            params += [f"$values{index}: JSON!", f"$labels{index}: Boolean"]
+
+            if op.kind == "create":
+                variables[f"group{index}"] = op.group_id
+                variables[f"name{index}"] = op.item_name
+                params += [f"$group{index}: String!", f"$name{index}: String!"]
+                fields.append(
+                    f"op{index}: create_item(board_id: $boardId, group_id: $group{index}, "
+                    f"item_name: $name{index}, column_values: $values{index}, "
+                    f"create_labels_if_missing: $labels{index}) {{ id name }}"
+                )
+            elif op.kind == "create_subitem":
+                variables[f"parent{index}"] = str(op.parent_item_id)
+                variables[f"name{index}"] = op.item_name
+                params += [f"$parent{index}: ID!", f"$name{index}: String!"]
+                fields.append(
+                    f"op{index}: create_subitem(parent_item_id: $parent{index}, item_name: $name{index}, "
+                    f"column_values: $values{index}, create_labels_if_missing: $labels{index}) {{ id name }}"
+                )
+            else:
+                variables[f"item{index}"] = str(op.item_id)
+                params.append(f"$item{index}: ID!")
+                fields.append(
+                    f"op{index}: change_multiple_column_values(board_id: $boardId, item_id: $item{index}, "
+                    f"column_values: $values{index}, create_labels_if_missing: $labels{index}) {{ id name }}"
+                )
+
+        query = "mutation (%s) {\n    %s\n}" % (", ".join(params), "\n    ".join(fields))
+        return query, variables
+
+    @staticmethod
+    def is_throttle(error) -> bool:
+        """Check whether an error means the batch was too large or sent too fast"""
+        if isinstance(error, (requests.exceptions.Timeout, TimeoutError)):
+            return True
+        message = str(error).lower()
+        return any(marker in message for marker in THROTTLE_MARKERS)
+
+    def write(self, board_id: int, ops: List[WriteOp]) -> List[Union[Dict, Exception]]:
+        """
+        Write operations to a board in adaptively sized batches
+
+        Args:
+            board_id: Destination board ID
+            ops: Operations to send
+
+        Returns:
+            One result per operation, in order: the {"id", "name"} of the
+            written item, or the Exception that made it fail
+        """
+        sizer = self.sizer(board_id)
+        results: List[Union[Dict, Exception, None]] = [None] * len(ops)
+        pending = list(range(len(ops)))
+        attempts = 0
+
+        # Record every create before anything is sent, so retries can't duplicate items
+        intents: Dict[int, Intent] = {}
+        intent_log = self.duplicator.intent_log
+        if intent_log:
+            creates = [index for index, op in enumerate(ops) if op.kind == "create"]
+            if creates:
+                self.duplicator.recover_pending_creates()
+            # Boards with an identity column are reconciled by source item ID instead of name
+            identity_column = self.duplicator.identities.column(board_id)
+            recorded = intent_log.record_many([
+                Intent(
+                    0, board_id, ops[index].group_id, ops[index].item_name, ops[index].source_item_id,
+                    identity_column=identity_column,
+                    identity_value=str(ops[index].source_item_id) if identity_column else None
+                )
+                for index in creates
+            ])
+            intents = dict(zip(creates, recorded))
+
+        while pending:
+            indexes = pending[:sizer.next_size()]
+            batch = [ops[index] for index in indexes]
+
+            try:
+                started = time.monotonic()
+                query, variables = self.build_mutation(board_id, batch)
+                response = self.duplicator.execute_query_raw(query, variables)
+                latency = time.monotonic() - started
+            except CircuitOpen as e:
+                # Nothing was sent and the API is down: fail the rest at once instead of per batch
+                self._fail(pending, e, results, intents, abandon=True)
+                break
+            except Exception as e:
+                ambiguous = is_ambiguous(e)
+                if ambiguous:
+                    # The batch may have been applied - don't create those items twice
+                    self._recover_created(board_id, indexes, ops, results, intents)
+
+                if not self.is_throttle(e) or attempts >= self.max_retries:
+                    # Creates whose outcome is unknown stay pending in the intent log
+                    self._fail(indexes, e, results, intents, abandon=not ambiguous)
+                    attempts = 0
+                else:
+                    sizer.record_throttle(len(batch))
+                    attempts += 1
+                    time.sleep(self.backoff_seconds * 2 ** (attempts - 1))
+                pending = [index for index in pending if results[index] is None]
+                continue
+
+            data = response.get("data") or {}
+            errors = response.get("errors") or []
+
+            # Errors without a path (and no data) rejected the whole batch
+            batch_errors = [error for error in errors if not error.get("path")]
+            if batch_errors and not any(data.get(f"op{offset}") for offset in range(len(batch))):
+                error = Exception(f"GraphQL errors: {batch_errors}")
+                if self.is_throttle(error) and attempts < self.max_retries:
+                    sizer.record_throttle(len(batch))
+                    attempts += 1
+                    time.sleep(self.backoff_seconds * 2 ** (attempts - 1))
+                else:
+                    self._fail(indexes, error, results, intents)
+                    pending = pending[len(indexes):]
+                    attempts = 0
+                continue
+
+            # Per-operation errors carry the alias as the first path element
+            op_errors: Dict[str, List[Dict]] = {}
+            for error in errors:
+                if error.get("path"):
+                    op_errors.setdefault(str(error["path"][0]), []).append(error)
+
+            failed = 0
+            for offset, index in enumerate(indexes):
+                item = data.get(f"op{offset}")
+                if item:
+                    results[index] = item
+                    if index in intents:
+                        intent_log.commit(intents[index], item["id"])
+                else:
+                    failed += 1
+                    problem = op_errors.get(f"op{offset}") or errors or "no data returned"
+                    self._fail([index], Exception(f"GraphQL errors: {problem}"), results, intents)
+
+            complexity = (data.get("complexity") or {}).get("query")
+            sizer.record_success(len(batch), latency, complexity, failed)
+            pending = pending[len(indexes):]
+            attempts = 0
+
+        return results
+
+    def _fail(
+        self,
+        indexes: List[int],
+        error: Exception,
+        results: List,
+        intents: Dict[int, Intent],
+        abandon: bool = True
+    ):
+        """Record the same error for every unfinished operation of a batch"""
+        for index in indexes:
+            if results[index] is not None:
+                continue
+            results[index] = error
+            if abandon and index in intents:
+                self.duplicator.intent_log.abandon(intents[index], str(error))
+
+    def _recover_created(
+        self,
+        board_id: int,
+        indexes: List[int],
+        ops: List[WriteOp],
+        results: List,
+        intents: Dict[int, Intent]
+    ):
+        """Mark creates from a failed batch that reached the board anyway"""
+        self._recover_subitems(indexes, ops, results)
+        self._recover_updates(indexes, ops, results)
+
+        creates = [index for index in indexes if ops[index].kind == "create" and results[index] is None]
+        if not creates:
+            return
+
+        try:
+            if intents:
+                outcome = self.duplicator.intent_log.reconcile(
+                    self.duplicator, [intents[index] for index in creates]
+                )
+                found = {index: outcome.get(intents[index].id) for index in creates}
+            else:
+                items = self.duplicator.get_items_by_names(
+                    board_id, [ops[index].item_name for index in creates], column_ids=[]
+                )
+                found = {
+                    index: items[ops[index].item_name].id if ops[index].item_name in items else None
+                    for index in creates
+                }
+        except Exception:
+            return
+
+        for index, item_id in found.items():
+            if item_id:
+                results[index] = {"id": item_id, "name": ops[index].item_name}
+
+    def _recover_subitems(self, indexes: List[int], ops: List[WriteOp], results: List):
+        """
+        Mark subitem creates from a failed batch that reached their parent anyway
+
+        Subitem names are only unique per parent, so instead of the intent log
+        this re-reads the parents' subitems (one batched read) and claims each
+        new subitem once per matching create.
+        """
+        creates = [index for index in indexes if ops[index].kind == "create_subitem" and results[index] is None]
+        if not creates:
+            return
+
+        parent_ids = list(dict.fromkeys(ops[index].parent_item_id for index in creates))
+        try:
+            parents = self.duplicator.get_items_by_ids(
+                [int(parent_id) for parent_id in parent_ids], column_ids=[], subitem_column_ids=[]
+            )
+        except Exception:
+            return
+
+        # Subitems that existed before (updated here) or were already matched can't be claimed again
+        claimed = {str(result["id"]) for result in results if isinstance(result, dict)}
+        claimed.update(str(op.item_id) for op in ops if op.kind == "update")
+        available: Dict[tuple, List[str]] = {}
+        for parent in parents:
+            for subitem in parent.subitems or []:
+                if str(subitem.id) not in claimed:
+                    available.setdefault((str(parent.id), subitem.name), []).append(subitem.id)
+
+        for index in creates:
+            candidates = available.get((str(ops[index].parent_item_id), ops[index].item_name))
+            if candidates:
+                results[index] = {"id": candidates.pop(0), "name": ops[index].item_name}
+
+    def _recover_updates(self, indexes: List[int], ops: List[WriteOp], results: List):
+        """
+        Mark update posts from a failed batch that reached their item anyway
+
+        Re-reads the items' latest updates (one batched read) and matches them
+        by body text, ignoring markup and whitespace that Monday.com normalizes.
+        """
+        posts = [index for index in indexes if ops[index].kind == "create_update" and results[index] is None]
+        if not posts:
+            return
+
+        item_ids = list(dict.fromkeys(ops[index].item_id for index in posts))
+        try:
+            items = self.duplicator.get_items_by_ids(
+                [int(item_id) for item_id in item_ids], column_ids=[], updates_limit=100
+            )
+        except Exception:
+            return
+
+        claimed = {str(result["id"]) for result in results if isinstance(result, dict)}
+        available: Dict[tuple, List[str]] = {}
+        for item in items:
+            for update in item.updates or []:
+                if str(update.id) not in claimed:
+                    available.setdefault((str(item.id), _plain_text(update.body)), []).append(update.id)
+
+        for index in posts:
+            candidates = available.get((str(ops[index].item_id), _plain_text(ops[index].body)))
+            if candidates:
+                results[index] = {"id": candidates.pop(0)}
+
+
+def _plain_text(body: Optional[str]) -> str:
+    """Update body without HTML tags and with collapsed whitespace"""
+    return " ".join(html.unescape(re.sub(r"<[^>]+>", " ", body or "")).split())
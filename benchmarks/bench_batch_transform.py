@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Batch Transform Benchmark for Monday.com Item Duplicator
+Compares mapping a page of items item by item (map_column_values) vs column by column (ColumnarTransform)
+
+Usage:
+    python benchmarks/bench_batch_transform.py
+    python benchmarks/bench_batch_transform.py --items 10000 --repeat 9
+"""
+
+import argparse
+import gc
+import json
+import os
+import random
+import statistics
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from batch_transform import ColumnarTransform
+from board_schema import BoardSchema, ColumnSchema
+from item_model import Item
+from monday_item_duplicator import MondayItemDuplicator
+
+SOURCE_BOARD_ID = 1
+DEST_BOARD_ID = 2
+STATUS_LABELS = ["Working on it", "Done", "Stuck", "Not Started", "Review"]
+DROPDOWN_OPTIONS = ["SEO", "Content", "Design", "Dev", "Ads", "Social"]
+
+# Mapped columns: (column ID, type)
+COLUMNS = [
+    ("text_title", "text"),
+    ("text_keyword", "text"),
+    ("text_notes", "long_text"),
+    ("link_url", "link"),
+    ("link_draft", "link"),
+    ("status_stage", "status"),
+    ("status_review", "status"),
+    ("dropdown_topics", "dropdown"),
+    ("numbers_words", "numbers"),
+    ("date_due", "date"),
+]
+
+
+def make_schema(board_id: int, shift: int) -> BoardSchema:
+    """Board with every benchmark column (dropdown option IDs differ per board)"""
+    columns = {}
+    for column_id, column_type in COLUMNS:
+        column = ColumnSchema(id=column_id, title=column_id, type=column_type)
+        if column_type == "status":
+            column.status_labels = {label: index for index, label in enumerate(STATUS_LABELS)}
+        elif column_type == "dropdown":
+            column.dropdown_options = {index + shift: name for index, name in enumerate(DROPDOWN_OPTIONS)}
+        columns[column_id] = column
+    return BoardSchema(board_id=board_id, columns=columns)
+
+
+def make_items(count: int, rng: random.Random):
+    """Build a page of items as the API would return them"""
+    items = []
+    for item_index in range(count):
+        column_values = []
+        for column_id, column_type in COLUMNS:
+            if column_type in ("text", "long_text"):
+                text = f"Value {item_index} {column_id}"
+                value = json.dumps(text) if column_type == "text" else json.dumps({"text": text})
+            elif column_type == "link":
+                text = f"https://example.com/{item_index}/{column_id}"
+                value = json.dumps({"url": text, "text": text})
+            elif column_type == "status":
+                text = rng.choice(STATUS_LABELS)
+                value = json.dumps({"index": STATUS_LABELS.index(text)})
+            elif column_type == "dropdown":
+                chosen = rng.sample(range(len(DROPDOWN_OPTIONS)), 2)
+                text = ", ".join(DROPDOWN_OPTIONS[i] for i in chosen)
+                value = json.dumps({"ids": chosen})
+            elif column_type == "numbers":
+                text = str(rng.randint(300, 3000))
+                value = json.dumps(text)
+            else:
+                text = f"2024-0{rng.randint(1, 9)}-1{rng.randint(0, 9)}"
+                value = json.dumps({"date": text})
+
+            # Some values are empty, as on real boards
+            if rng.random() < 0.1:
+                text, value = "", None
+
+            column_values.append({"id": column_id, "type": column_type, "text": text, "value": value})
+
+        items.append(Item.from_api({
+            "id": str(10_000_000 + item_index),
+            "name": f"Item {item_index}",
+            "column_values": column_values
+        }))
+    return items
+
+
+def timed(fn) -> float:
+    """Wall time of one run, starting from a collected heap"""
+    gc.collect()
+    started = time.perf_counter()
+    fn()
+    return time.perf_counter() - started
+
+
+def main():
+    """Run the benchmark"""
+    parser = argparse.ArgumentParser(description="Per-item vs columnar transform of one page of items")
+    parser.add_argument("--items", type=int, default=10000, help="Items in the page")
+    parser.add_argument("--repeat", type=int, default=9, help="Runs per path (best time and median speedup are reported)")
+    args = parser.parse_args()
+
+    duplicator = MondayItemDuplicator("benchmark", validation="off")
+    duplicator.schema_cache.schemas[SOURCE_BOARD_ID] = make_schema(SOURCE_BOARD_ID, shift=1)
+    duplicator.schema_cache.schemas[DEST_BOARD_ID] = make_schema(DEST_BOARD_ID, shift=100)
+
+    items = make_items(args.items, random.Random(42))
+    column_mapping = {column_id: column_id for column_id, _ in COLUMNS}
+    options = {"source_board_id": SOURCE_BOARD_ID, "dest_board_id": DEST_BOARD_ID, "unknown_labels": "skip"}
+
+    transform = ColumnarTransform(duplicator, column_mapping, {}, **options)
+
+    def per_item():
+        return [duplicator.map_column_values(item, column_mapping, {}, **options) for item in items]
+
+    # Check the paths agree first, so neither path's results are alive while the other is timed
+    if transform.transform(items) != per_item():
+        print("❌ Payloads differ between the two paths")
+        sys.exit(1)
+
+    # Alternate the paths so background load affects both alike
+    per_item_times, columnar_times = [], []
+    for _ in range(args.repeat):
+        per_item_times.append(timed(per_item))
+        columnar_times.append(timed(lambda: transform.transform(items)))
+    speedup = statistics.median(p / c for p, c in zip(per_item_times, columnar_times))
+
+    print(f"Page: {args.items} items × {len(COLUMNS)} mapped columns (best of {args.repeat})")
+    print(f"  Per item (map_column_values): {min(per_item_times) * 1000:8.1f} ms")
+    print(f"  Columnar (ColumnarTransform): {min(columnar_times) * 1000:8.1f} ms")
+    print(f"  Speedup: {speedup:.1f}x median of {args.repeat} alternating runs (identical payloads)")
+
+
+if __name__ == "__main__":
+    main()
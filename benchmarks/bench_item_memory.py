@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Item Memory Benchmark for Monday.com Item Duplicator
+Compares peak memory of a buffered group as raw API dicts vs compact Items
+
+Usage:
+    python benchmarks/bench_item_memory.py
+    python benchmarks/bench_item_memory.py --items 50000 --columns 80 --mapped 12
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from item_model import Item
+
+STATUS_LABELS = ["Working on it", "Done", "Stuck", "Not Started", "Review"]
+PAGE_SIZE = 500
+
+
+def make_page(start: int, count: int, columns: int, rng: random.Random) -> str:
+    """Build one items_page response body as the API would return it"""
+    items = []
+    for item_index in range(start, start + count):
+        column_values = []
+        for col_index in range(columns):
+            kind = col_index % 4
+            if kind == 0:
+                label = rng.choice(STATUS_LABELS)
+                column_values.append({
+                    "id": f"status_{col_index}",
+                    "type": "status",
+                    "text": label,
+                    "value": json.dumps({"index": STATUS_LABELS.index(label)})
+                })
+            elif kind == 1:
+                url = f"https://example.com/{item_index}/{col_index}"
+                column_values.append({
+                    "id": f"link_{col_index}",
+                    "type": "link",
+                    "text": url,
+                    "value": json.dumps({"url": url, "text": url})
+                })
+            else:
+                text = f"Value {item_index}-{col_index}"
+                column_values.append({
+                    "id": f"text_{col_index}",
+                    "type": "text",
+                    "text": text,
+                    "value": json.dumps(text)
+                })
+
+        items.append({
+            "id": str(10_000_000 + item_index),
+            "name": f"Item {item_index}",
+            "group": {"id": "topics", "title": "Topics"},
+            "column_values": column_values
+        })
+
+    return json.dumps({"items": items})
+
+
+def measure(total: int, columns: int, column_ids, compact: bool) -> int:
+    """
+    Buffer a whole group page by page and return the peak traced memory in bytes
+
+    One response body is generated up front and decoded for every page, so
+    only decoding and buffering are traced.
+    """
+    body = make_page(0, PAGE_SIZE, columns, random.Random(42))
+    buffered = []
+
+    tracemalloc.start()
+    for start in range(0, total, PAGE_SIZE):
+        page = json.loads(body)["items"][:total - start]
+
+        if compact:
+            buffered.extend(Item.from_api(item, column_ids) for item in page)
+        else:
+            buffered.extend(page)
+        del page
+
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def main():
+    """Run the benchmark"""
+    parser = argparse.ArgumentParser(description="Peak memory of a buffered group: dicts vs compact Items")
+    parser.add_argument("--items", type=int, default=50000, help="Items in the group")
+    parser.add_argument("--columns", type=int, default=80, help="Columns on the board")
+    parser.add_argument("--mapped", type=int, default=12, help="Columns mapped by the workflow")
+    args = parser.parse_args()
+
+    prefixes = ["status", "link", "text", "text"]
+    column_ids = [f"{prefixes[i % 4]}_{i}" for i in range(args.mapped)]
+
+    print(f"Board: {args.items} items × {args.columns} columns, {args.mapped} mapped")
+
+    dict_peak = measure(args.items, args.columns, column_ids, compact=False)
+    print(f"  Raw API dicts (all columns):    {dict_peak / 1024 / 1024:8.1f} MB peak")
+
+    item_peak = measure(args.items, args.columns, column_ids, compact=True)
+    print(f"  Compact Items (mapped columns): {item_peak / 1024 / 1024:8.1f} MB peak")
+
+    print(f"  Reduction: {dict_peak / item_peak:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
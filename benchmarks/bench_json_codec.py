@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+JSON Codec Benchmark for Monday.com Item Duplicator
+Compares the stdlib json module vs json_codec (orjson when installed) on large items_page responses
+
+Usage:
+    python benchmarks/bench_json_codec.py
+    python benchmarks/bench_json_codec.py --items 500 --columns 80 --repeat 5
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import json_codec
+
+
+def make_response(items: int, columns: int, rng: random.Random) -> str:
+    """Build an items_page response body as the API would return it"""
+    page = []
+    for item_index in range(items):
+        column_values = []
+        for column_index in range(columns):
+            kind = column_index % 4
+            if kind == 0:
+                text = f"Valeur {item_index}-{column_index} · café"
+                value = json.dumps(text)
+            elif kind == 1:
+                text = f"https://example.com/{item_index}/{column_index}"
+                value = json.dumps({"url": text, "text": text})
+            elif kind == 2:
+                text = rng.choice(["Working on it", "Done", "Stuck"])
+                value = json.dumps({"index": rng.randint(0, 5), "post_id": None, "changed_at": "2024-05-01T10:00:00.000Z"})
+            else:
+                text = str(rng.randint(300, 3000))
+                value = json.dumps(text)
+            column_values.append({"id": f"col_{column_index}", "type": "text", "text": text, "value": value})
+
+        page.append({
+            "id": str(10_000_000 + item_index),
+            "name": f"Item {item_index}",
+            "group": {"id": "topics", "title": "Topics"},
+            "column_values": column_values
+        })
+
+    body = {"data": {"boards": [{"items_page": {"cursor": "MSw1MDAsW10", "items": page}}]}, "account_id": 1}
+    return json.dumps(body)
+
+
+def best_of(repeat: int, fn):
+    """Best wall time of several runs and the last result"""
+    best = None
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def decode_page(loads, text: str):
+    """Decode the response body and every column value, as a sync of the page does"""
+    data = loads(text)
+    values = []
+    for item in data["data"]["boards"][0]["items_page"]["items"]:
+        values.append([loads(col["value"]) for col in item["column_values"] if col["value"]])
+    return data, values
+
+
+def main():
+    """Run the benchmark"""
+    parser = argparse.ArgumentParser(description="stdlib json vs json_codec on items_page responses")
+    parser.add_argument("--items", type=int, default=500, help="Items in the page (items_page maximum is 500)")
+    parser.add_argument("--columns", type=int, default=80, help="Columns per item")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per path (best is reported)")
+    args = parser.parse_args()
+
+    text = make_response(args.items, args.columns, random.Random(42))
+    print(f"Page: {args.items} items × {args.columns} columns, {len(text) / 1e6:.1f} MB "
+          f"(codec backend: {json_codec.BACKEND}, best of {args.repeat})")
+
+    stdlib_time, stdlib_result = best_of(args.repeat, lambda: decode_page(json.loads, text))
+    codec_time, codec_result = best_of(args.repeat, lambda: decode_page(json_codec.loads, text))
+    print(f"  Decode (body + column values)  stdlib: {stdlib_time * 1000:8.1f} ms   codec: {codec_time * 1000:8.1f} ms"
+          f"   {stdlib_time / codec_time:.1f}x")
+
+    if codec_result != stdlib_result:
+        print("❌ Decoded values differ between the two paths")
+        sys.exit(1)
+
+    # Mutation payloads: one columnValues string per item
+    payloads = [dict(zip((col["id"] for col in item["column_values"]), values))
+                for item, values in zip(stdlib_result[0]["data"]["boards"][0]["items_page"]["items"], stdlib_result[1])]
+    compact = lambda obj: json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+    stdlib_time, stdlib_dumped = best_of(args.repeat, lambda: [compact(payload) for payload in payloads])
+    codec_time, codec_dumped = best_of(args.repeat, lambda: [json_codec.dumps(payload) for payload in payloads])
+    print(f"  Encode (columnValues per item) stdlib: {stdlib_time * 1000:8.1f} ms   codec: {codec_time * 1000:8.1f} ms"
+          f"   {stdlib_time / codec_time:.1f}x")
+
+    if codec_dumped != stdlib_dumped:
+        print("❌ Encoded payloads differ between the two paths")
+        sys.exit(1)
+
+    print("  Identical results on both paths")
+
+
+if __name__ == "__main__":
+    main()
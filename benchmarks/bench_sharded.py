@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Sharded Runner Benchmark for Monday.com Item Duplicator
+Measures batch throughput with 1..N worker processes against a simulated API
+
+Usage:
+    python benchmarks/bench_sharded.py
+    python benchmarks/bench_sharded.py --items 20000 --processes 1 2 4 8 --latency 0.05 --rate-limit 600
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from item_model import Item
+from rate_limiter import SharedRateLimiter
+from sharded_runner import ShardJob, run_shards, shard_items
+
+COLUMNS = 40
+MUTATION_ALIAS = re.compile(r"(op\d+): \w+\(")
+
+
+class SimulatedAPI:
+    """Transport answering item reads, name lookups and aliased mutations after a fixed latency"""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+
+    def post(self, payload):
+        time.sleep(self.latency)
+        query = payload["query"]
+        variables = payload.get("variables") or {}
+
+        if query.lstrip().startswith("mutation"):
+            data = {"complexity": {"query": 1000}}
+            for match in MUTATION_ALIAS.finditer(query):
+                index = match.group(1)[2:]
+                data[match.group(1)] = {"id": f"9{index}", "name": variables.get(f"name{index}", "")}
+            return 200, json.dumps({"data": data})
+
+        if "itemIds" in variables:
+            items = [
+                {
+                    "id": item_id,
+                    "name": f"Item {item_id}",
+                    "column_values": [
+                        {"id": f"text_{col}", "type": "text", "text": f"Value {item_id}-{col}",
+                         "value": json.dumps(f"Value {item_id}-{col}")}
+                        for col in range(COLUMNS)
+                    ]
+                }
+                for item_id in variables["itemIds"]
+            ]
+            return 200, json.dumps({"data": {"items": items}})
+
+        # Name lookups: nothing exists on the destination yet
+        return 200, json.dumps({"data": {"boards": [{"items_page": {"cursor": None, "items": []}}]}})
+
+
+def main():
+    """Run the benchmark"""
+    parser = argparse.ArgumentParser(description="Sharded batch throughput by number of worker processes")
+    parser.add_argument("--items", type=int, default=10000, help="Items in the source group")
+    parser.add_argument("--processes", type=int, nargs="+", default=[1, 2, 4], help="Process counts to measure")
+    parser.add_argument("--latency", type=float, default=0.02, help="Simulated seconds per API request")
+    parser.add_argument("--rate-limit", type=int, default=0, help="Shared requests per minute (0 = unlimited)")
+    args = parser.parse_args()
+
+    items = [Item(str(10_000_000 + index), f"Item {10_000_000 + index}") for index in range(args.items)]
+    column_mapping = {f"text_{col}": f"text_{col}" for col in range(COLUMNS)}
+    budget = f"{args.rate_limit} requests/minute" if args.rate_limit else "no rate limit"
+    print(f"Source: {args.items} items × {COLUMNS} columns, {args.latency * 1000:g} ms per request, {budget} "
+          f"({os.cpu_count()} CPU(s))")
+
+    baseline = None
+    for processes in args.processes:
+        jobs = [
+            ShardJob(
+                api_key="benchmark",
+                source_board_id=1,
+                source_board_name="Source",
+                dest_board_id=2,
+                dest_board_name="Destination",
+                dest_group_id="topics",
+                column_mapping=column_mapping,
+                column_names={},
+                item_ids=shard,
+                validation="off",
+                intents_path=":memory:",
+                updates_log_path=":memory:",
+                transport=SimulatedAPI(args.latency)
+            )
+            for shard in shard_items(items, processes * 4)
+        ]
+        rate_limiter = SharedRateLimiter(args.rate_limit) if args.rate_limit else None
+
+        started = time.perf_counter()
+        stdout = sys.stdout
+        sys.stdout = open(os.devnull, "w")
+        try:
+            totals = run_shards(jobs, processes, rate_limiter=rate_limiter)
+        finally:
+            sys.stdout.close()
+            sys.stdout = stdout
+        elapsed = time.perf_counter() - started
+
+        if totals["created"] != args.items:
+            print(f"❌ {processes} process(es): {totals['created']}/{args.items} items written")
+            sys.exit(1)
+
+        throughput = args.items / elapsed
+        baseline = baseline or throughput
+        print(f"  {processes:2d} process(es): {elapsed:7.2f} s   {throughput:8.0f} items/s   {throughput / baseline:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
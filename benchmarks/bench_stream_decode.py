@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Streaming Decode Benchmark for Monday.com Item Duplicator
+Compares decoding one items_page response buffered (whole body, then json) vs streamed (ItemsPageStream)
+
+Usage:
+    python benchmarks/bench_stream_decode.py
+    python benchmarks/bench_stream_decode.py --items 500 --columns 80
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import json_codec
+from item_model import Item
+from stream_decode import ItemsPageStream
+
+CHUNK_SIZE = 65536
+
+
+def make_body(items: int, columns: int) -> bytes:
+    """Build an items_page response body as the API would return it"""
+    page = []
+    for item_index in range(items):
+        column_values = []
+        for col_index in range(columns):
+            text = f"Value {item_index}-{col_index}"
+            column_values.append({"id": f"text_{col_index}", "type": "text", "text": text, "value": json.dumps(text)})
+        page.append({
+            "id": str(10_000_000 + item_index),
+            "name": f"Item {item_index}",
+            "group": {"id": "topics", "title": "Topics"},
+            "column_values": column_values
+        })
+
+    body = {"data": {"boards": [{"groups": [{"items_page": {"cursor": "MSw1MDAsW10", "items": page}}]}]}}
+    return json.dumps(body).encode("utf-8")
+
+
+def chunks(body: bytes):
+    """The body as it arrives from the connection"""
+    for start in range(0, len(body), CHUNK_SIZE):
+        yield body[start:start + CHUNK_SIZE]
+
+
+def buffered(body: bytes, column_ids):
+    """Read the whole body, decode it, then convert the page (the non-streaming path)"""
+    data = json_codec.loads(b"".join(chunks(body)).decode("utf-8"))
+    page = data["data"]["boards"][0]["groups"][0]["items_page"]
+    for item in page["items"]:
+        yield Item.from_api(item, column_ids)
+
+
+def streamed(body: bytes, column_ids, buffer_limit: int):
+    """Decode and convert items while the body arrives (bodies up to buffer_limit are decoded in one call)"""
+    for item in ItemsPageStream(chunks(body), buffer_limit=buffer_limit):
+        yield Item.from_api(item, column_ids)
+
+
+def measure(path, body: bytes, column_ids):
+    """Consume the page item by item; return (peak traced bytes, seconds to first item, seconds total, item IDs)"""
+    # Memory is traced in a run of its own, since tracing slows allocation down
+    tracemalloc.start()
+    for _ in path(body, column_ids):
+        pass
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    ids = []
+    started = time.perf_counter()
+    first = None
+    for item in path(body, column_ids):
+        if first is None:
+            first = time.perf_counter() - started
+        ids.append(item.id)
+    total = time.perf_counter() - started
+    return peak, first, total, ids
+
+
+def main():
+    """Run the benchmark"""
+    parser = argparse.ArgumentParser(description="Buffered vs streamed decoding of one items_page response")
+    parser.add_argument("--items", type=int, default=500, help="Items in the page (items_page maximum is 500)")
+    parser.add_argument("--columns", type=int, default=80, help="Columns per item")
+    parser.add_argument("--mapped", type=int, default=12, help="Columns kept per Item")
+    parser.add_argument("--buffer-limit", type=int, default=1 << 20, help="ItemsPageStream buffer_limit in bytes")
+    args = parser.parse_args()
+
+    body = make_body(args.items, args.columns)
+    column_ids = [f"text_{i}" for i in range(args.mapped)]
+    print(f"Page: {args.items} items × {args.columns} columns, {len(body) / 1e6:.1f} MB in {CHUNK_SIZE // 1024} KB chunks")
+
+    results = {}
+    def streamed_path(body, column_ids):
+        return streamed(body, column_ids, args.buffer_limit)
+
+    for name, path in (("Buffered", buffered), ("Streamed", streamed_path)):
+        peak, first, total, ids = measure(path, body, column_ids)
+        results[name] = ids
+        print(f"  {name}: {peak / 1024 / 1024:7.2f} MB peak   first item after {first * 1000:6.1f} ms   "
+              f"page in {total * 1000:6.1f} ms")
+
+    if results["Buffered"] != results["Streamed"]:
+        print("❌ Items differ between the two paths")
+        sys.exit(1)
+
+    print("  Identical items on both paths")
+
+
+if __name__ == "__main__":
+    main()
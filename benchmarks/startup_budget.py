@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Startup Budget Benchmark for Monday.com Item Duplicator
+Checks that `run.py --list` stays fast and never imports the network stack
+
+Usage:
+    python benchmarks/startup_budget.py
+    python benchmarks/startup_budget.py --budget-ms 40 --config config/workflows.json
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules that must not be imported by the --list path
+FORBIDDEN_MODULES = ["requests", "urllib3", "dotenv", "monday_item_duplicator", "sqlite3"]
+
+
+def measure_imports(config_path: str):
+    """
+    Run `python -X importtime run.py --list` once
+
+    Interpreter startup (everything up to and including `site`) is excluded,
+    since it does not depend on this project.
+
+    Returns:
+        Tuple of (cumulative import time in microseconds by top-level module, all imported modules)
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "run.py", "--config", config_path, "--list"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"run.py --list failed:\n{result.stdout}\n{result.stderr}")
+
+    top_level = {}
+    imported = set()
+    started = False
+
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+
+        _, cumulative_us, name = line.split("|")
+        module = name.strip()
+        # Top-level imports have exactly one space of indentation
+        is_top_level = name.startswith(" ") and not name.startswith("  ")
+
+        if not started:
+            started = is_top_level and module == "site"
+            continue
+
+        imported.add(module)
+        if is_top_level:
+            top_level[module] = int(cumulative_us)
+
+    return top_level, imported
+
+
+def main():
+    """Run the benchmark and enforce the budget"""
+    parser = argparse.ArgumentParser(description="Startup import-time budget for run.py --list")
+    parser.add_argument("--budget-ms", type=float, default=40.0, help="Import time budget in milliseconds")
+    parser.add_argument("--runs", type=int, default=5, help="Runs to take the best of")
+    parser.add_argument(
+        "--config",
+        default="config/workflows.template.json",
+        help="Configuration file to list (relative to the project root)"
+    )
+    args = parser.parse_args()
+
+    best_total = None
+    best_top_level = None
+    imported = set()
+
+    for _ in range(args.runs):
+        top_level, imported = measure_imports(args.config)
+        total = sum(top_level.values())
+        if best_total is None or total < best_total:
+            best_total = total
+            best_top_level = top_level
+
+    print(f"Import time for run.py --list (best of {args.runs}): {best_total / 1000:.1f} ms")
+    print("Slowest top-level imports:")
+    for module, cumulative in sorted(best_top_level.items(), key=lambda kv: -kv[1])[:10]:
+        print(f"  {cumulative / 1000:7.2f} ms  {module}")
+
+    failed = False
+
+    leaked = [module for module in FORBIDDEN_MODULES if module in imported]
+    if leaked:
+        print(f"✗ Heavy modules imported by --list: {', '.join(leaked)}")
+        failed = True
+
+    if best_total / 1000 > args.budget_ms:
+        print(f"✗ Over budget: {best_total / 1000:.1f} ms > {args.budget_ms:.1f} ms")
+        failed = True
+
+    if failed:
+        sys.exit(1)
+
+    print(f"✓ Within budget ({args.budget_ms:.1f} ms) and no heavy imports")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,247 @@
+"""
+Board Schema Cache for Monday.com Item Duplicator
+Fetches board column definitions once per run and validates payloads locally
+"""
+
+import json_codec
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+# Column types that cannot be written through column_values
+READ_ONLY_TYPES = {
+    "auto_number",
+    "button",
+    "creation_log",
+    "formula",
+    "item_id",
+    "last_updated",
+    "lookup",
+    "mirror",
+    "progress",
+    "subtasks",
+    "time_tracking",
+}
+
+
+def normalize_type(column_type: str) -> str:
+    """Normalize column type names across API versions ("board-relation", "color", ...)"""
+    column_type = (column_type or "").replace("-", "_")
+    if column_type == "color":
+        return "status"
+    return column_type
+
+
+@dataclass
+class ColumnSchema:
+    """Represents one column definition of a board"""
+    id: str
+    title: str
+    type: str
+    status_labels: Dict[str, int] = field(default_factory=dict)
+    dropdown_options: Dict[int, str] = field(default_factory=dict)
+    linked_board_ids: List[int] = field(default_factory=list)
+
+    @classmethod
+    def from_api(cls, data: Dict) -> "ColumnSchema":
+        """Build a column schema from a `columns { id title type settings_str }` entry"""
+        try:
+            settings = json_codec.loads(data.get("settings_str") or "{}")
+        except json_codec.JSONDecodeError:
+            settings = {}
+
+        column = cls(id=data["id"], title=data.get("title", data["id"]), type=normalize_type(data["type"]))
+
+        if column.type == "status":
+            labels = settings.get("labels", {})
+            column.status_labels = {
+                label: int(index) for index, label in labels.items() if label
+            }
+        elif column.type == "dropdown":
+            column.dropdown_options = {
+                int(option["id"]): option["name"] for option in settings.get("labels", [])
+            }
+        elif column.type in ("board_relation", "subtasks"):
+            board_ids = settings.get("boardIds") or []
+            if settings.get("boardId"):
+                board_ids = board_ids + [settings["boardId"]]
+            column.linked_board_ids = [int(board_id) for board_id in board_ids]
+
+        return column
+
+    def check_value(self, value, allow_new_labels: bool = False) -> str:
+        """
+        Check a payload value for this column
+
+        Args:
+            value: Payload value for this column
+            allow_new_labels: Labels will be created if missing (create_labels_if_missing)
+
+        Returns:
+            Problem description, or an empty string if the value is valid
+        """
+        if self.type in READ_ONLY_TYPES:
+            return f"'{self.title}' is a read-only {self.type} column"
+
+        if self.type == "status":
+            if isinstance(value, dict) and "label" in value:
+                if value["label"] not in self.status_labels and not allow_new_labels:
+                    return f"label '{value['label']}' does not exist in '{self.title}' (missingLabel)"
+            elif isinstance(value, dict) and "index" in value:
+                if int(value["index"]) not in self.status_labels.values():
+                    return f"label index {value['index']} does not exist in '{self.title}'"
+            elif not isinstance(value, str):
+                return f"status column '{self.title}' expects {{\"label\": ...}}"
+
+        elif self.type == "dropdown":
+            if isinstance(value, dict) and "ids" in value:
+                missing = [option_id for option_id in value["ids"] if int(option_id) not in self.dropdown_options]
+                if missing:
+                    return f"dropdown option id(s) {missing} do not exist in '{self.title}'"
+            elif isinstance(value, dict) and "labels" in value:
+                names = set(self.dropdown_options.values())
+                missing = [label for label in value["labels"] if label not in names]
+                if missing and not allow_new_labels:
+                    return f"dropdown label(s) {missing} do not exist in '{self.title}'"
+            elif not isinstance(value, str):
+                return f"dropdown column '{self.title}' expects {{\"ids\": [...]}}"
+
+        elif self.type == "board_relation":
+            if not isinstance(value, dict) or "item_ids" not in value:
+                return f"board relation column '{self.title}' expects {{\"item_ids\": [...]}}"
+
+        elif self.type == "link":
+            if isinstance(value, dict) and not value.get("url"):
+                return f"link column '{self.title}' expects a url"
+
+        return ""
+
+
+@dataclass
+class BoardSchema:
+    """Represents the column definitions of one board"""
+    board_id: int
+    columns: Dict[str, ColumnSchema]
+
+    @property
+    def subitem_board_id(self) -> Optional[int]:
+        """ID of the board holding this board's subitems (None if it has no subitems column)"""
+        for column in self.columns.values():
+            if column.type == "subtasks" and column.linked_board_ids:
+                return column.linked_board_ids[0]
+        return None
+
+    def validate(
+        self,
+        column_values: Dict,
+        allow_new_labels: bool = False
+    ) -> Tuple[Dict, List[Tuple[str, str]]]:
+        """
+        Split a column values payload into valid values and problems
+
+        Args:
+            column_values: Payload mapping column IDs to values
+            allow_new_labels: Missing status/dropdown labels will be created on write
+
+        Returns:
+            Tuple of (valid payload, list of (column_id, problem))
+        """
+        valid = {}
+        problems = []
+
+        for column_id, value in column_values.items():
+            column = self.columns.get(column_id)
+            if column is None:
+                problems.append((column_id, f"column does not exist on board {self.board_id}"))
+                continue
+
+            problem = column.check_value(value, allow_new_labels)
+            if problem:
+                problems.append((column_id, problem))
+            else:
+                valid[column_id] = value
+
+        return valid, problems
+
+    def check_mapping(self, dest_column_ids) -> List[str]:
+        """
+        Check that mapped destination columns exist and are writable
+
+        Returns:
+            List of problem descriptions
+        """
+        problems = []
+        for column_id in dest_column_ids:
+            column = self.columns.get(column_id)
+            if column is None:
+                problems.append(f"{column_id}: column does not exist on board {self.board_id}")
+            elif column.type in READ_ONLY_TYPES:
+                problems.append(f"{column_id}: '{column.title}' is a read-only {column.type} column")
+        return problems
+
+
+class SchemaCache:
+    """Caches board schemas for the lifetime of a MondayItemDuplicator"""
+
+    def __init__(self, duplicator):
+        """
+        Initialize schema cache
+
+        Args:
+            duplicator: MondayItemDuplicator used to fetch board columns
+        """
+        self.duplicator = duplicator
+        self.schemas: Dict[int, BoardSchema] = {}
+        self._lock = threading.Lock()
+
+    def prefetch(self, board_ids: List[int]):
+        """Fetch the schemas of several boards in one request"""
+        query = """
+        query ($boardIds: [ID!]) {
+            boards(ids: $boardIds) {
+                id
+                columns {
+                    id
+                    title
+                    type
+                    settings_str
+                }
+            }
+        }
+        """
+
+        with self._lock:
+            missing = [board_id for board_id in dict.fromkeys(map(int, board_ids)) if board_id not in self.schemas]
+            if not missing:
+                return
+
+            data = self.duplicator.execute_query(
+                query,
+                {"boardIds": [str(board_id) for board_id in missing]}
+            )
+
+            for board in data["boards"]:
+                board_id = int(board["id"])
+                self.schemas[board_id] = BoardSchema(
+                    board_id=board_id,
+                    columns={
+                        column["id"]: ColumnSchema.from_api(column)
+                        for column in board["columns"]
+                    }
+                )
+
+            for board_id in missing:
+                if board_id not in self.schemas:
+                    raise ValueError(f"Board {board_id} not found or not accessible")
+
+    def invalidate(self, board_id: int):
+        """Forget a board's schema so that its next use fetches it again"""
+        with self._lock:
+            self.schemas.pop(int(board_id), None)
+
+    def get(self, board_id: int) -> BoardSchema:
+        """Get the schema of a board, fetching it on first use"""
+        board_id = int(board_id)
+        if board_id not in self.schemas:
+            self.prefetch([board_id])
+        return self.schemas[board_id]
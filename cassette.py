@@ -0,0 +1,163 @@
+"""
+Cassettes for Monday.com Item Duplicator
+Records real API traffic to a file and replays it offline
+"""
+
+import json
+import os
+import threading
+import time
+from typing import Callable, Dict, List, Tuple
+
+import requests
+
+from resilience import DeadlineExceeded
+
+CASSETTE_VERSION = 1
+SCRUBBED = "<API_KEY>"
+
+# Recorded errors that are not requests exceptions
+REPLAYED_ERRORS = {"DeadlineExceeded": DeadlineExceeded, "TimeoutError": TimeoutError}
+
+
+def request_key(payload: Dict) -> str:
+    """Identity of a request: query text and canonical variables"""
+    return json.dumps(
+        {"query": payload.get("query"), "variables": payload.get("variables")},
+        sort_keys=True,
+        separators=(",", ":")
+    )
+
+
+class CassetteMiss(Exception):
+    """A replayed run sent a request that is not on the cassette"""
+
+
+def replayed_error(name: str, message: str) -> Exception:
+    """
+    Rebuild a recorded transport error as its original class (e.g. requests' ReadTimeout)
+
+    Retries and the circuit breaker classify errors by class, so a replayed
+    timeout has to be a real timeout. Unknown names get a stand-in class.
+    """
+    error_class = getattr(requests.exceptions, name, None) or REPLAYED_ERRORS.get(name)
+    if isinstance(error_class, type) and issubclass(error_class, Exception):
+        return error_class(message)
+    return type(name, (Exception,), {})(message)
+
+
+class RecordingTransport:
+    """Sends requests over HTTP and appends every interaction to a cassette"""
+
+    def __init__(self, send: Callable[[Dict], Tuple[int, str]], path: str, api_key: str = None):
+        """
+        Initialize recording transport
+
+        Args:
+            send: Real transport, e.g. MondayItemDuplicator.http_post
+            path: Cassette file to write (JSON Lines, appended)
+            api_key: Secret removed from everything written to the cassette
+        """
+        self.send = send
+        self.path = path
+        self.api_key = api_key
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        if not os.path.exists(path):
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(json.dumps({"cassette": CASSETTE_VERSION}) + "\n")
+
+    def _scrub(self, text: str) -> str:
+        """Remove the API key from a string"""
+        if self.api_key and text:
+            return text.replace(self.api_key, SCRUBBED)
+        return text
+
+    def post(self, payload: Dict) -> Tuple[int, str]:
+        """Send a request and record it with its response and latency"""
+        started = time.perf_counter()
+        interaction = {"request": json.loads(self._scrub(json.dumps(payload)))}
+
+        try:
+            status_code, text = self.send(payload)
+        except Exception as e:
+            interaction["error"] = {"type": type(e).__name__, "message": self._scrub(str(e))}
+            interaction["elapsed"] = time.perf_counter() - started
+            self._append(interaction)
+            raise
+
+        interaction["response"] = {"status": status_code, "body": self._scrub(text)}
+        interaction["elapsed"] = time.perf_counter() - started
+        self._append(interaction)
+        return status_code, text
+
+    def _append(self, interaction: Dict):
+        """Write one interaction to the cassette"""
+        line = json.dumps(interaction, ensure_ascii=False)
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+
+
+class ReplayTransport:
+    """Serves recorded responses instead of calling the API"""
+
+    def __init__(self, path: str, latency_scale: float = 1.0):
+        """
+        Load a cassette
+
+        Args:
+            path: Cassette file written by RecordingTransport
+            latency_scale: Multiplier for recorded latencies (0 replays instantly)
+        """
+        self.path = path
+        self.latency_scale = latency_scale
+
+        # Identical requests are answered in recorded order; the last answer repeats
+        self.interactions: Dict[str, List[Dict]] = {}
+        self._served: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+        with open(path, "r", encoding="utf-8") as f:
+            header = json.loads(f.readline() or "{}")
+            if header.get("cassette") != CASSETTE_VERSION:
+                raise ValueError(f"{path} is not a version {CASSETTE_VERSION} cassette")
+
+            for line in f:
+                if line.strip():
+                    interaction = json.loads(line)
+                    self.interactions.setdefault(request_key(interaction["request"]), []).append(interaction)
+
+    def post(self, payload: Dict) -> Tuple[int, str]:
+        """Return the recorded response for a request"""
+        key = request_key(payload)
+
+        with self._lock:
+            recorded = self.interactions.get(key)
+            if not recorded:
+                query = " ".join(payload.get("query", "").split())[:80]
+                raise CassetteMiss(f"Request not on cassette {self.path}: {query}...")
+            index = self._served.get(key, 0)
+            self._served[key] = index + 1
+            interaction = recorded[min(index, len(recorded) - 1)]
+
+        delay = interaction.get("elapsed", 0.0) * self.latency_scale
+        if delay > 0:
+            time.sleep(delay)
+
+        if "error" in interaction:
+            raise replayed_error(interaction["error"]["type"], interaction["error"]["message"])
+
+        response = interaction["response"]
+        return response["status"], response["body"]
+
+    def unused(self) -> int:
+        """Number of recorded interactions the replay never asked for"""
+        with self._lock:
+            return sum(
+                max(0, len(recorded) - self._served.get(key, 0))
+                for key, recorded in self.interactions.items()
+            )
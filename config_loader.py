@@ -5,8 +5,16 @@ Loads and validates workflow configurations from JSON files
 
 import json
 import os
+import pickle
+import time
 from typing import Dict, List, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+
+# Bump when the pickled structure of the compiled configuration changes
+CACHE_VERSION = 6
+
+# Coarsest modification time resolution to allow for (FAT stores 2 seconds)
+MTIME_RESOLUTION_NS = 2_000_000_000
 
 
 @dataclass
@@ -27,12 +35,31 @@ class Destination:
     template: Optional[str] = None
     overrides: Dict[str, str] = None
     additional_mappings: List[Dict] = None
+    unknown_labels: str = "skip"
+    subitem_mappings: List[Dict] = None
+    copy_subitems: bool = False
+    copy_updates: bool = False
+    mirror_groups: bool = False
+    identity_column: Optional[str] = None  # Destination column storing the source item ID
+
+    # Filled in by ConfigLoader when the configuration is compiled
+    resolved_mapping: Optional[Dict[str, str]] = field(default=None, repr=False, compare=False)
+    resolved_names: Optional[Dict[str, str]] = field(default=None, repr=False, compare=False)
 
     def __post_init__(self):
         if self.overrides is None:
             self.overrides = {}
         if self.additional_mappings is None:
             self.additional_mappings = []
+        if self.subitem_mappings is None:
+            self.subitem_mappings = []
+        if self.subitem_mappings:
+            self.copy_subitems = True
+        if self.unknown_labels not in ("skip", "create", "error"):
+            raise ValueError(
+                f"Invalid unknown_labels '{self.unknown_labels}' for {self.board_name} "
+                f"(expected skip, create or error)"
+            )
 
 
 @dataclass
@@ -63,18 +90,35 @@ class Template:
 class ConfigLoader:
     """Loads and validates workflow configurations"""
 
-    def __init__(self, config_path: str = "config/workflows.json"):
+    def __init__(self, config_path: str = "config/workflows.json", use_cache: bool = True):
         """
         Initialize config loader
 
         Args:
-            config_path: Path to workflows.json file
+            config_path: Path to workflows.json file, or to a sharded workflows.d/
+                         directory (used automatically when workflows.json is missing)
+            use_cache: Reuse the compiled configuration cached next to the file
         """
-        self.config_path = config_path
-        self.templates: Dict[str, Template] = {}
-        self.workflows: List[Workflow] = []
+        sharded_path = os.path.splitext(config_path)[0] + ".d"
+        if not os.path.exists(config_path) and os.path.isdir(sharded_path):
+            config_path = sharded_path
 
-        if os.path.exists(config_path):
+        self.config_path = config_path
+        self.cache_path = config_path + ".cache"
+        self.use_cache = use_cache
+        self.sharded = os.path.isdir(config_path)
+        self._templates: Dict[str, Template] = {}
+        self._workflows: List[Workflow] = []
+        self._workflow_index: Dict[str, Workflow] = {}
+
+        # Sharded mode: workflow/template ID -> file, from the manifest
+        self._workflow_files: Dict[str, str] = {}
+        self._template_files: Dict[str, str] = {}
+        self._all_loaded = False
+
+        if self.sharded:
+            self.load_manifest()
+        elif os.path.exists(config_path):
             self.load()
         else:
             raise FileNotFoundError(
@@ -82,61 +126,266 @@ class ConfigLoader:
                 f"Please create it from config/workflows.template.json"
             )
 
+    @property
+    def templates(self) -> Dict[str, Template]:
+        """All templates (in sharded mode, reading every template file on first access)"""
+        if self.sharded:
+            for template_id in self._template_files:
+                self._get_template(template_id)
+        return self._templates
+
+    @templates.setter
+    def templates(self, value: Dict[str, Template]):
+        self._templates = value
+
+    @property
+    def workflows(self) -> List[Workflow]:
+        """All workflows (in sharded mode, reading every workflow file on first access)"""
+        if self.sharded and not self._all_loaded:
+            for workflow_id in self._workflow_files:
+                self.get_workflow(workflow_id)
+            self._workflows = [self._workflow_index[w] for w in self._workflow_files if w in self._workflow_index]
+            self._all_loaded = True
+        return self._workflows
+
+    @workflows.setter
+    def workflows(self, value: List[Workflow]):
+        self._workflows = value
+
+    def load_manifest(self):
+        """
+        Read the sharded directory's manifest.json
+
+        Without a manifest, every *.json file in the directory is a workflow named
+        after the file and every templates/*.json file is a template.
+        """
+        manifest_path = os.path.join(self.config_path, "manifest.json")
+
+        if os.path.exists(manifest_path):
+            with open(manifest_path, 'r') as f:
+                manifest = json.load(f)
+            self._workflow_files = dict(manifest.get("workflows", {}))
+            self._template_files = dict(manifest.get("templates", {}))
+            return
+
+        for name in sorted(os.listdir(self.config_path)):
+            if name.endswith(".json") and name != "manifest.json":
+                self._workflow_files[name[:-5]] = name
+
+        templates_dir = os.path.join(self.config_path, "templates")
+        if os.path.isdir(templates_dir):
+            for name in sorted(os.listdir(templates_dir)):
+                if name.endswith(".json"):
+                    self._template_files[name[:-5]] = os.path.join("templates", name)
+
+    def _read_shard(self, relative_path: str) -> Dict:
+        """Read one JSON file of the sharded directory"""
+        with open(os.path.join(self.config_path, relative_path), 'r') as f:
+            return json.load(f)
+
+    def _get_template(self, template_id: Optional[str]) -> Optional[Template]:
+        """Get a template by ID, reading its file on first use in sharded mode"""
+        if not template_id:
+            return None
+        if template_id not in self._templates and template_id in self._template_files:
+            self._templates[template_id] = self._parse_template(
+                self._read_shard(self._template_files[template_id])
+            )
+        return self._templates.get(template_id)
+
     def load(self):
-        """Load and parse the configuration file"""
-        with open(self.config_path, 'r') as f:
-            data = json.load(f)
+        """
+        Load the configuration, from the compiled cache when it is still valid
+
+        The cache is a pickle, and unpickling can run arbitrary code, so it is
+        trusted exactly as far as the directory it lives in: anyone who can
+        write <config>.cache can run code as the user loading it. The header
+        checks below only guard against stale or misplaced caches, not against
+        tampering - keep the config directory writable only by trusted users,
+        or pass use_cache=False.
+
+        The file is read and hashed only when its modification time or size
+        changed, or when it was modified within the timestamp resolution of
+        the last check, since a same-size edit in that window keeps both.
+        """
+        checked_ns = time.time_ns()
+        stat = os.stat(self.config_path)
+
+        header = None
+        if self.use_cache:
+            header, compiled = self._read_cache()
+
+        if (
+            header
+            and header["mtime_ns"] == stat.st_mtime_ns
+            and header["size"] == stat.st_size
+            and header["checked_ns"] - stat.st_mtime_ns > MTIME_RESOLUTION_NS
+        ):
+            self._apply_compiled(compiled)
+            return
+
+        import hashlib
+
+        with open(self.config_path, 'rb') as f:
+            raw = f.read()
+        digest = hashlib.sha256(raw).hexdigest()
+
+        if header and header["sha256"] == digest:
+            self._apply_compiled(compiled)
+        else:
+            self.parse(json.loads(raw))
+            self.compile()
+
+        # New content, or the file was touched or too recently modified - refresh the cache header
+        if self.use_cache:
+            self._write_cache(stat, digest, checked_ns)
+
+    def _read_cache(self):
+        """
+        Read the compiled configuration cache
+
+        Returns:
+            Tuple of (header, compiled data), or (None, None) if missing, written
+            by another version or for another configuration file, or unusable
+        """
+        try:
+            with open(self.cache_path, 'rb') as f:
+                header = pickle.load(f)
+                if header.get("version") != CACHE_VERSION or header.get("path") != os.path.abspath(self.config_path):
+                    return None, None
+                return header, pickle.load(f)
+        except Exception:
+            return None, None
+
+    def _write_cache(self, stat, digest: str, checked_ns: int):
+        """Write the compiled configuration cache (failures are ignored)"""
+        header = {
+            "version": CACHE_VERSION,
+            "path": os.path.abspath(self.config_path),
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "sha256": digest,
+            "checked_ns": checked_ns
+        }
+        tmp_path = f"{self.cache_path}.{os.getpid()}.tmp"
+
+        try:
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(header, f, protocol=pickle.HIGHEST_PROTOCOL)
+                pickle.dump((self._templates, self._workflows), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self.cache_path)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def _apply_compiled(self, compiled):
+        """Use a compiled (templates, workflows) pair loaded from the cache"""
+        self._templates, self._workflows = compiled
+        self._workflow_index = {w.id: w for w in self._workflows}
+
+    def compile(self):
+        """Index workflows by ID and resolve every destination's mappings once"""
+        self._workflow_index = {w.id: w for w in self._workflows}
+
+        # Destinations with the same template, overrides and additional mappings
+        # share one resolved dict (also keeps the cache file small)
+        resolved = {}
+
+        for workflow in self._workflows:
+            self._compile_workflow(workflow, resolved)
+
+    def _compile_workflow(self, workflow: Workflow, resolved: Dict):
+        """Resolve the mappings of one workflow's destinations"""
+        for destination in workflow.destinations:
+            key = (
+                destination.template,
+                tuple(destination.overrides.items()),
+                tuple(tuple(m.items()) for m in destination.additional_mappings),
+                tuple(tuple(m.items()) for m in destination.subitem_mappings)
+            )
+            if key not in resolved:
+                resolved[key] = (
+                    self._build_column_mappings(destination),
+                    self._build_column_names(destination)
+                )
+            destination.resolved_mapping, destination.resolved_names = resolved[key]
+
+    def parse(self, data: Dict):
+        """
+        Parse configuration data into templates and workflows
+
+        Args:
+            data: Decoded contents of workflows.json
+        """
+        self._templates = {}
+        self._workflows = []
 
         # Load templates
         templates_data = data.get("templates", {})
         for template_id, template_data in templates_data.items():
-            mappings = []
-            for mapping in template_data.get("column_mappings", []):
-                mappings.append(ColumnMapping(
-                    source=mapping["source"],
-                    dest=mapping["dest"],
-                    name=mapping["name"],
-                    type=mapping.get("type", "text")
-                ))
-
-            self.templates[template_id] = Template(
-                description=template_data.get("description", ""),
-                column_mappings=mappings
-            )
+            self._templates[template_id] = self._parse_template(template_data)
 
         # Load workflows
         workflows_data = data.get("workflows", [])
         for workflow_data in workflows_data:
-            # Parse source
-            source_data = workflow_data["source"]
-            source = Source(
-                board_id=source_data["board_id"],
-                group_id=source_data["group_id"],
-                board_name=source_data.get("board_name", "Source Board")
-            )
-
-            # Parse destinations
-            destinations = []
-            for dest_data in workflow_data["destinations"]:
-                destinations.append(Destination(
-                    board_id=dest_data["board_id"],
-                    group_id=dest_data["group_id"],
-                    board_name=dest_data.get("board_name", "Destination Board"),
-                    template=dest_data.get("template"),
-                    overrides=dest_data.get("overrides", {}),
-                    additional_mappings=dest_data.get("additional_mappings", [])
-                ))
-
-            # Create workflow
-            workflow = Workflow(
-                id=workflow_data["id"],
-                name=workflow_data["name"],
-                enabled=workflow_data.get("enabled", True),
-                source=source,
-                destinations=destinations
-            )
-
-            self.workflows.append(workflow)
+            self._workflows.append(self._parse_workflow(workflow_data))
+
+    @staticmethod
+    def _parse_template(template_data: Dict) -> Template:
+        """Parse one template definition"""
+        mappings = []
+        for mapping in template_data.get("column_mappings", []):
+            mappings.append(ColumnMapping(
+                source=mapping["source"],
+                dest=mapping["dest"],
+                name=mapping["name"],
+                type=mapping.get("type", "text")
+            ))
+
+        return Template(
+            description=template_data.get("description", ""),
+            column_mappings=mappings
+        )
+
+    @staticmethod
+    def _parse_workflow(workflow_data: Dict) -> Workflow:
+        """Parse one workflow definition"""
+        # Parse source
+        source_data = workflow_data["source"]
+        source = Source(
+            board_id=source_data["board_id"],
+            group_id=source_data["group_id"],
+            board_name=source_data.get("board_name", "Source Board")
+        )
+
+        # Parse destinations
+        destinations = []
+        for dest_data in workflow_data["destinations"]:
+            mirror_groups = dest_data.get("mirror_groups", False)
+            destinations.append(Destination(
+                board_id=dest_data["board_id"],
+                # With mirror_groups the group is only a fallback for unmapped groups
+                group_id=dest_data.get("group_id") if mirror_groups else dest_data["group_id"],
+                board_name=dest_data.get("board_name", "Destination Board"),
+                template=dest_data.get("template"),
+                overrides=dest_data.get("overrides", {}),
+                additional_mappings=dest_data.get("additional_mappings", []),
+                unknown_labels=dest_data.get("unknown_labels", "skip"),
+                subitem_mappings=dest_data.get("subitem_mappings", []),
+                copy_subitems=dest_data.get("copy_subitems", False),
+                copy_updates=dest_data.get("copy_updates", False),
+                mirror_groups=mirror_groups,
+                identity_column=dest_data.get("identity_column")
+            ))
+
+        # Create workflow
+        return Workflow(
+            id=workflow_data["id"],
+            name=workflow_data["name"],
+            enabled=workflow_data.get("enabled", True),
+            source=source,
+            destinations=destinations
+        )
 
     def get_workflow(self, workflow_id: str) -> Optional[Workflow]:
         """
@@ -148,10 +397,20 @@ class ConfigLoader:
         Returns:
             Workflow object or None if not found
         """
-        for workflow in self.workflows:
-            if workflow.id == workflow_id:
-                return workflow
-        return None
+        workflow = self._workflow_index.get(workflow_id)
+
+        # Sharded mode: parse only this workflow and the templates it references
+        if workflow is None and self.sharded and workflow_id in self._workflow_files:
+            workflow = self._parse_workflow(self._read_shard(self._workflow_files[workflow_id]))
+            if workflow.id != workflow_id:
+                raise ValueError(
+                    f"{self._workflow_files[workflow_id]} defines workflow '{workflow.id}', "
+                    f"expected '{workflow_id}'"
+                )
+            self._compile_workflow(workflow, {})
+            self._workflow_index[workflow_id] = workflow
+
+        return workflow
 
     def get_enabled_workflows(self) -> List[Workflow]:
         """Get all enabled workflows"""
@@ -166,12 +425,19 @@ class ConfigLoader:
 
         Returns:
             Dictionary mapping source column IDs to destination column IDs
+            (precompiled and shared - do not modify)
         """
+        if destination.resolved_mapping is None:
+            destination.resolved_mapping = self._build_column_mappings(destination)
+        return destination.resolved_mapping
+
+    def _build_column_mappings(self, destination: Destination) -> Dict[str, str]:
+        """Merge template, overrides and additional mappings for a destination"""
         column_mapping = {}
 
         # Start with template if specified
-        if destination.template and destination.template in self.templates:
-            template = self.templates[destination.template]
+        template = self._get_template(destination.template)
+        if template:
             for mapping in template.column_mappings:
                 column_mapping[mapping.source] = mapping.dest
 
@@ -187,6 +453,26 @@ class ConfigLoader:
 
         return column_mapping
 
+    def resolve_subitem_mappings(self, destination: Destination) -> Optional[Dict[str, str]]:
+        """
+        Resolve subitem column mappings for a destination
+
+        Args:
+            destination: Destination configuration
+
+        Returns:
+            Dictionary mapping source subitem column IDs to destination subitem
+            column IDs ({} copies subitem names only), or None if the
+            destination doesn't copy subitems
+        """
+        if not destination.copy_subitems:
+            return None
+        return {
+            mapping["source"]: mapping["dest"]
+            for mapping in destination.subitem_mappings
+            if mapping.get("source") and mapping.get("dest")
+        }
+
     def resolve_column_names(self, destination: Destination) -> Dict[str, str]:
         """
         Resolve column display names for a destination
@@ -195,13 +481,19 @@ class ConfigLoader:
             destination: Destination configuration
 
         Returns:
-            Dictionary mapping column IDs to display names
+            Dictionary mapping column IDs to display names (precompiled and shared - do not modify)
         """
+        if destination.resolved_names is None:
+            destination.resolved_names = self._build_column_names(destination)
+        return destination.resolved_names
+
+    def _build_column_names(self, destination: Destination) -> Dict[str, str]:
+        """Collect display names from the template and additional mappings"""
         column_names = {}
 
         # Get names from template
-        if destination.template and destination.template in self.templates:
-            template = self.templates[destination.template]
+        template = self._get_template(destination.template)
+        if template:
             for mapping in template.column_mappings:
                 # Add both source and destination names
                 column_names[mapping.source] = mapping.name
@@ -214,6 +506,13 @@ class ConfigLoader:
                 column_names[mapping["source"]] = name
                 column_names[mapping["dest"]] = name
 
+        # Add names from subitem mappings
+        for mapping in destination.subitem_mappings:
+            if mapping.get("source") and mapping.get("dest"):
+                name = mapping.get("name", mapping["source"])
+                column_names[mapping["source"]] = name
+                column_names[mapping["dest"]] = name
+
         return column_names
 
     def list_workflows(self) -> List[Dict]:
@@ -233,3 +532,49 @@ class ConfigLoader:
             }
             for w in self.workflows
         ]
+
+
+def split_config(config_path: str, directory: str):
+    """
+    Split a workflows.json file into a sharded workflows.d/ directory
+
+    Writes one file per workflow, one file per template under templates/,
+    and a manifest.json mapping IDs to files.
+
+    Args:
+        config_path: Path to the workflows.json file to split
+        directory: Directory to create (e.g. config/workflows.d)
+    """
+    with open(config_path, 'r') as f:
+        data = json.load(f)
+
+    os.makedirs(os.path.join(directory, "templates"), exist_ok=True)
+    manifest = {"workflows": {}, "templates": {}}
+
+    for template_id, template_data in data.get("templates", {}).items():
+        relative_path = os.path.join("templates", f"{template_id}.json")
+        with open(os.path.join(directory, relative_path), 'w') as f:
+            json.dump(template_data, f, indent=2)
+        manifest["templates"][template_id] = relative_path
+
+    for workflow_data in data.get("workflows", []):
+        relative_path = f"{workflow_data['id']}.json"
+        with open(os.path.join(directory, relative_path), 'w') as f:
+            json.dump(workflow_data, f, indent=2)
+        manifest["workflows"][workflow_data["id"]] = relative_path
+
+    with open(os.path.join(directory, "manifest.json"), 'w') as f:
+        json.dump(manifest, f, indent=2)
+
+    print(f"✅ Wrote {len(manifest['workflows'])} workflow(s) and "
+          f"{len(manifest['templates'])} template(s) to {directory}")
+
+
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) != 4 or sys.argv[1] != "split":
+        print("Usage: python config_loader.py split config/workflows.json config/workflows.d")
+        sys.exit(1)
+
+    split_config(sys.argv[2], sys.argv[3])
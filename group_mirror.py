@@ -0,0 +1,128 @@
+"""
+Group Mirroring for Monday.com Item Duplicator
+Maps source groups to destination groups by title, creating the missing ones
+"""
+
+import threading
+from typing import Dict, List, Tuple
+
+
+def _normalize(title: str) -> str:
+    """Normalize a group title for matching across boards"""
+    return " ".join((title or "").split()).casefold()
+
+
+class GroupMirror:
+    """Resolves source group IDs to same-titled groups on destination boards"""
+
+    def __init__(self, duplicator):
+        """
+        Initialize group mirror
+
+        Args:
+            duplicator: MondayItemDuplicator used to read and create groups
+        """
+        self.duplicator = duplicator
+
+        # Board ID -> [(group ID, title)] in board order
+        self.groups: Dict[int, List[Tuple[str, str]]] = {}
+        # (source board ID, destination board ID) -> {source group ID: destination group ID}
+        self.maps: Dict[Tuple[int, int], Dict[str, str]] = {}
+        self._lock = threading.Lock()
+
+    def prefetch(self, board_ids: List[int]):
+        """Fetch the group lists of several boards in one request"""
+        query = """
+        query ($boardIds: [ID!]) {
+            boards(ids: $boardIds) {
+                id
+                groups {
+                    id
+                    title
+                }
+            }
+        }
+        """
+
+        missing = [board_id for board_id in dict.fromkeys(map(int, board_ids)) if board_id not in self.groups]
+        if not missing:
+            return
+
+        data = self.duplicator.execute_query(query, {"boardIds": [str(board_id) for board_id in missing]})
+        for board in data["boards"]:
+            self.groups[int(board["id"])] = [(group["id"], group["title"]) for group in board["groups"]]
+
+        for board_id in missing:
+            if board_id not in self.groups:
+                raise ValueError(f"Board {board_id} not found or not accessible")
+
+    def group_map(self, source_board_id: int, dest_board_id: int) -> Dict[str, str]:
+        """
+        Map every source group to the destination group with the same title
+
+        Both group lists are read in one request and groups missing on the
+        destination are created in one aliased mutation. The map is cached
+        for the run, so routing items afterwards needs no requests.
+
+        Args:
+            source_board_id: Source board ID
+            dest_board_id: Destination board ID
+
+        Returns:
+            Dictionary mapping source group IDs to destination group IDs
+            (cached and shared - do not modify)
+        """
+        key = (int(source_board_id), int(dest_board_id))
+
+        with self._lock:
+            if key in self.maps:
+                return self.maps[key]
+
+            self.prefetch(list(key))
+
+            # Keep the first destination group for a title
+            dest_groups = {}
+            for group_id, title in self.groups[key[1]]:
+                dest_groups.setdefault(_normalize(title), group_id)
+
+            # One new group per normalized title, named after its first source group
+            missing = {}
+            for _, title in self.groups[key[0]]:
+                normalized = _normalize(title)
+                if normalized not in dest_groups:
+                    missing.setdefault(normalized, title)
+
+            if missing:
+                titles = list(missing.values())
+                for title, group_id in zip(titles, self.create_groups(key[1], titles)):
+                    dest_groups[_normalize(title)] = group_id
+                    self.groups[key[1]].append((group_id, title))
+
+            group_map = {
+                group_id: dest_groups[_normalize(title)]
+                for group_id, title in self.groups[key[0]]
+            }
+            self.maps[key] = group_map
+            return group_map
+
+    def create_groups(self, board_id: int, titles: List[str]) -> List[str]:
+        """
+        Create several groups on a board in one aliased mutation
+
+        Returns:
+            IDs of the new groups, in the order of titles
+        """
+        params = ["$boardId: ID!"]
+        fields = []
+        variables = {"boardId": str(board_id)}
+
+        for index, title in enumerate(titles):
+            params.append(f"$name{index}: String!")
+            variables[f"name{index}"] = title
+            fields.append(f"group{index}: create_group(board_id: $boardId, group_name: $name{index}) {{ id }}")
+
+        query = "mutation (%s) {\n    %s\n}" % (", ".join(params), "\n    ".join(fields))
+        data = self.duplicator.execute_query(query, variables)
+
+        print(f"📁 Created {len(titles)} group(s) on board {board_id}: {', '.join(titles)}")
+        return [data[f"group{index}"]["id"] for index in range(len(titles))]
@@ -0,0 +1,176 @@
+"""
+Identity Matching for Monday.com Item Duplicator
+Matches destination items by the source item ID stored in a designated column
+"""
+
+import threading
+from typing import Dict, Iterable, List, Optional
+
+from item_model import ColumnValue, Item
+
+
+class IdentityMatcher:
+    """
+    Resolves source items to destination items through an identity column
+
+    On boards with an identity column, every written item carries its source
+    item ID in that column, and existing items are found by that ID instead
+    of by name. Renamed source items then update their destination item,
+    and items sharing a name no longer collide. A batch is resolved with one
+    any_of lookup per 100 IDs, or from one scan of the board (see build_index).
+
+    Source items not found by ID fall back to a destination item with the
+    same name and an empty identity column, so boards synced by name before
+    the column was set up are adopted instead of duplicated.
+    """
+
+    def __init__(self, duplicator):
+        """
+        Initialize identity matcher
+
+        Args:
+            duplicator: MondayItemDuplicator used for lookups
+        """
+        self.duplicator = duplicator
+
+        # Destination board ID -> column holding source item IDs
+        self.columns: Dict[int, str] = {}
+        # Destination board ID -> {source item ID: item} from a full board scan
+        self.indexes: Dict[int, Dict[str, Item]] = {}
+        # Destination board ID -> {name: items without an identity} from the same scan
+        self.unclaimed: Dict[int, Dict[str, List[Item]]] = {}
+        # Destination board ID -> {source item ID: item or None if not on the board}
+        self.lookups: Dict[int, Dict[str, Optional[Item]]] = {}
+        self._lock = threading.Lock()
+
+    def set_column(self, board_id: int, column_id: str):
+        """Match items on a board through an identity column"""
+        self.columns[board_id] = column_id
+
+    def column(self, board_id: int) -> Optional[str]:
+        """Identity column of a board (None if it is matched by name)"""
+        return self.columns.get(board_id)
+
+    def identity_of(self, board_id: int, item: Item) -> Optional[str]:
+        """Source item ID stored in a destination item's identity column (None if empty)"""
+        column = item.columns.get(self.columns[board_id])
+        if column is None or not column.text:
+            return None
+        return column.text.strip() or None
+
+    def build_index(self, board_id: int, items: Iterable[Item]) -> Dict[str, Item]:
+        """
+        Index a board by identity from a scan of its items
+
+        Args:
+            board_id: Destination board ID
+            items: Every item of the board, with the identity column fetched
+
+        Returns:
+            Dictionary mapping source item IDs to destination items
+        """
+        index: Dict[str, Item] = {}
+        unclaimed: Dict[str, List[Item]] = {}
+        for item in items:
+            identity = self.identity_of(board_id, item)
+            if identity:
+                # Keep the first item for an ID, like name matching keeps the first for a name
+                index.setdefault(identity, item)
+            else:
+                unclaimed.setdefault(item.name, []).append(item)
+
+        with self._lock:
+            self.indexes[board_id] = index
+            self.unclaimed[board_id] = unclaimed
+        return index
+
+    def lookup(self, board_id: int, source_items: List[Item]):
+        """
+        Resolve the destination items of a batch of source items
+
+        Results are cached so that find() answers from memory for these
+        items. Skipped when the board already has an index.
+        """
+        if board_id in self.indexes:
+            return
+
+        lookups = self.lookups.setdefault(board_id, {})
+        names = {item.id: item.name for item in source_items if item.id not in lookups}
+        if not names:
+            return
+
+        column_id = self.columns[board_id]
+        found = self.duplicator.get_items_by_column_values(board_id, column_id, list(names), column_ids=[column_id])
+        resolved = {source_id: found.get(source_id) for source_id in names}
+
+        # IDs not on the board may still have an item synced by name before the column existed
+        missing = [source_id for source_id, item in resolved.items() if item is None]
+        if missing:
+            by_name = self.duplicator.get_items_by_names(
+                board_id, [names[source_id] for source_id in missing], column_ids=[column_id]
+            )
+            for source_id in missing:
+                item = by_name.get(names[source_id])
+                if item is not None and self._claim(board_id, item, source_id):
+                    resolved[source_id] = item
+
+        with self._lock:
+            for source_id, item in resolved.items():
+                lookups.setdefault(source_id, item)
+
+    def find(self, board_id: int, source_item: Item) -> Optional[Item]:
+        """Find the destination item of a source item, from the index, cached lookups or one request"""
+        index = self.indexes.get(board_id)
+        if index is not None:
+            item = index.get(source_item.id)
+            if item is not None:
+                return item
+
+            # Adopt an item synced by name before the column existed
+            with self._lock:
+                candidates = self.unclaimed[board_id].get(source_item.name)
+                item = candidates.pop(0) if candidates else None
+                if item is not None:
+                    index[source_item.id] = item
+            return item
+
+        lookups = self.lookups.get(board_id)
+        if lookups is None or source_item.id not in lookups:
+            self.lookup(board_id, [source_item])
+            lookups = self.lookups[board_id]
+        return lookups.get(source_item.id)
+
+    def remember(self, board_id: int, source_item_id: str, item: Item):
+        """Add a newly created item to the board's index and cached lookups"""
+        with self._lock:
+            index = self.indexes.get(board_id)
+            if index is not None:
+                index.setdefault(source_item_id, item)
+
+            lookups = self.lookups.get(board_id)
+            if lookups is not None and lookups.get(source_item_id) is None:
+                lookups[source_item_id] = item
+
+    def stamp(self, board_id: int, source_item: Item, existing_item: Optional[Item], mapped_values: Dict):
+        """
+        Add the identity column to a payload (no-op on boards matched by name)
+
+        A matched item whose name differs from its source item is renamed
+        in the same write.
+        """
+        column_id = self.columns.get(board_id)
+        if not column_id:
+            return
+
+        mapped_values[column_id] = str(source_item.id)
+        if existing_item is not None and existing_item.name != source_item.name:
+            mapped_values["name"] = source_item.name
+
+    def _claim(self, board_id: int, item: Item, source_id: str) -> bool:
+        """Adopt a same-named item with an empty identity column (each item only once)"""
+        with self._lock:
+            if self.identity_of(board_id, item):
+                return False
+            # Mark it as taken so a second same-named source item can't adopt it too
+            item.columns[self.columns[board_id]] = ColumnValue(self.columns[board_id], "text", source_id, None)
+            return True
@@ -0,0 +1,201 @@
+"""
+Intent Log for Monday.com Item Duplicator
+Write-ahead log of item creates, so ambiguous failures can be retried without duplicates
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+
+@dataclass
+class Intent:
+    """A create that was (or is about to be) sent to a board"""
+    id: int
+    board_id: int
+    group_id: str
+    item_name: str
+    source_item_id: Optional[str] = None
+    identity_column: Optional[str] = None
+    identity_value: Optional[str] = None
+
+
+class IntentLog:
+    """SQLite-backed log of pending creates"""
+
+    PENDING = "pending"
+    COMMITTED = "committed"
+    ABANDONED = "abandoned"
+
+    def __init__(self, path: str = "data/intents.sqlite3"):
+        """
+        Open (or create) the intent log database
+
+        Args:
+            path: Path to the SQLite database file
+        """
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS intents (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                board_id INTEGER NOT NULL,
+                group_id TEXT NOT NULL,
+                item_name TEXT NOT NULL,
+                source_item_id TEXT,
+                identity_column TEXT,
+                identity_value TEXT,
+                status TEXT NOT NULL,
+                dest_item_id TEXT,
+                last_error TEXT,
+                created_at REAL NOT NULL,
+                updated_at REAL NOT NULL
+            )
+        """)
+        self._conn.execute("""
+            CREATE INDEX IF NOT EXISTS intents_pending
+            ON intents (status, board_id)
+        """)
+
+    def record_many(self, intents: List[Intent]) -> List[Intent]:
+        """
+        Durably record creates before they are sent (one transaction)
+
+        Args:
+            intents: Intents to record (their id is ignored)
+
+        Returns:
+            The intents with their assigned IDs
+        """
+        now = time.time()
+        recorded = []
+
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                for intent in intents:
+                    cursor = self._conn.execute(
+                        "INSERT INTO intents (board_id, group_id, item_name, source_item_id, identity_column, "
+                        "identity_value, status, created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                        (intent.board_id, intent.group_id, intent.item_name, intent.source_item_id,
+                         intent.identity_column, intent.identity_value, self.PENDING, now, now)
+                    )
+                    recorded.append(Intent(
+                        id=cursor.lastrowid,
+                        board_id=intent.board_id,
+                        group_id=intent.group_id,
+                        item_name=intent.item_name,
+                        source_item_id=intent.source_item_id,
+                        identity_column=intent.identity_column,
+                        identity_value=intent.identity_value
+                    ))
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+        return recorded
+
+    def record(self, intent: Intent) -> Intent:
+        """Durably record one create before it is sent"""
+        return self.record_many([intent])[0]
+
+    def commit(self, intent: Intent, dest_item_id):
+        """Mark a create as applied"""
+        self._finish(intent, self.COMMITTED, dest_item_id=str(dest_item_id))
+
+    def abandon(self, intent: Intent, error: str = None):
+        """Mark a create as definitely not applied"""
+        self._finish(intent, self.ABANDONED, last_error=error)
+
+    def _finish(self, intent: Intent, status: str, dest_item_id: str = None, last_error: str = None):
+        """Move an intent out of the pending state"""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE intents SET status = ?, dest_item_id = ?, last_error = ?, updated_at = ? WHERE id = ?",
+                (status, dest_item_id, last_error, time.time(), intent.id)
+            )
+
+    def pending(self, board_id: int = None) -> List[Intent]:
+        """Get creates whose outcome is unknown (optionally for one board)"""
+        query = ("SELECT id, board_id, group_id, item_name, source_item_id, identity_column, identity_value "
+                 "FROM intents WHERE status = ?")
+        params = [self.PENDING]
+        if board_id is not None:
+            query += " AND board_id = ?"
+            params.append(board_id)
+
+        with self._lock:
+            rows = self._conn.execute(query + " ORDER BY id", params).fetchall()
+
+        return [Intent(*row) for row in rows]
+
+    def reconcile(self, duplicator, intents: List[Intent]) -> Dict[int, Optional[str]]:
+        """
+        Find out which pending creates reached their board
+
+        Intents are matched by identity column value when they have one and by
+        item name otherwise, with one batched read per board and column.
+        Found intents are committed; the rest stay pending and are safe to resend.
+
+        Args:
+            duplicator: MondayItemDuplicator used for the lookups
+            intents: Pending intents to check
+
+        Returns:
+            Dictionary mapping intent ID to the created item ID (None if not found)
+        """
+        groups: Dict[tuple, List[Intent]] = {}
+        for intent in intents:
+            column_id = intent.identity_column if intent.identity_value else "name"
+            groups.setdefault((intent.board_id, column_id), []).append(intent)
+
+        outcome = {}
+        for (board_id, column_id), members in groups.items():
+            values = [intent.identity_value if column_id != "name" else intent.item_name for intent in members]
+            found = duplicator.get_items_by_column_values(board_id, column_id, values, column_ids=[])
+
+            for intent, value in zip(members, values):
+                item = found.get(value)
+                outcome[intent.id] = item.id if item else None
+                if item:
+                    self.commit(intent, item.id)
+
+        return outcome
+
+    def recover(self, duplicator) -> Dict[str, int]:
+        """
+        Settle creates left pending by an earlier run that stopped mid-request
+
+        Creates found on their board are committed; the rest are abandoned,
+        since the next sync of that item will create it normally.
+
+        Returns:
+            Dict with "committed" and "abandoned" counts
+        """
+        stale = self.pending()
+        if not stale:
+            return {"committed": 0, "abandoned": 0}
+
+        outcome = self.reconcile(duplicator, stale)
+        abandoned = 0
+        for intent in stale:
+            if outcome.get(intent.id) is None:
+                self.abandon(intent, "not found during recovery")
+                abandoned += 1
+
+        return {"committed": len(stale) - abandoned, "abandoned": abandoned}
+
+    def close(self):
+        """Close the database connection"""
+        with self._lock:
+            self._conn.close()
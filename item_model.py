@@ -0,0 +1,138 @@
+"""
+Item Model for Monday.com Item Duplicator
+Compact slotted representation of board items for large batches
+"""
+
+import sys
+from typing import Dict, Iterable, List, Optional
+
+# Low-cardinality column types whose text/value repeat across items
+_INTERNED_VALUE_TYPES = {"status", "color", "dropdown", "checkbox"}
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    """Intern a string (None passes through)"""
+    return sys.intern(value) if value is not None else None
+
+
+class ColumnValue:
+    """One column value of an item"""
+    __slots__ = ("id", "type", "text", "value")
+
+    def __init__(self, id: str, type: str, text: Optional[str], value: Optional[str]):
+        self.id = id
+        self.type = type
+        self.text = text
+        self.value = value
+
+    @classmethod
+    def from_api(cls, data: Dict) -> "ColumnValue":
+        """Build a column value from a `column_values { id text value type }` entry"""
+        column_type = sys.intern(data["type"])
+        text = data.get("text")
+        value = data.get("value")
+
+        if column_type in _INTERNED_VALUE_TYPES:
+            text = _intern(text)
+            value = _intern(value)
+
+        return cls(sys.intern(data["id"]), column_type, text, value)
+
+    def is_empty(self) -> bool:
+        """Check whether the column has no value"""
+        return not self.value or self.value == "null"
+
+    def __repr__(self):
+        return f"ColumnValue({self.id!r}, {self.type!r}, {self.text!r})"
+
+
+class Update:
+    """One update (comment) posted on an item"""
+    __slots__ = ("id", "body", "created_at", "creator")
+
+    def __init__(self, id: str, body: str, created_at: Optional[str] = None, creator: Optional[str] = None):
+        self.id = id
+        self.body = body
+        self.created_at = created_at
+        self.creator = creator
+
+    @classmethod
+    def from_api(cls, data: Dict) -> "Update":
+        """Build an update from an `updates { id body created_at creator { name } }` entry"""
+        creator = data.get("creator") or {}
+        return cls(data["id"], data.get("body") or "", data.get("created_at"), _intern(creator.get("name")))
+
+    def __repr__(self):
+        return f"Update({self.id!r}, creator={self.creator!r}, created_at={self.created_at!r})"
+
+
+class Item:
+    """A board item holding only the columns the run needs"""
+    __slots__ = ("id", "name", "group_id", "group_title", "columns", "subitems", "updates")
+
+    def __init__(
+        self,
+        id: str,
+        name: str,
+        group_id: Optional[str] = None,
+        group_title: Optional[str] = None,
+        columns: Optional[Dict[str, ColumnValue]] = None,
+        subitems: Optional[List["Item"]] = None,
+        updates: Optional[List[Update]] = None
+    ):
+        self.id = id
+        self.name = name
+        self.group_id = group_id
+        self.group_title = group_title
+        self.columns = columns if columns is not None else {}
+        # None when subitems / updates were not fetched
+        self.subitems = subitems
+        self.updates = updates
+
+    @classmethod
+    def from_api(
+        cls,
+        data: Dict,
+        column_ids: Optional[Iterable[str]] = None,
+        subitem_column_ids: Optional[Iterable[str]] = None
+    ) -> "Item":
+        """
+        Build an item from an API item dict
+
+        Args:
+            data: Item dict with id, name, and optionally group, column_values, subitems and updates
+            column_ids: Columns to keep (None keeps all)
+            subitem_column_ids: Subitem columns to keep (None keeps all)
+
+        Returns:
+            Item object
+        """
+        keep = set(column_ids) if column_ids is not None else None
+        columns = {}
+
+        for col in data.get("column_values") or ():
+            if keep is None or col["id"] in keep:
+                column = ColumnValue.from_api(col)
+                columns[column.id] = column
+
+        subitems = None
+        if data.get("subitems") is not None:
+            subitems = [cls.from_api(subitem, subitem_column_ids) for subitem in data["subitems"]]
+
+        updates = None
+        if data.get("updates") is not None:
+            updates = [Update.from_api(update) for update in data["updates"]]
+
+        group = data.get("group") or {}
+        return cls(
+            id=data["id"],
+            name=data["name"],
+            group_id=_intern(group.get("id")),
+            group_title=_intern(group.get("title")),
+            columns=columns,
+            subitems=subitems,
+            updates=updates
+        )
+
+    def __repr__(self):
+        return f"Item({self.id!r}, {self.name!r}, group={self.group_id!r}, columns={len(self.columns)})"
@@ -0,0 +1,231 @@
+"""
+Durable Job Queue for Monday.com Item Duplicator
+SQLite-backed queue of (workflow, destination, item) sync jobs
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+
+@dataclass
+class Job:
+    """Represents one queued sync of a source item to one destination"""
+    id: int
+    workflow_id: str
+    dest_index: int
+    item_id: str
+    attempts: int = 0
+    last_error: Optional[str] = None
+
+
+class JobQueue:
+    """SQLite-backed job queue that survives restarts and crashes"""
+
+    PENDING = "pending"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+
+    def __init__(self, path: str = "data/jobs.sqlite3"):
+        """
+        Open (or create) the job queue database
+
+        Args:
+            path: Path to the SQLite database file
+        """
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS jobs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                workflow_id TEXT NOT NULL,
+                dest_index INTEGER NOT NULL,
+                item_id TEXT NOT NULL,
+                status TEXT NOT NULL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                available_at REAL NOT NULL,
+                last_error TEXT,
+                created_at REAL NOT NULL,
+                updated_at REAL NOT NULL
+            )
+        """)
+        self._conn.execute("""
+            CREATE INDEX IF NOT EXISTS jobs_claim
+            ON jobs (status, available_at)
+        """)
+
+    def enqueue(self, workflow_id: str, dest_index: int, item_id) -> bool:
+        """
+        Add a job unless an identical one is already waiting or running
+
+        Returns:
+            True if a new job was added
+        """
+        return self.enqueue_many([(workflow_id, dest_index, item_id)]) == 1
+
+    def enqueue_many(self, jobs: List[tuple]) -> int:
+        """
+        Add several (workflow_id, dest_index, item_id) jobs in one transaction
+
+        Jobs identical to one that is already pending or running are skipped,
+        so bursts of the same trigger collapse into one sync.
+
+        Returns:
+            Number of jobs added
+        """
+        now = time.time()
+        added = 0
+
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                for workflow_id, dest_index, item_id in jobs:
+                    exists = self._conn.execute(
+                        "SELECT 1 FROM jobs WHERE workflow_id = ? AND dest_index = ? AND item_id = ? "
+                        "AND status IN (?, ?)",
+                        (workflow_id, dest_index, str(item_id), self.PENDING, self.RUNNING)
+                    ).fetchone()
+                    if exists:
+                        continue
+
+                    self._conn.execute(
+                        "INSERT INTO jobs (workflow_id, dest_index, item_id, status, attempts, "
+                        "available_at, created_at, updated_at) VALUES (?, ?, ?, ?, 0, ?, ?, ?)",
+                        (workflow_id, dest_index, str(item_id), self.PENDING, now, now, now)
+                    )
+                    added += 1
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+        return added
+
+    def claim(self) -> Optional[Job]:
+        """
+        Atomically take the oldest job that is ready to run
+
+        Returns:
+            Job object or None if nothing is ready
+        """
+        now = time.time()
+
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute(
+                    "SELECT id, workflow_id, dest_index, item_id, attempts, last_error FROM jobs "
+                    "WHERE status = ? AND available_at <= ? ORDER BY available_at, id LIMIT 1",
+                    (self.PENDING, now)
+                ).fetchone()
+
+                if row:
+                    self._conn.execute(
+                        "UPDATE jobs SET status = ?, updated_at = ? WHERE id = ?",
+                        (self.RUNNING, now, row[0])
+                    )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+        if not row:
+            return None
+
+        return Job(
+            id=row[0],
+            workflow_id=row[1],
+            dest_index=row[2],
+            item_id=row[3],
+            attempts=row[4],
+            last_error=row[5]
+        )
+
+    def complete(self, job: Job):
+        """Mark a job as done"""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET status = ?, updated_at = ? WHERE id = ?",
+                (self.DONE, time.time(), job.id)
+            )
+
+    def fail(self, job: Job, error: str, max_attempts: int = 5, backoff_seconds: float = 30.0):
+        """
+        Record a failed attempt, scheduling a retry with exponential backoff
+
+        Args:
+            job: The job that failed
+            error: Error message to keep with the job
+            max_attempts: Attempts after which the job is marked failed for good
+            backoff_seconds: Delay before the first retry (doubles every attempt)
+        """
+        attempts = job.attempts + 1
+        now = time.time()
+
+        if attempts >= max_attempts:
+            status = self.FAILED
+            available_at = now
+        else:
+            status = self.PENDING
+            available_at = now + backoff_seconds * (2 ** (attempts - 1))
+
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET status = ?, attempts = ?, available_at = ?, last_error = ?, "
+                "updated_at = ? WHERE id = ?",
+                (status, attempts, available_at, error[:2000], now, job.id)
+            )
+
+    def release(self, job: Job, delay: float = 0.0, error: Optional[str] = None):
+        """
+        Return a claimed job to the queue without counting an attempt
+
+        Used for jobs that never reached the API (e.g. while the circuit
+        breaker was open); the job becomes ready again after the delay.
+        """
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET status = ?, available_at = ?, last_error = COALESCE(?, last_error), "
+                "updated_at = ? WHERE id = ?",
+                (self.PENDING, now + delay, error[:2000] if error else None, now, job.id)
+            )
+
+    def recover(self) -> int:
+        """
+        Return jobs left running by a crashed or killed daemon to the queue
+
+        Returns:
+            Number of jobs recovered
+        """
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE jobs SET status = ?, updated_at = ? WHERE status = ?",
+                (self.PENDING, time.time(), self.RUNNING)
+            )
+            return cursor.rowcount
+
+    def counts(self) -> Dict[str, int]:
+        """Get the number of jobs in each status"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT status, COUNT(*) FROM jobs GROUP BY status"
+            ).fetchall()
+        counts = {self.PENDING: 0, self.RUNNING: 0, self.DONE: 0, self.FAILED: 0}
+        counts.update(dict(rows))
+        return counts
+
+    def close(self):
+        """Close the database connection"""
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,54 @@
+"""
+JSON Codec for Monday.com Item Duplicator
+One entry point for JSON on the hot path, backed by orjson when it is installed
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Name of the backend in use ("orjson" or "json")
+BACKEND = "orjson" if orjson is not None else "json"
+
+# Raised by loads() for invalid JSON with either backend (orjson's error subclasses it)
+JSONDecodeError = json.JSONDecodeError
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Decode a JSON document (str or UTF-8 bytes)"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, sort_keys: bool = False) -> str:
+    """
+    Encode an object as compact JSON
+
+    Both backends write no whitespace between tokens and keep non-ASCII
+    characters as they are (UTF-8). Objects orjson refuses (non-string dict
+    keys, integers beyond 64 bits) are encoded by the json module, so keys
+    are coerced to strings either way. Two differences remain:
+
+    - Floats in exponent notation: json writes 1e+20 and 1e-07, orjson
+      1e20 and 1e-7 (the same numbers when decoded)
+    - NaN and Infinity: json raises ValueError (they are not valid JSON),
+      orjson writes null
+
+    Request keys built with sort_keys=True therefore only match within
+    one process's backend, which is how SingleFlight uses them.
+
+    Args:
+        obj: Object to encode
+        sort_keys: Sort dictionary keys (for cache keys)
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS if sort_keys else 0).decode("utf-8")
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False, sort_keys=sort_keys, allow_nan=False)
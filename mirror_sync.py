@@ -0,0 +1,256 @@
+"""
+Mirror Mode for Monday.com Item Duplicator
+Reconciles a destination group with its source group in one set-difference pass
+"""
+
+import math
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple, Union
+
+import json_codec
+from batch_writer import WriteOp
+from board_schema import READ_ONLY_TYPES
+from item_model import ColumnValue, Item
+
+# Column types cleared with an empty string; the others are cleared with {}
+TEXT_CLEAR_TYPES = {"text", "numbers"}
+
+
+@dataclass
+class MirrorPlan:
+    """What mirroring a source group onto a destination group will write"""
+    create: List[Item] = field(default_factory=list)  # Source items with no destination item
+    update: List[Tuple[Item, Item]] = field(default_factory=list)  # (source, destination) pairs that differ
+    unchanged: List[Tuple[Item, Item]] = field(default_factory=list)  # (source, destination) pairs already in sync
+    archive: List[Item] = field(default_factory=list)  # Destination items with no source item
+    prepared: Dict[str, Union[Dict, Exception]] = field(default_factory=dict)  # Source item ID -> prepared payload of an update
+
+
+def match_items(source_items: List[Item], dest_items: List[Item], identity_column: Optional[str] = None) -> MirrorPlan:
+    """
+    Pair source and destination items in one pass
+
+    Names are matched as multisets: the n-th source item with a name pairs
+    with the n-th destination item with that name, so duplicates on either
+    side are created or archived instead of being matched twice. With an
+    identity_column, items are paired by the source item ID stored in that
+    column first, and only destination items with an empty identity column
+    are left for name matching.
+
+    Returns:
+        MirrorPlan with create and archive filled in, and every matched pair in update
+    """
+    plan = MirrorPlan()
+    matched = set()
+
+    unmatched = source_items
+    candidates = dest_items
+    if identity_column:
+        by_identity: Dict[str, Item] = {}
+        candidates = []
+        for item in dest_items:
+            column = item.columns.get(identity_column)
+            identity = column.text.strip() if column is not None and column.text else ""
+            if identity:
+                # A second item with the same source ID is a duplicate and gets archived
+                by_identity.setdefault(identity, item)
+            else:
+                candidates.append(item)
+
+        unmatched = []
+        for item in source_items:
+            dest_item = by_identity.get(str(item.id))
+            if dest_item is not None:
+                matched.add(dest_item.id)
+                plan.update.append((item, dest_item))
+            else:
+                unmatched.append(item)
+
+    by_name: Dict[str, List[Item]] = {}
+    for item in candidates:
+        by_name.setdefault(item.name, []).append(item)
+
+    # Reversed so pop() takes each name's destination items in board order
+    for items in by_name.values():
+        items.reverse()
+
+    for item in unmatched:
+        named = by_name.get(item.name)
+        if named:
+            dest_item = named.pop()
+            matched.add(dest_item.id)
+            plan.update.append((item, dest_item))
+        else:
+            plan.create.append(item)
+
+    plan.archive = [item for item in dest_items if item.id not in matched]
+    return plan
+
+
+def values_match(column_values: Dict, dest_item: Item) -> bool:
+    """Check whether writing a payload to an item would leave all of its columns as they are"""
+    for col_id, value in column_values.items():
+        current = dest_item.columns.get(col_id)
+        if current is None or not _same_value(value, current):
+            return False
+    return True
+
+
+def cleared_values(source_item: Item, dest_item: Item, column_mapping: Dict[str, str], column_values: Dict) -> Dict:
+    """
+    Clears for mapped columns that are empty in the source but still set on the destination
+
+    Payloads leave empty source columns out, so without these a value
+    cleared in the source would stay on the destination for good. Source
+    columns that were not read are left alone.
+    """
+    clears = {}
+    for source_col_id, dest_col_id in column_mapping.items():
+        source_column = source_item.columns.get(source_col_id)
+        dest_column = dest_item.columns.get(dest_col_id)
+        if source_column is None or not source_column.is_empty() or dest_col_id in column_values:
+            continue
+        if dest_column is None or dest_column.is_empty() or dest_column.type in READ_ONLY_TYPES:
+            continue
+        clears[dest_col_id] = "" if dest_column.type in TEXT_CLEAR_TYPES else {}
+    return clears
+
+
+def _same_value(value, current: ColumnValue) -> bool:
+    """Compare one payload value with a column's current value (unsure means different)"""
+    if isinstance(value, str):
+        # Text-like columns are written as their text
+        return value == (current.text or "")
+    if value == {}:
+        # A clear
+        return current.is_empty()
+
+    try:
+        decoded = json_codec.loads(current.value) if current.value else {}
+    except json_codec.JSONDecodeError:
+        return False
+
+    if not isinstance(value, dict) or not isinstance(decoded, dict):
+        return value == decoded
+
+    try:
+        if "label" in value:
+            return value["label"] == current.text
+        if "ids" in value:
+            return sorted(map(int, value["ids"])) == sorted(map(int, decoded.get("ids", [])))
+        if "labels" in value:
+            return sorted(value["labels"]) == sorted(
+                label.strip() for label in (current.text or "").split(",") if label.strip()
+            )
+        if "item_ids" in value:
+            return sorted(map(int, value["item_ids"])) == sorted(
+                int(linked["linkedPulseId"]) for linked in decoded.get("linkedPulseIds", [])
+            )
+    except (KeyError, TypeError, ValueError):
+        return False
+
+    # Other JSON values match if every key written already has that value
+    return all(decoded.get(key) == item for key, item in value.items())
+
+
+def archive_limit(setting: str, dest_count: int) -> int:
+    """
+    Maximum number of items a mirror run may archive
+
+    Args:
+        setting: Item count ("50") or share of the destination items ("10%")
+        dest_count: Items currently on the destination
+
+    Raises:
+        ValueError: If the setting is not a count or percentage
+    """
+    setting = str(setting).strip()
+    if setting.endswith("%"):
+        return math.ceil(float(setting[:-1]) / 100 * dest_count)
+    return int(setting)
+
+
+class MirrorSync:
+    """Computes and applies the create, update and archive sets of a mirror run"""
+
+    def __init__(self, duplicator):
+        """
+        Initialize mirror sync
+
+        Args:
+            duplicator: MondayItemDuplicator used to map payloads and write archives
+        """
+        self.duplicator = duplicator
+
+    def plan(
+        self,
+        source_items: List[Item],
+        dest_items: List[Item],
+        dest_board_id: int,
+        column_mapping: Dict[str, str],
+        column_names: Dict[str, str],
+        source_board_id: int = None,
+        unknown_labels: str = "skip"
+    ) -> MirrorPlan:
+        """
+        Work out what mirroring will write, without writing anything
+
+        Matched items are mapped as a batch (see prepare_items) and compared
+        with the destination item's current values, so items already in sync
+        cost no request. Columns emptied in the source are cleared on the
+        destination (see cleared_values). dest_items must carry the mapped
+        destination columns (and the identity column, on boards matched by
+        identity).
+
+        Returns:
+            MirrorPlan (pairs that fail to map are kept in update so the write
+            reports them), with the payload of every update in prepared
+        """
+        plan = match_items(source_items, dest_items, self.duplicator.identities.column(dest_board_id))
+        matched, plan.update = plan.update, []
+        if not matched:
+            return plan
+
+        prepared = self.duplicator.prepare_items(
+            [source_item for source_item, _ in matched],
+            dest_board_id,
+            column_mapping,
+            column_names,
+            source_board_id=source_board_id,
+            unknown_labels=unknown_labels,
+            existing_items=[dest_item for _, dest_item in matched]
+        )
+
+        for (source_item, dest_item), prepared_item in zip(matched, prepared):
+            if not isinstance(prepared_item, Exception):
+                clears = cleared_values(source_item, dest_item, column_mapping, prepared_item["mapped_values"])
+                prepared_item["mapped_values"].update(clears)
+                for dest_col_id in clears:
+                    prepared_item["mapped_summary"][dest_col_id] = f"✅ {column_names.get(dest_col_id, dest_col_id)}: cleared"
+
+            if isinstance(prepared_item, Exception) or not values_match(prepared_item["mapped_values"], dest_item):
+                plan.update.append((source_item, dest_item))
+                plan.prepared[source_item.id] = prepared_item
+            else:
+                plan.unchanged.append((source_item, dest_item))
+
+        return plan
+
+    def archive(self, board_id: int, items: List[Item]) -> List[Union[Dict, Exception]]:
+        """
+        Archive destination items with batched archive_item mutations
+
+        Returns:
+            One result per item, in order: the {"id", "name"} of the archived
+            item, or the Exception that made it fail
+        """
+        ops = [WriteOp(kind="archive", column_values={}, item_name=item.name, item_id=item.id) for item in items]
+        with self.duplicator.profiler.phase("mutation"):
+            results = self.duplicator.writer.write(board_id, ops)
+
+        for item, result in zip(items, results):
+            if isinstance(result, Exception):
+                print(f"❌ Failed to archive '{item.name}': {str(result)}")
+            else:
+                print(f"🗄️  ARCHIVED '{item.name}' (ID: {item.id})")
+        return results
@@ -6,52 +6,361 @@ Includes duplicate detection - updates existing items instead of creating duplic
 """
 
 import requests
+import html
 import json
+import json_codec
 import sys
 import os
-from typing import Dict, List, Optional
-from dotenv import load_dotenv
-
-# Load environment variables from .env file
-load_dotenv()
+import threading
+import time
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+from batch_transform import ColumnarTransform
+from batch_writer import BatchWriter, WriteOp
+from board_schema import SchemaCache
+from group_mirror import GroupMirror
+from identity_match import IdentityMatcher
+from intent_log import Intent, IntentLog
+from item_model import Item, Update
+from profiler import PhaseProfiler
+from rate_limiter import RateLimiter
+from relation_remap import RelationRemapper, is_relation_column
+from resilience import CircuitBreaker, CircuitOpen, DeadlineExceeded, HedgedReader, call_with_deadline, is_ambiguous
+from single_flight import SingleFlight
+from stream_decode import ItemsPageStream
+from update_log import UpdateLog
+from value_translation import TranslationCache
 
 class MondayItemDuplicator:
-    def __init__(self, api_key: str):
-        """Initialize with Monday.com API key"""
+    def __init__(
+        self,
+        api_key: str,
+        rate_limiter: Optional[RateLimiter] = None,
+        validation: str = "drop",
+        intent_log: Optional[IntentLog] = None,
+        create_retries: int = 2,
+        transport=None,
+        update_log: Optional[UpdateLog] = None,
+        read_deadline: float = 60.0,
+        write_deadline: float = 120.0,
+        hedge_reads: bool = True,
+        breaker: Optional[CircuitBreaker] = None,
+        recover_intents: bool = True
+    ):
+        """
+        Initialize with Monday.com API key
+
+        Args:
+            api_key: Monday.com API token
+            rate_limiter: Optional request budget shared by every caller of this client
+            validation: How payloads failing the destination schema are handled
+                        ("drop" invalid columns, "strict" to fail the item, "off")
+            intent_log: Optional write-ahead log making creates safe to retry
+            create_retries: Resends of a create after an ambiguous failure (needs intent_log)
+            transport: Optional object with post(payload) -> (status code, text) used
+                       instead of HTTP (see cassette.py for record/replay)
+            update_log: Optional record of copied updates, so re-runs only copy new ones
+            read_deadline: Seconds a query may take, from sending to the last byte
+            write_deadline: Seconds a mutation may take, from sending to the last byte
+            hedge_reads: Send a duplicate of reads slower than the recent 95th percentile
+            breaker: Circuit breaker stopping requests while the API is failing
+                     (defaults to 5 failures in the last 20 requests, 60 second cooldown)
+            recover_intents: Settle creates left pending by an earlier run before the first
+                             create (off for workers whose parent process recovers them)
+        """
         self.api_key = api_key
         self.api_url = "https://api.monday.com/v2"
         self.headers = {
             "Authorization": api_key,
             "Content-Type": "application/json"
         }
+        self.rate_limiter = rate_limiter
+        self.validation = validation
+        self.intent_log = intent_log
+        self.create_retries = create_retries
+        self._intents_recovered = not recover_intents
+        self._recovery_lock = threading.Lock()
+        self.transport = transport
+        self.update_log = update_log
+
+        # Deadlines bound every request so a stalled connection cannot hang a run
+        self.connect_timeout = 10.0
+        self.read_deadline = read_deadline
+        self.write_deadline = write_deadline
+        self.hedger = HedgedReader() if hedge_reads else None
+        self.breaker = breaker or CircuitBreaker()
+
+        # Concurrent identical reads share one request
+        self.reads = SingleFlight()
+        self._index_builds = SingleFlight()
+
+        # Board column definitions, fetched once per board per run
+        self.schema_cache = SchemaCache(self)
+
+        # Status/dropdown translation tables per (source column, destination column)
+        self.translations = TranslationCache(self.schema_cache)
+
+        # Linked item ID remapping for board relation columns, cached for the run
+        self.relations = RelationRemapper(self)
+
+        # Source group -> destination group maps by title, cached for the run
+        self.groups = GroupMirror(self)
+
+        # Destination boards matching items by a source item ID column instead of by name
+        self.identities = IdentityMatcher(self)
+
+        # Per-phase timing (enabled by run.py --profile)
+        self.profiler = PhaseProfiler(enabled=False)
+
+        # Aliased mutation batches, sized per destination board
+        self.writer = BatchWriter(self)
+
+        # Optional write_buffer.WriteBuffer combining updates of the same item (set by the daemon)
+        self.write_buffer = None
+
+        # Destination indexes: board_id -> {item name: item}
+        # Only populated for boards passed to build_destination_index()
+        self.destination_indexes: Dict[int, Dict[str, Item]] = {}
+        # Batched name lookups: board_id -> {item name: item or None if not on the board}
+        self.name_lookups: Dict[int, Dict[str, Optional[Item]]] = {}
+        # Subitem indexes: destination parent item ID -> {subitem name: subitem}
+        self.subitem_indexes: Dict[str, Dict[str, Item]] = {}
+        self._index_lock = threading.Lock()
     
     def execute_query(self, query: str, variables: Optional[Dict] = None) -> Dict:
-        """Execute a GraphQL query against Monday.com API"""
-        data = {"query": query}
-        if variables:
-            data["variables"] = variables
-        
-        response = requests.post(
-            self.api_url,
-            headers=self.headers,
-            json=data
-        )
-        
-        if response.status_code != 200:
-            raise Exception(f"Query failed with status {response.status_code}: {response.text}")
-        
-        result = response.json()
+        """
+        Execute a GraphQL query against Monday.com API
+
+        Identical reads issued concurrently (same query text and variables)
+        share one request, and a read slower than usual is hedged (see
+        resilience.HedgedReader); mutations are always sent once.
+        """
+        if query.lstrip().startswith("mutation"):
+            result = self.execute_query_raw(query, variables)
+        else:
+            key = (query, json_codec.dumps(variables, sort_keys=True) if variables else None)
+            result = self.reads.do(key, lambda: self._read(query, variables))
+
         if "errors" in result:
             raise Exception(f"GraphQL errors: {result['errors']}")
         
         return result["data"]
-    
-    def get_item_by_name(self, board_id: int, item_name: str) -> Optional[Dict]:
-        """Get an item by name from a board"""
-        query = """
-        query ($boardId: [ID!]) {
-            boards(ids: $boardId) {
-                items_page(query_params: {rules: [{column_id: "name", compare_value: ["%s"]}]}) {
+
+    def _read(self, query: str, variables: Optional[Dict]) -> Dict:
+        """Send a read, hedged unless hedging is off or a transport replaces HTTP"""
+        if self.hedger is None or self.transport:
+            return self.execute_query_raw(query, variables)
+        return self.hedger.call(lambda: self.execute_query_raw(query, variables))
+
+    def execute_query_raw(self, query: str, variables: Optional[Dict] = None) -> Dict:
+        """
+        Execute a GraphQL query and return the whole response body
+
+        Unlike execute_query(), GraphQL errors are returned alongside any
+        partial data instead of raised, so aliased mutations can tell which
+        operations succeeded. HTTP errors are still raised.
+        """
+        data = {"query": query}
+        if variables:
+            data["variables"] = variables
+
+        self.breaker.before_call()
+        if self.rate_limiter:
+            self.rate_limiter.acquire()
+
+        try:
+            if self.transport:
+                status_code, text = self.transport.post(data)
+            else:
+                status_code, text = self.http_post(data)
+            if status_code != 200:
+                raise Exception(f"Query failed with status {status_code}: {text}")
+        except Exception as e:
+            self.breaker.record_failure(e)
+            raise
+        self.breaker.record_success()
+
+        return json_codec.loads(text)
+
+    def deadline_for(self, payload: Dict) -> float:
+        """Seconds a request may take in total (mutations get the longer write deadline)"""
+        if payload["query"].lstrip().startswith("mutation"):
+            return self.write_deadline
+        return self.read_deadline
+
+    def http_post(self, payload: Dict) -> Tuple[int, str]:
+        """
+        Send a request body to the Monday.com API and return (status code, response text)
+
+        Raises:
+            DeadlineExceeded: If the whole response has not arrived within the
+                              request's deadline (see deadline_for)
+        """
+        deadline = self.deadline_for(payload)
+
+        def send() -> Tuple[int, str]:
+            # The read timeout ends a stalled connection; the deadline also covers slow trickles
+            response = requests.post(
+                self.api_url,
+                headers=self.headers,
+                data=json_codec.dumps(payload).encode("utf-8"),
+                timeout=(self.connect_timeout, deadline)
+            )
+            # JSON is always UTF-8, so skip requests' charset detection on large bodies
+            return response.status_code, response.content.decode("utf-8", errors="replace")
+
+        return call_with_deadline(send, deadline)
+
+    def stream_query(self, query: str, variables: Optional[Dict] = None, chunk_size: int = 65536) -> ItemsPageStream:
+        """
+        Execute a query returning an items array, decoding items while the response downloads
+
+        The request is sent when iteration starts. Iterating yields raw item
+        dicts one at a time; afterwards the stream's data attribute holds the
+        rest of the response (cursor etc.) with the items array empty. GraphQL
+        errors are raised once the body has been read. Streamed reads are not
+        shared between concurrent callers.
+
+        Args:
+            query: GraphQL query with one items array in its result
+            variables: Query variables
+            chunk_size: Bytes read from the connection at a time
+        """
+        return ItemsPageStream(self._post_chunks(query, variables, chunk_size))
+
+    def _post_chunks(self, query: str, variables: Optional[Dict], chunk_size: int) -> Iterator[Union[bytes, str]]:
+        """
+        Send a request and yield the response body in chunks
+
+        The read deadline is checked between chunks, and the read timeout
+        ends a connection that stalls within one.
+        """
+        data = {"query": query}
+        if variables:
+            data["variables"] = variables
+
+        self.breaker.before_call()
+        if self.rate_limiter:
+            self.rate_limiter.acquire()
+
+        if self.transport:
+            # Transports return whole bodies (see cassette.py); items are still decoded one at a time
+            try:
+                status_code, text = self.transport.post(data)
+                if status_code != 200:
+                    raise Exception(f"Query failed with status {status_code}: {text}")
+            except Exception as e:
+                self.breaker.record_failure(e)
+                raise
+            self.breaker.record_success()
+            yield text
+            return
+
+        deadline = self.deadline_for(data)
+        expires = time.monotonic() + deadline
+        response = None
+        try:
+            response = requests.post(
+                self.api_url,
+                headers=self.headers,
+                data=json_codec.dumps(data).encode("utf-8"),
+                timeout=(self.connect_timeout, deadline),
+                stream=True
+            )
+            if response.status_code != 200:
+                raise Exception(f"Query failed with status {response.status_code}: {response.text}")
+            for chunk in response.iter_content(chunk_size=chunk_size):
+                if time.monotonic() > expires:
+                    raise DeadlineExceeded(f"Request timed out: no complete response within {deadline:g}s")
+                yield chunk
+        except Exception as e:
+            self.breaker.record_failure(e)
+            raise
+        finally:
+            if response is not None:
+                response.close()
+        self.breaker.record_success()
+
+    def get_item_by_name(
+        self,
+        board_id: int,
+        item_name: str,
+        column_ids: Optional[List[str]] = None,
+        subitem_column_ids: Optional[List[str]] = None,
+        updates_limit: int = 0
+    ) -> Optional[Item]:
+        """Get an item by name from a board (column_ids limits the columns fetched)"""
+        return self.get_items_by_names(
+            board_id, [item_name], column_ids, subitem_column_ids=subitem_column_ids, updates_limit=updates_limit
+        ).get(item_name)
+
+    def get_items_by_names(
+        self,
+        board_id: int,
+        item_names: List[str],
+        column_ids: Optional[List[str]] = None,
+        chunk_size: int = 100,
+        page_size: int = 500,
+        subitem_column_ids: Optional[List[str]] = None,
+        updates_limit: int = 0
+    ) -> Dict[str, Item]:
+        """
+        Look up many items by name on a board
+
+        Names are passed as a GraphQL variable to a single `any_of` rule, so the
+        query text never changes and names containing quotes are safe. Each
+        request resolves up to chunk_size names, paging through the matches.
+
+        Args:
+            board_id: Board to search
+            item_names: Item names to look up
+            column_ids: Columns to fetch (None fetches all)
+            chunk_size: Names per request
+            page_size: Items per page of matches
+            subitem_column_ids: Also fetch subitems with these columns (None skips subitems)
+            updates_limit: Also fetch up to this many of each item's most recent updates (0 skips them)
+
+        Returns:
+            Dictionary mapping each found name to its first item
+        """
+        return self.get_items_by_column_values(
+            board_id, "name", item_names, column_ids, chunk_size, page_size, subitem_column_ids, updates_limit
+        )
+
+    def get_items_by_column_values(
+        self,
+        board_id: int,
+        column_id: str,
+        values: List[str],
+        column_ids: Optional[List[str]] = None,
+        chunk_size: int = 100,
+        page_size: int = 500,
+        subitem_column_ids: Optional[List[str]] = None,
+        updates_limit: int = 0
+    ) -> Dict[str, Item]:
+        """
+        Look up many items by the value of one column (batched, constant query text)
+
+        Args:
+            board_id: Board to search
+            column_id: Column to match ("name" for item names)
+            values: Values to look up
+            column_ids: Columns to fetch (None fetches all)
+            chunk_size: Values per request
+            page_size: Items per page of matches
+            subitem_column_ids: Also fetch subitems with these columns (None skips subitems)
+            updates_limit: Also fetch up to this many of each item's most recent updates (0 skips them)
+
+        Returns:
+            Dictionary mapping each found value to its first item
+        """
+        first_query = """
+        query ($boardId: ID!, $columnId: ID!, $values: CompareValue!, $limit: Int!, $columnIds: [String!], $withSubitems: Boolean!, $subitemColumnIds: [String!], $withUpdates: Boolean!, $updatesLimit: Int!) {
+            boards(ids: [$boardId]) {
+                items_page(
+                    limit: $limit,
+                    query_params: {rules: [{column_id: $columnId, compare_value: $values, operator: any_of}]}
+                ) {
+                    cursor
                     items {
                         id
                         name
@@ -59,33 +368,207 @@ class MondayItemDuplicator:
                             id
                             title
                         }
-                        column_values {
+                        column_values(ids: $columnIds) {
                             id
                             text
                             value
                             type
                         }
+                        subitems @include(if: $withSubitems) {
+                            id
+                            name
+                            column_values(ids: $subitemColumnIds) {
+                                id
+                                text
+                                value
+                                type
+                            }
+                        }
+                        updates(limit: $updatesLimit) @include(if: $withUpdates) {
+                            id
+                            body
+                            created_at
+                            creator {
+                                name
+                            }
+                        }
                     }
                 }
             }
         }
-        """ % item_name
+        """
 
-        variables = {
-            "boardId": [board_id]
+        next_query = """
+        query ($cursor: String!, $limit: Int!, $columnIds: [String!], $withSubitems: Boolean!, $subitemColumnIds: [String!], $withUpdates: Boolean!, $updatesLimit: Int!) {
+            next_items_page(cursor: $cursor, limit: $limit) {
+                cursor
+                items {
+                    id
+                    name
+                    group {
+                        id
+                        title
+                    }
+                    column_values(ids: $columnIds) {
+                        id
+                        text
+                        value
+                        type
+                    }
+                    subitems @include(if: $withSubitems) {
+                        id
+                        name
+                        column_values(ids: $subitemColumnIds) {
+                            id
+                            text
+                            value
+                            type
+                        }
+                    }
+                    updates(limit: $updatesLimit) @include(if: $withUpdates) {
+                        id
+                        body
+                        created_at
+                        creator {
+                            name
+                        }
+                    }
+                }
+            }
         }
+        """
 
-        data = self.execute_query(query, variables)
-        items = data["boards"][0]["items_page"]["items"]
+        # The matched column has to be fetched to key the results by it
+        if column_id != "name" and column_ids is not None and column_id not in column_ids:
+            column_ids = list(column_ids) + [column_id]
+
+        wanted = list(dict.fromkeys(str(value) for value in values))
+        found = {}
+
+        for start in range(0, len(wanted), chunk_size):
+            variables = {
+                "boardId": str(board_id),
+                "columnId": column_id,
+                "values": wanted[start:start + chunk_size],
+                "limit": page_size,
+                "columnIds": column_ids,
+                "withSubitems": subitem_column_ids is not None,
+                "subitemColumnIds": subitem_column_ids,
+                "withUpdates": updates_limit > 0,
+                "updatesLimit": updates_limit
+            }
+            data = self.execute_query(first_query, variables)
+            page = data["boards"][0]["items_page"]
+
+            while True:
+                for data_item in page["items"]:
+                    item = Item.from_api(data_item, column_ids, subitem_column_ids)
+                    if column_id == "name":
+                        key = item.name
+                    else:
+                        column = item.columns.get(column_id)
+                        key = column.text if column else None
+
+                    # Keep the first item for a value, like a single-name lookup
+                    if key is not None and key not in found:
+                        found[key] = item
+
+                if not page["cursor"]:
+                    break
+
+                data = self.execute_query(
+                    next_query,
+                    {
+                        "cursor": page["cursor"],
+                        "limit": page_size,
+                        "columnIds": column_ids,
+                        "withSubitems": subitem_column_ids is not None,
+                        "subitemColumnIds": subitem_column_ids,
+                        "withUpdates": updates_limit > 0,
+                        "updatesLimit": updates_limit
+                    }
+                )
+                page = data["next_items_page"]
 
-        return items[0] if items else None
+        return found
     
-    def get_items_from_group(self, board_id: int, group_id: str) -> List[Dict]:
-        """Get all items from a specific group in a board"""
-        query = """
-        query ($boardId: ID!) {
+    def iter_group_items(
+        self,
+        board_id: int,
+        group_id: Optional[str],
+        column_ids: Optional[List[str]] = None,
+        page_size: int = 500,
+        subitem_column_ids: Optional[List[str]] = None,
+        updates_limit: int = 0
+    ) -> Iterator[Item]:
+        """
+        Iterate over every item in a group (or board), one page at a time
+
+        Pages are streamed: each item is converted to a compact Item as soon
+        as it has been received, so neither a whole page nor the unrequested
+        columns of the group are ever held in memory.
+
+        Args:
+            board_id: Board to read
+            group_id: Group to read (None reads every group of the board)
+            column_ids: Columns to fetch (None fetches all)
+            page_size: Items per request (Monday.com maximum is 500)
+            subitem_column_ids: Also fetch subitems with these columns (None skips subitems)
+            updates_limit: Also fetch up to this many of each item's most recent updates (0 skips them)
+
+        Yields:
+            Item objects
+        """
+        first_query = """
+        query ($boardId: ID!, $groupId: String!, $limit: Int!, $columnIds: [String!], $withSubitems: Boolean!, $subitemColumnIds: [String!], $withUpdates: Boolean!, $updatesLimit: Int!) {
             boards(ids: [$boardId]) {
-                items_page(limit: 500) {
+                groups(ids: [$groupId]) {
+                    items_page(limit: $limit) {
+                        cursor
+                        items {
+                            id
+                            name
+                            group {
+                                id
+                                title
+                            }
+                            column_values(ids: $columnIds) {
+                                id
+                                text
+                                value
+                                type
+                            }
+                            subitems @include(if: $withSubitems) {
+                                id
+                                name
+                                column_values(ids: $subitemColumnIds) {
+                                    id
+                                    text
+                                    value
+                                    type
+                                }
+                            }
+                            updates(limit: $updatesLimit) @include(if: $withUpdates) {
+                                id
+                                body
+                                created_at
+                                creator {
+                                    name
+                                }
+                            }
+                        }
+                    }
+                }
+            }
+        }
+        """
+
+        # Same selection over the whole board (group_id None)
+        board_query = """
+        query ($boardId: ID!, $limit: Int!, $columnIds: [String!], $withSubitems: Boolean!, $subitemColumnIds: [String!], $withUpdates: Boolean!, $updatesLimit: Int!) {
+            boards(ids: [$boardId]) {
+                items_page(limit: $limit) {
+                    cursor
                     items {
                         id
                         name
@@ -93,27 +576,401 @@ class MondayItemDuplicator:
                             id
                             title
                         }
-                        column_values {
+                        column_values(ids: $columnIds) {
+                            id
+                            text
+                            value
+                            type
+                        }
+                        subitems @include(if: $withSubitems) {
+                            id
+                            name
+                            column_values(ids: $subitemColumnIds) {
+                                id
+                                text
+                                value
+                                type
+                            }
+                        }
+                        updates(limit: $updatesLimit) @include(if: $withUpdates) {
+                            id
+                            body
+                            created_at
+                            creator {
+                                name
+                            }
+                        }
+                    }
+                }
+            }
+        }
+        """
+
+        next_query = """
+        query ($cursor: String!, $limit: Int!, $columnIds: [String!], $withSubitems: Boolean!, $subitemColumnIds: [String!], $withUpdates: Boolean!, $updatesLimit: Int!) {
+            next_items_page(cursor: $cursor, limit: $limit) {
+                cursor
+                items {
+                    id
+                    name
+                    group {
+                        id
+                        title
+                    }
+                    column_values(ids: $columnIds) {
+                        id
+                        text
+                        value
+                        type
+                    }
+                    subitems @include(if: $withSubitems) {
+                        id
+                        name
+                        column_values(ids: $subitemColumnIds) {
                             id
                             text
                             value
                             type
                         }
                     }
+                    updates(limit: $updatesLimit) @include(if: $withUpdates) {
+                        id
+                        body
+                        created_at
+                        creator {
+                            name
+                        }
+                    }
                 }
             }
         }
         """
 
-        variables = {"boardId": str(board_id)}
-        data = self.execute_query(query, variables)
+        variables = {
+            "boardId": str(board_id),
+            "limit": page_size,
+            "columnIds": column_ids,
+            "withSubitems": subitem_column_ids is not None,
+            "subitemColumnIds": subitem_column_ids,
+            "withUpdates": updates_limit > 0,
+            "updatesLimit": updates_limit
+        }
+        if group_id is None:
+            query = board_query
+        else:
+            query = first_query
+            variables["groupId"] = group_id
+
+        # Each page is decoded item by item as it downloads, so Items are
+        # yielded before the page has been fully received
+        while True:
+            stream = self.stream_query(query, variables)
+            for item in stream:
+                yield Item.from_api(item, column_ids, subitem_column_ids)
+
+            data = stream.data
+            if query is next_query:
+                page = data["next_items_page"]
+            elif group_id is None:
+                page = data["boards"][0]["items_page"]
+            else:
+                groups = data["boards"][0]["groups"]
+                if not groups:
+                    return
+                page = groups[0]["items_page"]
+
+            if not page["cursor"]:
+                break
+
+            query = next_query
+            variables = {
+                "cursor": page["cursor"],
+                "limit": page_size,
+                "columnIds": column_ids,
+                "withSubitems": subitem_column_ids is not None,
+                "subitemColumnIds": subitem_column_ids,
+                "withUpdates": updates_limit > 0,
+                "updatesLimit": updates_limit
+            }
+
+    def get_items_from_group(
+        self,
+        board_id: int,
+        group_id: Optional[str],
+        column_ids: Optional[List[str]] = None,
+        subitem_column_ids: Optional[List[str]] = None,
+        updates_limit: int = 0
+    ) -> List[Item]:
+        """Get all items from a group in a board, or the whole board if group_id is None (column_ids limits the columns fetched)"""
+        return list(self.iter_group_items(
+            board_id, group_id, column_ids, subitem_column_ids=subitem_column_ids, updates_limit=updates_limit
+        ))
+
+    def get_items_by_ids(
+        self,
+        item_ids: List[int],
+        column_ids: Optional[List[str]] = None,
+        subitem_column_ids: Optional[List[str]] = None,
+        updates_limit: int = 0
+    ) -> List[Item]:
+        """Get item data for a list of item IDs (100 IDs per request, subitems and updates optional)"""
+        query = """
+        query ($itemIds: [ID!], $columnIds: [String!], $withSubitems: Boolean!, $subitemColumnIds: [String!], $withUpdates: Boolean!, $updatesLimit: Int!) {
+            items(ids: $itemIds, limit: 100) {
+                id
+                name
+                group {
+                    id
+                    title
+                }
+                column_values(ids: $columnIds) {
+                    id
+                    text
+                    value
+                    type
+                }
+                subitems @include(if: $withSubitems) {
+                    id
+                    name
+                    column_values(ids: $subitemColumnIds) {
+                        id
+                        text
+                        value
+                        type
+                    }
+                }
+                updates(limit: $updatesLimit) @include(if: $withUpdates) {
+                    id
+                    body
+                    created_at
+                    creator {
+                        name
+                    }
+                }
+            }
+        }
+        """
+
+        items = []
+        for start in range(0, len(item_ids), 100):
+            chunk = [str(item_id) for item_id in item_ids[start:start + 100]]
+            variables = {
+                "itemIds": chunk,
+                "columnIds": column_ids,
+                "withSubitems": subitem_column_ids is not None,
+                "subitemColumnIds": subitem_column_ids,
+                "withUpdates": updates_limit > 0,
+                "updatesLimit": updates_limit
+            }
+            data = self.execute_query(query, variables)
+            items.extend(Item.from_api(item, column_ids, subitem_column_ids) for item in data["items"])
+
+        return items
+
+    def iter_board_items(self, board_id: int, page_size: int = 500):
+        """
+        Iterate over every item on a board (id, name and group only), following cursors
+
+        Args:
+            board_id: Board to read
+            page_size: Items per request (Monday.com maximum is 500)
+
+        Yields:
+            Item objects with id, name and group (no columns)
+        """
+        first_query = """
+        query ($boardId: ID!, $limit: Int!) {
+            boards(ids: [$boardId]) {
+                items_page(limit: $limit) {
+                    cursor
+                    items {
+                        id
+                        name
+                        group {
+                            id
+                            title
+                        }
+                    }
+                }
+            }
+        }
+        """
+
+        next_query = """
+        query ($cursor: String!, $limit: Int!) {
+            next_items_page(cursor: $cursor, limit: $limit) {
+                cursor
+                items {
+                    id
+                    name
+                    group {
+                        id
+                        title
+                    }
+                }
+            }
+        }
+        """
+
+        data = self.execute_query(first_query, {"boardId": str(board_id), "limit": page_size})
+        page = data["boards"][0]["items_page"]
+
+        while True:
+            for item in page["items"]:
+                yield Item.from_api(item)
+
+            if not page["cursor"]:
+                break
+
+            data = self.execute_query(next_query, {"cursor": page["cursor"], "limit": page_size})
+            page = data["next_items_page"]
+
+    def build_destination_index(self, board_id: int, refresh: bool = False) -> Dict[str, Item]:
+        """
+        Build (or return the cached) name index of a destination board
+
+        Once a board is indexed, duplicate detection for it is a dictionary
+        lookup instead of one search request per item. On boards with an
+        identity column, the same scan also builds the identity index.
+
+        Args:
+            board_id: Destination board ID
+            refresh: Rebuild the index even if it is already cached
+
+        Returns:
+            Dictionary mapping item names to items
+        """
+        if not refresh:
+            index = self.destination_indexes.get(board_id)
+            if index is not None:
+                return index
+
+        def build():
+            column_id = self.identities.column(board_id)
+            if column_id:
+                items = list(self.iter_group_items(board_id, None, column_ids=[column_id]))
+                self.identities.build_index(board_id, items)
+            else:
+                items = self.iter_board_items(board_id)
+
+            index = {}
+            for item in items:
+                # Keep the first item for a name, matching get_item_by_name
+                index.setdefault(item.name, item)
+
+            with self._index_lock:
+                self.destination_indexes[board_id] = index
+            return index
+
+        # Workers needing the same board wait for one build instead of each paging it
+        return self._index_builds.do(board_id, build)
+
+    def lookup_existing_items(self, board_id: int, source_items: List[Item]):
+        """
+        Resolve which of a batch of items already exist on a board
+
+        Results are cached so that find_existing_item() answers from memory
+        for these items. Skipped when the board already has a full index.
+        Boards with an identity column are resolved by source item ID (see
+        identity_match.IdentityMatcher), the others by name.
+
+        Args:
+            board_id: Destination board ID
+            source_items: Source items about to be duplicated
+        """
+        if self.identities.column(board_id):
+            self.identities.lookup(board_id, source_items)
+            return
+
+        if board_id in self.destination_indexes:
+            return
+
+        lookups = self.name_lookups.setdefault(board_id, {})
+        missing = [name for name in dict.fromkeys(item.name for item in source_items) if name not in lookups]
+        if not missing:
+            return
+
+        found = self.get_items_by_names(board_id, missing, column_ids=[])
+
+        with self._index_lock:
+            for name in missing:
+                lookups.setdefault(name, found.get(name))
+
+    def find_existing_item(self, board_id: int, source_item: Item) -> Optional[Item]:
+        """Find the destination item of a source item, using the destination index or batched lookups when available"""
+        if self.identities.column(board_id):
+            return self.identities.find(board_id, source_item)
+
+        index = self.destination_indexes.get(board_id)
+        if index is not None:
+            return index.get(source_item.name)
+
+        lookups = self.name_lookups.get(board_id)
+        if lookups is not None and source_item.name in lookups:
+            return lookups[source_item.name]
+
+        return self.get_item_by_name(board_id, source_item.name, column_ids=[])
+
+    def recheck_existing_item(self, board_id: int, source_item: Item) -> Optional[Item]:
+        """
+        Look for a source item's destination item on the board itself, bypassing the cached index
+
+        For long-running callers whose index may predate items created by
+        other runs. A found item is added to the index and lookups.
+        """
+        column_id = self.identities.column(board_id)
+        if column_id:
+            found = self.get_items_by_column_values(
+                board_id, column_id, [source_item.id], column_ids=[column_id]
+            ).get(source_item.id)
+        else:
+            found = self.get_item_by_name(board_id, source_item.name, column_ids=[])
+
+        if found is not None:
+            self.remember_item(board_id, found, source_item.id)
+        return found
 
-        all_items = data["boards"][0]["items_page"]["items"]
+    def remember_item(self, board_id: int, item: Item, source_item_id: Optional[str] = None):
+        """Add a newly created item to the board's destination index and lookups"""
+        with self._index_lock:
+            index = self.destination_indexes.get(board_id)
+            if index is not None:
+                index.setdefault(item.name, item)
 
-        # Filter items by group_id
-        group_items = [item for item in all_items if item["group"]["id"] == group_id]
+            lookups = self.name_lookups.get(board_id)
+            if lookups is not None and lookups.get(item.name) is None:
+                lookups[item.name] = item
 
-        return group_items
+        if source_item_id is not None and self.identities.column(board_id):
+            self.identities.remember(board_id, source_item_id, item)
+
+    def build_subitem_indexes(self, parent_ids: List[str]):
+        """
+        Index the existing subitems of destination items by name
+
+        Parents are read 100 per request; parents already indexed are skipped.
+
+        Args:
+            parent_ids: Destination item IDs whose subitems may be updated
+        """
+        missing = [
+            parent_id for parent_id in dict.fromkeys(map(str, parent_ids))
+            if parent_id not in self.subitem_indexes
+        ]
+        if not missing:
+            return
+
+        parents = self.get_items_by_ids([int(parent_id) for parent_id in missing], column_ids=[], subitem_column_ids=[])
+
+        with self._index_lock:
+            for parent in parents:
+                index = self.subitem_indexes.setdefault(str(parent.id), {})
+                for subitem in parent.subitems or []:
+                    # Keep the first subitem for a name, matching get_item_by_name
+                    index.setdefault(subitem.name, subitem)
+
+            for parent_id in missing:
+                self.subitem_indexes.setdefault(parent_id, {})
 
     def find_matching_pillar_items(self, search_terms: List[str], pillar_board_id: int, pillar_group_id: str) -> List[int]:
         """
@@ -128,7 +985,7 @@ class MondayItemDuplicator:
             List of matching item IDs
         """
         # Get all items from the pillars board
-        pillar_items = self.get_items_from_group(pillar_board_id, pillar_group_id)
+        pillar_items = self.get_items_from_group(pillar_board_id, pillar_group_id, column_ids=[])
 
         matching_ids = []
 
@@ -140,14 +997,14 @@ class MondayItemDuplicator:
             search_term_lower = search_term.lower().strip()
 
             for item in pillar_items:
-                item_name_lower = item["name"].lower().strip()
+                item_name_lower = item.name.lower().strip()
 
                 # Check if search term matches the item name (case-insensitive, partial match)
                 if search_term_lower in item_name_lower or item_name_lower in search_term_lower:
-                    item_id = int(item["id"])
+                    item_id = int(item.id)
                     if item_id not in matching_ids:
                         matching_ids.append(item_id)
-                        print(f"   ✅ Found matching pillar: '{item['name']}' (ID: {item_id}) for search term '{search_term}'")
+                        print(f"   ✅ Found matching pillar: '{item.name}' (ID: {item_id}) for search term '{search_term}'")
 
         return matching_ids
     
@@ -156,16 +1013,18 @@ class MondayItemDuplicator:
         board_id: int,
         group_id: str,
         item_name: str,
-        column_values: Dict
+        column_values: Dict,
+        create_labels_if_missing: bool = False
     ) -> Dict:
         """Create a new item with column values"""
         query = """
-        mutation ($boardId: ID!, $groupId: String!, $itemName: String!, $columnValues: JSON!) {
+        mutation ($boardId: ID!, $groupId: String!, $itemName: String!, $columnValues: JSON!, $createLabels: Boolean) {
             create_item(
                 board_id: $boardId,
                 group_id: $groupId,
                 item_name: $itemName,
-                column_values: $columnValues
+                column_values: $columnValues,
+                create_labels_if_missing: $createLabels
             ) {
                 id
                 name
@@ -177,25 +1036,123 @@ class MondayItemDuplicator:
             "boardId": str(board_id),
             "groupId": group_id,
             "itemName": item_name,
-            "columnValues": json.dumps(column_values)
+            "columnValues": json_codec.dumps(column_values),
+            "createLabels": create_labels_if_missing
         }
         
         data = self.execute_query(query, variables)
         return data["create_item"]
     
+    def recover_pending_creates(self):
+        """
+        Settle creates left unconfirmed by an earlier run, once per client
+
+        Called before the first create is recorded, so runs that never create
+        an item (previews, cancelled runs, updates only) skip the recovery
+        reads, and this run's own pending creates are never mistaken for stale ones.
+        """
+        if self._intents_recovered or not self.intent_log:
+            return
+
+        with self._recovery_lock:
+            if self._intents_recovered:
+                return
+            if self.intent_log.pending():
+                recovered = self.intent_log.recover(self)
+                print(f"🔁 Reconciled unconfirmed creates from a previous run: "
+                      f"{recovered['committed']} found on their board, {recovered['abandoned']} not created")
+            self._intents_recovered = True
+
+    def create_item_safely(
+        self,
+        board_id: int,
+        group_id: str,
+        item_name: str,
+        column_values: Dict,
+        create_labels_if_missing: bool = False,
+        source_item_id: str = None
+    ) -> Dict:
+        """
+        Create an item, recording the intent first so failures can be retried safely
+
+        After an ambiguous failure (timeout, dropped connection, gateway error)
+        the destination is checked for the item before the create is resent.
+        Without an intent log this is a plain create_item_with_values().
+
+        Returns:
+            Dict with id and name of the created item
+        """
+        if not self.intent_log:
+            return self.create_item_with_values(
+                board_id, group_id, item_name, column_values, create_labels_if_missing
+            )
+
+        self.recover_pending_creates()
+        identity_column = self.identities.column(board_id)
+        intent = self.intent_log.record(Intent(
+            id=0,
+            board_id=board_id,
+            group_id=group_id,
+            item_name=item_name,
+            source_item_id=source_item_id,
+            identity_column=identity_column,
+            identity_value=str(source_item_id) if identity_column and source_item_id else None
+        ))
+
+        attempt = 0
+        while True:
+            try:
+                result_item = self.create_item_with_values(
+                    board_id, group_id, item_name, column_values, create_labels_if_missing
+                )
+            except Exception as e:
+                if not is_ambiguous(e):
+                    self.intent_log.abandon(intent, str(e))
+                    raise
+
+                # The create may have been applied - look before resending
+                print(f"⚠️  Create of '{item_name}' may not have completed ({type(e).__name__}), checking...")
+                dest_item_id = self.intent_log.reconcile(self, [intent]).get(intent.id)
+                if dest_item_id:
+                    return {"id": dest_item_id, "name": item_name}
+
+                attempt += 1
+                if attempt > self.create_retries:
+                    self.intent_log.abandon(intent, str(e))
+                    raise
+                continue
+
+            self.intent_log.commit(intent, result_item["id"])
+            return result_item
+
     def update_item_column_values(
         self,
         board_id: int,
         item_id: str,
-        column_values: Dict
+        column_values: Dict,
+        create_labels_if_missing: bool = False,
+        item_name: str = ""
     ) -> Dict:
-        """Update column values on an existing item"""
+        """
+        Update column values on an existing item
+
+        With a write buffer, the update is combined with other updates of the
+        item in the same flush window and this call returns once it is queued.
+        The buffer's owner learns the outcome from WriteBuffer.take_added().
+        """
+        if self.write_buffer is not None:
+            self.write_buffer.add(
+                board_id, item_id, column_values, item_name=item_name, create_labels=create_labels_if_missing
+            )
+            return {"id": str(item_id), "name": item_name}
+
         query = """
-        mutation ($boardId: ID!, $itemId: ID!, $columnValues: JSON!) {
+        mutation ($boardId: ID!, $itemId: ID!, $columnValues: JSON!, $createLabels: Boolean) {
             change_multiple_column_values(
                 board_id: $boardId,
                 item_id: $itemId,
-                column_values: $columnValues
+                column_values: $columnValues,
+                create_labels_if_missing: $createLabels
             ) {
                 id
                 name
@@ -206,7 +1163,8 @@ class MondayItemDuplicator:
         variables = {
             "boardId": str(board_id),
             "itemId": str(item_id),
-            "columnValues": json.dumps(column_values)
+            "columnValues": json_codec.dumps(column_values),
+            "createLabels": create_labels_if_missing
         }
         
         data = self.execute_query(query, variables)
@@ -237,12 +1195,12 @@ class MondayItemDuplicator:
         print(f"🔍 Searching for item: '{source_item_name}' in board {source_board_id}...")
         
         # Get source item
-        source_item = self.get_item_by_name(source_board_id, source_item_name)
+        source_item = self.get_item_by_name(source_board_id, source_item_name, list(column_mapping))
         
         if not source_item:
             raise Exception(f"Item '{source_item_name}' not found in board {source_board_id}")
         
-        print(f"✅ Found item (ID: {source_item['id']}) in group: {source_item['group']['title']}")
+        print(f"✅ Found item (ID: {source_item.id}) in group: {source_item.group_title}")
 
         return self.duplicate_item_from_data(
             source_item,
@@ -251,72 +1209,49 @@ class MondayItemDuplicator:
             column_mapping,
             column_names={},
             source_board_name="Source",
-            dest_board_name="Destination"
+            dest_board_name="Destination",
+            source_board_id=source_board_id
         )
     
-    def duplicate_item_from_data(
+    def map_column_values(
         self,
-        source_item: Dict,
-        dest_board_id: int,
-        dest_group_id: str,
+        source_item: Item,
         column_mapping: Dict[str, str],
-        column_names: Dict[str, str] = None,
+        column_names: Dict[str, str],
         source_board_name: str = "Source",
         dest_board_name: str = "Destination",
-        pillar_board_id: int = None,
-        pillar_group_id: str = None,
-        pillar_search_columns: List[str] = None
-    ) -> Dict:
+        source_board_id: int = None,
+        dest_board_id: int = None,
+        unknown_labels: str = "skip"
+    ) -> Tuple[Dict, Dict[str, str]]:
         """
-        Duplicate an item using existing item data
-        If item already exists in destination, updates it instead of creating a duplicate
-        
+        Convert a source item's column values into a destination payload
+
+        Status labels and dropdown options are translated between boards when
+        both board IDs are given; otherwise they are copied as they are.
+
         Args:
-            source_item: Item data dict with id, name, group, and column_values
-            dest_board_id: Destination board ID
-            dest_group_id: Destination group ID
+            source_item: Source item (must hold the mapped columns)
             column_mapping: Dict mapping source column IDs to destination column IDs
-        
+            column_names: Dict mapping column IDs to display names
+            source_board_id: Source board ID (enables label/option translation)
+            dest_board_id: Destination board ID (enables label/option translation)
+            unknown_labels: Policy for labels missing on the destination ("skip", "create", "error")
+
         Returns:
-            Dict with duplicate results and mapping summary
+            Tuple of (column values payload, summary line per destination column)
         """
-        print(f"🔍 Processing item: '{source_item['name']}' (ID: {source_item['id']})")
-        print(f"   From group: {source_item['group']['title']}")
-        
-        # Check if item already exists in destination board
-        print(f"\n🔎 Checking for existing item in destination board...")
-        existing_item = self.get_item_by_name(dest_board_id, source_item['name'])
-        
-        if existing_item:
-            print(f"⚠️  Item already exists in destination!")
-            print(f"   Existing Item ID: {existing_item['id']}")
-            print(f"   Group: {existing_item['group']['title']}")
-            print(f"   → Will UPDATE existing item instead of creating duplicate")
-            is_update = True
-            dest_item_id = existing_item['id']
-        else:
-            print(f"✅ No duplicate found - will create new item")
-            is_update = False
-            dest_item_id = None
-        
-        # Extract column values
-        source_columns = {col["id"]: col for col in source_item["column_values"]}
-        
-        # Map columns to destination
-        mapped_values = {}
-        mapped_summary = []
-        unmapped_summary = []
+        source_columns = source_item.columns
 
-        # Use column names if provided, otherwise use IDs
-        if column_names is None:
-            column_names = {}
+        mapped_values = {}
+        mapped_summary = {}
 
         for source_col_id, dest_col_id in column_mapping.items():
             if source_col_id in source_columns:
                 col = source_columns[source_col_id]
 
                 # Skip empty values
-                if not col["value"] or col["value"] == "null":
+                if col.is_empty():
                     continue
 
                 # Get friendly names for display
@@ -324,138 +1259,783 @@ class MondayItemDuplicator:
                 dest_name = column_names.get(dest_col_id, dest_col_id)
                 mapping_display = f"{source_name} ({source_board_name}) → {dest_name} ({dest_board_name})"
 
+                # Status/dropdown translation table for this column pair
+                table = None
+                if source_board_id and dest_board_id and col.type in ["color", "status", "dropdown"]:
+                    table = self.translations.get(source_board_id, source_col_id, dest_board_id, dest_col_id)
+
                 try:
                     # Parse the value
-                    value_data = json.loads(col["value"])
+                    value_data = json_codec.loads(col.value)
 
                     # Handle different column types
-                    if col["type"] == "text":
-                        mapped_values[dest_col_id] = col["text"]
-                        mapped_summary.append(f"✅ {mapping_display}: '{col['text']}'")
+                    if col.type == "text":
+                        mapped_values[dest_col_id] = col.text
+                        mapped_summary[dest_col_id] = f"✅ {mapping_display}: '{col.text}'"
 
-                    elif col["type"] == "link":
+                    elif col.type == "link":
                         # Set URL as both the link and display text
                         url = value_data.get("url", "")
                         mapped_values[dest_col_id] = {
                             "url": url,
                             "text": url
                         }
-                        mapped_summary.append(f"✅ {mapping_display}: {url}")
+                        mapped_summary[dest_col_id] = f"✅ {mapping_display}: {url}"
 
-                    elif col["type"] == "board-relation":
-                        # Extract linked item IDs from source and copy to destination
+                    elif is_relation_column(col.type):
+                        # Extract linked item IDs from source
                         linked_items = value_data.get("linkedPulseIds", [])
-                        if linked_items:
-                            item_ids = [int(item["linkedPulseId"]) for item in linked_items]
+                        item_ids = [int(item["linkedPulseId"]) for item in linked_items]
+                        unresolved = []
+
+                        # Remap them to the boards the destination column links to
+                        if item_ids and dest_board_id:
+                            item_ids, unresolved = self.relations.remap(
+                                item_ids,
+                                self.relations.target_boards(dest_board_id, dest_col_id)
+                            )
+
+                        if item_ids:
                             mapped_values[dest_col_id] = {"item_ids": item_ids}
-                            mapped_summary.append(f"✅ {mapping_display}: {len(item_ids)} linked item(s)")
+                            note = f" ({len(unresolved)} unresolved)" if unresolved else ""
+                            mapped_summary[dest_col_id] = f"✅ {mapping_display}: {len(item_ids)} linked item(s){note}"
 
-                    elif col["type"] in ["color", "status"]:
+                    elif col.type in ["color", "status"]:
                         # Status/color column - use label format
                         # Monday.com expects {"label": "Label Name"}
                         # Note: API reports these as "status" type, not "color"
-                        mapped_values[dest_col_id] = {"label": col["text"]}
-                        mapped_summary.append(f"✅ {mapping_display}: {col['text']}")
-
-                    elif col["type"] == "dropdown":
+                        label = col.text
+                        if table:
+                            label = table.translate_label(label, unknown_labels)
+                        if label is not None:
+                            mapped_values[dest_col_id] = {"label": label}
+                            mapped_summary[dest_col_id] = f"✅ {mapping_display}: {label}"
+
+                    elif col.type == "dropdown":
                         # Dropdown column - use ids format
                         # Dropdown values come as {"ids": [1, 2, 3]}
                         ids = value_data.get("ids", [])
-                        if ids:
+                        if ids and table:
+                            # Option IDs are board-specific - translate them by name
+                            translated = table.translate_ids(ids, unknown_labels)
+                            if translated:
+                                mapped_values[dest_col_id] = translated
+                                mapped_summary[dest_col_id] = f"✅ {mapping_display}: {col.text}"
+                        elif ids:
                             # Use the IDs from source
                             mapped_values[dest_col_id] = {"ids": ids}
-                            mapped_summary.append(f"✅ {mapping_display}: {col['text']}")
+                            mapped_summary[dest_col_id] = f"✅ {mapping_display}: {col.text}"
 
                     else:
                         # For other types, try to use the raw value
                         mapped_values[dest_col_id] = value_data
-                        mapped_summary.append(f"✅ {mapping_display}: {col['text']}")
+                        mapped_summary[dest_col_id] = f"✅ {mapping_display}: {col.text}"
 
-                except json.JSONDecodeError:
+                except json_codec.JSONDecodeError:
                     # If value isn't JSON, use text representation
-                    mapped_values[dest_col_id] = col["text"]
-                    mapped_summary.append(f"✅ {mapping_display}: '{col['text']}'")
+                    mapped_values[dest_col_id] = col.text
+                    mapped_summary[dest_col_id] = f"✅ {mapping_display}: '{col.text}'"
+
+        return mapped_values, mapped_summary
+
+    def validate_column_values(
+        self,
+        board_id: int,
+        column_values: Dict,
+        column_names: Dict[str, str] = None,
+        allow_new_labels: bool = False
+    ) -> Tuple[Dict, List[str]]:
+        """
+        Validate a payload against the destination board's cached schema
+
+        Depending on self.validation, invalid columns are dropped ("drop"),
+        rejected with an error ("strict") or sent unchecked ("off").
+
+        Returns:
+            Tuple of (payload to send, list of problems found)
+        """
+        if self.validation == "off" or not column_values:
+            return column_values, []
+
+        schema = self.schema_cache.get(board_id)
+        valid_values, problems = schema.validate(column_values, allow_new_labels)
+
+        if column_names:
+            problems = [
+                f"{column_names.get(col_id, col_id)}: {problem}"
+                for col_id, problem in problems
+            ]
+        else:
+            problems = [f"{col_id}: {problem}" for col_id, problem in problems]
+
+        if problems and self.validation == "strict":
+            raise ValueError(
+                f"Payload rejected by schema of board {board_id}: " + "; ".join(problems)
+            )
+
+        return valid_values, problems
+
+    def prepare_item(
+        self,
+        source_item: Item,
+        dest_board_id: int,
+        column_mapping: Dict[str, str],
+        column_names: Dict[str, str],
+        source_board_name: str = "Source",
+        dest_board_name: str = "Destination",
+        source_board_id: int = None,
+        unknown_labels: str = "skip"
+    ) -> Dict:
+        """
+        Work out what duplicating an item would write, without writing it
+
+        Returns:
+            Dict with existing_item (or None), mapped_values, mapped_summary,
+            problems (columns dropped by validation) and create_labels
+        """
+        with self.profiler.phase("destination lookup"):
+            existing_item = self.find_existing_item(dest_board_id, source_item)
+
+        # Map columns to destination
+        with self.profiler.phase("transform"):
+            mapped_values, mapped_summary = self.map_column_values(
+                source_item,
+                column_mapping,
+                column_names,
+                source_board_name,
+                dest_board_name,
+                source_board_id=source_board_id,
+                dest_board_id=dest_board_id,
+                unknown_labels=unknown_labels
+            )
+            create_labels = unknown_labels == "create"
+
+            # Check the payload against the destination schema before sending it
+            mapped_values, problems = self.validate_column_values(
+                dest_board_id,
+                mapped_values,
+                column_names,
+                allow_new_labels=create_labels
+            )
+            for dest_col_id in list(mapped_summary):
+                if dest_col_id not in mapped_values:
+                    del mapped_summary[dest_col_id]
+
+            self.identities.stamp(dest_board_id, source_item, existing_item, mapped_values)
+
+        return {
+            "existing_item": existing_item,
+            "mapped_values": mapped_values,
+            "mapped_summary": mapped_summary,
+            "problems": problems,
+            "create_labels": create_labels
+        }
+
+    def prepare_items(
+        self,
+        source_items: List[Item],
+        dest_board_id: int,
+        column_mapping: Dict[str, str],
+        column_names: Dict[str, str],
+        source_board_name: str = "Source",
+        dest_board_name: str = "Destination",
+        source_board_id: int = None,
+        unknown_labels: str = "skip",
+        existing_items: Optional[List[Optional[Item]]] = None
+    ) -> List[Union[Dict, Exception]]:
+        """
+        prepare_item() for a whole page of items, mapping columns with a ColumnarTransform
+
+        Args:
+            existing_items: Destination item of each source item (None entries
+                            are created); looked up when omitted
+
+        Returns:
+            One plan dict (as returned by prepare_item) or Exception per item, in order
+        """
+        if existing_items is None:
+            with self.profiler.phase("destination lookup"):
+                existing_items = [self.find_existing_item(dest_board_id, item) for item in source_items]
+
+        with self.profiler.phase("transform"):
+            mapped = ColumnarTransform(
+                self,
+                column_mapping,
+                column_names,
+                source_board_name,
+                dest_board_name,
+                source_board_id=source_board_id,
+                dest_board_id=dest_board_id,
+                unknown_labels=unknown_labels
+            ).transform(source_items)
+            create_labels = unknown_labels == "create"
+
+            plans = []
+            for source_item, existing_item, result in zip(source_items, existing_items, mapped):
+                if isinstance(result, Exception):
+                    plans.append(result)
+                    continue
+
+                mapped_values, mapped_summary = result
+                try:
+                    # Check the payload against the destination schema before sending it
+                    mapped_values, problems = self.validate_column_values(
+                        dest_board_id,
+                        mapped_values,
+                        column_names,
+                        allow_new_labels=create_labels
+                    )
+                except Exception as e:
+                    plans.append(e)
+                    continue
+
+                for dest_col_id in list(mapped_summary):
+                    if dest_col_id not in mapped_values:
+                        del mapped_summary[dest_col_id]
+
+                self.identities.stamp(dest_board_id, source_item, existing_item, mapped_values)
+                plans.append({
+                    "existing_item": existing_item,
+                    "mapped_values": mapped_values,
+                    "mapped_summary": mapped_summary,
+                    "problems": problems,
+                    "create_labels": create_labels
+                })
+
+        return plans
+
+    def duplicate_items(
+        self,
+        source_items: List[Item],
+        dest_board_id: int,
+        dest_group_id: str,
+        column_mapping: Dict[str, str],
+        column_names: Dict[str, str] = None,
+        source_board_name: str = "Source",
+        dest_board_name: str = "Destination",
+        source_board_id: int = None,
+        unknown_labels: str = "skip",
+        subitem_mapping: Optional[Dict[str, str]] = None,
+        copy_updates: bool = False,
+        group_map: Optional[Dict[str, str]] = None,
+        existing_items: Optional[List[Optional[Item]]] = None,
+        prepared: Optional[List[Optional[Union[Dict, Exception]]]] = None
+    ) -> List[Dict]:
+        """
+        Duplicate many items without confirmation, writing them in batches
+
+        Creates and updates are sent as aliased mutations whose size adapts
+        to the destination board (see batch_writer.BatchWriter). With a
+        subitem_mapping, the subitems of all written items follow in shared
+        batches once their parents exist, and likewise their updates with
+        copy_updates. With a group_map (see group_mirror.GroupMirror), new
+        items go to the destination group mirroring their source group, and
+        dest_group_id is used for groups missing from the map. existing_items
+        pairs each source item with its destination item (None to create)
+        instead of looking items up by name. prepared holds payloads already
+        worked out by prepare_items() (None entries are prepared here).
+
+        Returns:
+            List of result dicts shaped like duplicate_item_from_data() results,
+            with an "error" key for items that failed
+        """
+        if column_names is None:
+            column_names = {}
+
+        prepared = list(prepared) if prepared is not None else [None] * len(source_items)
+        missing = [index for index, plan in enumerate(prepared) if plan is None]
+        if missing:
+            fresh = self.prepare_items(
+                [source_items[index] for index in missing],
+                dest_board_id,
+                column_mapping,
+                column_names,
+                source_board_name,
+                dest_board_name,
+                source_board_id=source_board_id,
+                unknown_labels=unknown_labels,
+                existing_items=[existing_items[index] for index in missing] if existing_items is not None else None
+            )
+            for index, plan in zip(missing, fresh):
+                prepared[index] = plan
+
+        plans = []
+        results = []
+        for source_item, plan in zip(source_items, prepared):
+            if isinstance(plan, Exception):
+                print(f"❌ Failed to prepare '{source_item.name}': {str(plan)}")
+                results.append(self._failed_result(source_item, plan))
+                continue
+
+            existing_item = plan["existing_item"]
+            group_id = group_map.get(source_item.group_id, dest_group_id) if group_map else dest_group_id
+            plans.append((source_item, plan, WriteOp(
+                kind="update" if existing_item else "create",
+                column_values=plan["mapped_values"],
+                item_name=source_item.name,
+                group_id=group_id,
+                item_id=existing_item.id if existing_item else None,
+                create_labels=plan["create_labels"],
+                source_item_id=source_item.id
+            )))
+
+        print(f"\n📝 Writing {len(plans)} item(s) to board {dest_board_id} in batches...")
+        with self.profiler.phase("mutation"):
+            written = self.writer.write(dest_board_id, [op for _, _, op in plans])
+
+        refused = 0
+        for (source_item, plan, op), result_item in zip(plans, written):
+            if isinstance(result_item, CircuitOpen):
+                refused += 1
+                results.append(self._failed_result(source_item, result_item))
+                continue
+            if isinstance(result_item, Exception):
+                print(f"❌ Failed to write '{source_item.name}': {str(result_item)}")
+                results.append(self._failed_result(source_item, result_item))
+                continue
+
+            is_update = op.kind == "update"
+            if not is_update:
+                self.remember_item(
+                    dest_board_id,
+                    Item(result_item["id"], result_item["name"], op.group_id, op.group_id),
+                    source_item_id=source_item.id
+                )
+
+            action = "UPDATED" if is_update else "CREATED"
+            skipped = f", {len(plan['problems'])} skipped" if plan["problems"] else ""
+            print(f"✅ {action} '{result_item['name']}' (ID: {result_item['id']}) - "
+                  f"{len(plan['mapped_summary'])} column(s){skipped}")
+
+            results.append({
+                "source_item_id": source_item.id,
+                "dest_item_id": result_item["id"],
+                "item_name": result_item["name"],
+                "action": action,
+                "was_updated": is_update,
+                "mapped_columns": len(plan["mapped_summary"]),
+                "unmapped_columns": len(plan["problems"])
+            })
+
+        if refused:
+            print(f"🔌 Circuit breaker open after {self.breaker.failures} failed API requests - "
+                  f"{refused} item(s) not written (last error: {self.breaker.last_error})")
+
+        written_items = {source_item.id: source_item for source_item, _, _ in plans}
+        succeeded = [result for result in results if result["action"] != "FAILED"]
+
+        if subitem_mapping is not None:
+            subitems = self.duplicate_subitems(
+                [
+                    (written_items[result["source_item_id"]], result["dest_item_id"], result["was_updated"])
+                    for result in succeeded
+                ],
+                dest_board_id,
+                subitem_mapping,
+                column_names,
+                source_board_id=source_board_id,
+                unknown_labels=unknown_labels
+            )
+            for result in results:
+                if result["dest_item_id"] and str(result["dest_item_id"]) in subitems:
+                    result["subitems"] = subitems[str(result["dest_item_id"])]
+
+        if copy_updates:
+            updates = self.duplicate_updates(
+                [(written_items[result["source_item_id"]], result["dest_item_id"]) for result in succeeded],
+                dest_board_id
+            )
+            for result in results:
+                if result["dest_item_id"] and str(result["dest_item_id"]) in updates:
+                    result["updates"] = updates[str(result["dest_item_id"])]
+
+        sizer = self.writer.sizer(dest_board_id)
+        print(f"📦 Batch size for board {dest_board_id} settled at {sizer.next_size()}")
+
+        return results
+
+    def duplicate_subitems(
+        self,
+        parents: List[Tuple[Item, str, bool]],
+        dest_board_id: int,
+        subitem_mapping: Dict[str, str],
+        column_names: Dict[str, str] = None,
+        source_board_id: int = None,
+        unknown_labels: str = "skip"
+    ) -> Dict[str, Dict[str, int]]:
+        """
+        Copy the subitems of duplicated items under their destination items
+
+        Subitems already under a destination item (matched by name) are updated
+        and the rest are created with create_subitem. The subitems of every
+        parent share the same aliased mutation batches, so items with dozens of
+        subitems cost a few requests rather than one per subitem.
+
+        Args:
+            parents: (source item fetched with subitems, destination item ID,
+                     whether the destination item existed before) per item
+            dest_board_id: Destination board ID (its subitem board is looked up)
+            subitem_mapping: Dict mapping source subitem column IDs to destination subitem column IDs
+            column_names: Dict mapping column IDs to display names
+            source_board_id: Source board ID (enables status/dropdown translation)
+            unknown_labels: Policy for labels missing on the destination ("skip", "create", "error")
+
+        Returns:
+            Dict mapping destination item ID to {"created", "updated", "failed"} counts
+        """
+        if column_names is None:
+            column_names = {}
+
+        parents = [(source_item, str(dest_item_id), existed) for source_item, dest_item_id, existed in parents
+                   if source_item.subitems]
+        if not parents:
+            return {}
+
+        # Subitems live on boards of their own, found through each board's subitems column
+        source_subitem_board = self.schema_cache.get(source_board_id).subitem_board_id if source_board_id else None
+        dest_subitem_board = self.schema_cache.get(dest_board_id).subitem_board_id
+        if dest_subitem_board is None and subitem_mapping:
+            print(f"⚠️  Board {dest_board_id} has no subitems yet - copying subitem names only")
+            subitem_mapping = {}
+
+        # Only items that existed before can already have subitems
+        with self.profiler.phase("destination lookup"):
+            self.build_subitem_indexes([dest_item_id for _, dest_item_id, existed in parents if existed])
+        with self._index_lock:
+            for _, dest_item_id, _ in parents:
+                self.subitem_indexes.setdefault(dest_item_id, {})
+
+        outcome = {dest_item_id: {"created": 0, "updated": 0, "failed": 0} for _, dest_item_id, _ in parents}
+        create_labels = unknown_labels == "create"
+        ops = []
+
+        with self.profiler.phase("transform"):
+            for source_item, dest_item_id, _ in parents:
+                existing = self.subitem_indexes[dest_item_id]
+                for subitem in source_item.subitems:
+                    try:
+                        mapped_values = {}
+                        if subitem_mapping:
+                            mapped_values, _ = self.map_column_values(
+                                subitem,
+                                subitem_mapping,
+                                column_names,
+                                source_board_id=source_subitem_board,
+                                dest_board_id=dest_subitem_board,
+                                unknown_labels=unknown_labels
+                            )
+                            mapped_values, _ = self.validate_column_values(
+                                dest_subitem_board,
+                                mapped_values,
+                                column_names,
+                                allow_new_labels=create_labels
+                            )
+                    except Exception as e:
+                        print(f"❌ Failed to prepare subitem '{subitem.name}': {str(e)}")
+                        outcome[dest_item_id]["failed"] += 1
+                        continue
+
+                    match = existing.get(subitem.name)
+                    if match and not mapped_values:
+                        # Nothing to change on a subitem that is already there
+                        continue
+
+                    ops.append(WriteOp(
+                        kind="update" if match else "create_subitem",
+                        column_values=mapped_values,
+                        item_name=subitem.name,
+                        item_id=match.id if match else None,
+                        create_labels=create_labels,
+                        source_item_id=subitem.id,
+                        parent_item_id=dest_item_id
+                    ))
+
+        if ops:
+            print(f"\n🌿 Writing {len(ops)} subitem(s) under {len(parents)} item(s) in batches...")
+            with self.profiler.phase("mutation"):
+                written = self.writer.write(dest_subitem_board or dest_board_id, ops)
+        else:
+            written = []
+
+        for op, result_item in zip(ops, written):
+            counts = outcome[op.parent_item_id]
+            if isinstance(result_item, Exception):
+                print(f"❌ Failed to write subitem '{op.item_name}': {str(result_item)}")
+                counts["failed"] += 1
+            elif op.kind == "update":
+                counts["updated"] += 1
+            else:
+                counts["created"] += 1
+                with self._index_lock:
+                    self.subitem_indexes[op.parent_item_id].setdefault(
+                        result_item["name"], Item(result_item["id"], result_item["name"])
+                    )
+
+        return outcome
+
+    def duplicate_updates(self, items: List[Tuple[Item, str]], dest_board_id: int) -> Dict[str, Dict[str, int]]:
+        """
+        Copy the updates (comments) of duplicated items to their destination items
+
+        Updates are posted oldest first with batched create_update mutations,
+        shared by every item in the call. Updates recorded in self.update_log
+        as already copied to the destination item are skipped, so re-runs
+        only add new ones (without an update log every run copies them again).
+
+        Args:
+            items: (source item fetched with updates, destination item ID) per item
+            dest_board_id: Destination board ID
+
+        Returns:
+            Dict mapping destination item ID to {"copied", "skipped", "failed"} counts
+        """
+        items = [(source_item, str(dest_item_id)) for source_item, dest_item_id in items if source_item.updates]
+        if not items:
+            return {}
+
+        copied = self.update_log.copied([dest_item_id for _, dest_item_id in items]) if self.update_log else {}
+
+        outcome = {}
+        ops = []
+        for source_item, dest_item_id in items:
+            done = copied.get(dest_item_id, set())
+            counts = outcome.setdefault(dest_item_id, {"copied": 0, "skipped": 0, "failed": 0})
+
+            # The API lists updates newest first; post the oldest first to keep the thread order
+            for update in reversed(source_item.updates):
+                if str(update.id) in done:
+                    counts["skipped"] += 1
+                    continue
+                ops.append(WriteOp(
+                    kind="create_update",
+                    column_values={},
+                    item_name=source_item.name,
+                    item_id=dest_item_id,
+                    source_item_id=update.id,
+                    body=self.format_update(update)
+                ))
+
+        if not ops:
+            return outcome
+
+        print(f"\n💬 Copying {len(ops)} update(s) to {len(items)} item(s) in batches...")
+        with self.profiler.phase("mutation"):
+            written = self.writer.write(dest_board_id, ops)
+
+        copies = []
+        for op, result in zip(ops, written):
+            counts = outcome[op.item_id]
+            if isinstance(result, Exception):
+                print(f"❌ Failed to copy an update of '{op.item_name}': {str(result)}")
+                counts["failed"] += 1
+            else:
+                counts["copied"] += 1
+                copies.append((op.source_item_id, op.item_id, result["id"]))
+
+        if self.update_log:
+            self.update_log.record_many(dest_board_id, copies)
+
+        return outcome
+
+    @staticmethod
+    def format_update(update: Update) -> str:
+        """Body of a copied update, crediting the original author and date"""
+        credit = html.escape(update.creator or "Unknown")
+        if update.created_at:
+            credit += f" · {html.escape(update.created_at[:10])}"
+        return f"<p><em>{credit}</em></p>{update.body}"
+
+    @staticmethod
+    def _failed_result(source_item: Item, error: Exception) -> Dict:
+        """Result dict for an item that could not be written"""
+        return {
+            "source_item_id": source_item.id,
+            "dest_item_id": None,
+            "item_name": source_item.name,
+            "action": "FAILED",
+            "was_updated": False,
+            "mapped_columns": 0,
+            "unmapped_columns": 0,
+            "error": str(error),
+            "circuit_open": isinstance(error, CircuitOpen)
+        }
+
+    def duplicate_item_from_data(
+        self,
+        source_item: Item,
+        dest_board_id: int,
+        dest_group_id: str,
+        column_mapping: Dict[str, str],
+        column_names: Dict[str, str] = None,
+        source_board_name: str = "Source",
+        dest_board_name: str = "Destination",
+        pillar_board_id: int = None,
+        pillar_group_id: str = None,
+        pillar_search_columns: List[str] = None,
+        confirm: bool = True,
+        source_board_id: int = None,
+        unknown_labels: str = "skip",
+        subitem_mapping: Optional[Dict[str, str]] = None,
+        copy_updates: bool = False
+    ) -> Dict:
+        """
+        Duplicate an item using existing item data
+        If item already exists in destination, updates it instead of creating a duplicate
+        
+        Args:
+            source_item: Source item (must hold the mapped columns)
+            dest_board_id: Destination board ID
+            dest_group_id: Destination group ID
+            column_mapping: Dict mapping source column IDs to destination column IDs
+            confirm: Ask for confirmation before writing (False for unattended runs)
+            source_board_id: Source board ID (enables status/dropdown translation)
+            unknown_labels: Policy for labels missing on the destination ("skip", "create", "error")
+            subitem_mapping: Subitem column mapping; copies the item's subitems (fetched
+                             with subitem_column_ids) after the item is written
+            copy_updates: Copy the item's updates (fetched with updates_limit) that
+                          were not copied before
+        
+        Returns:
+            Dict with duplicate results and mapping summary
+        """
+        print(f"🔍 Processing item: '{source_item.name}' (ID: {source_item.id})")
+        print(f"   From group: {source_item.group_title}")
+
+        # Use column names if provided, otherwise use IDs
+        if column_names is None:
+            column_names = {}
+
+        # Check for an existing item, map columns and validate the payload
+        print(f"\n🔎 Checking for existing item in destination board...")
+        plan = self.prepare_item(
+            source_item,
+            dest_board_id,
+            column_mapping,
+            column_names,
+            source_board_name,
+            dest_board_name,
+            source_board_id=source_board_id,
+            unknown_labels=unknown_labels
+        )
+        existing_item = plan["existing_item"]
+        mapped_values = plan["mapped_values"]
+        mapped_summary = plan["mapped_summary"]
+        unmapped_summary = plan["problems"]
+        create_labels = plan["create_labels"]
+        
+        if existing_item:
+            print(f"⚠️  Item already exists in destination!")
+            print(f"   Existing Item ID: {existing_item.id}")
+            print(f"   Group: {existing_item.group_title}")
+            print(f"   → Will UPDATE existing item instead of creating duplicate")
+            is_update = True
+            dest_item_id = existing_item.id
+        else:
+            print(f"✅ No duplicate found - will create new item")
+            is_update = False
+            dest_item_id = None
+        
+        # Extract column values
+        source_columns = source_item.columns
         
         # Print preview summary and get confirmation
-        action_text = "UPDATE" if is_update else "CREATE"
+        with self.profiler.phase("preview"):
+            action_text = "UPDATE" if is_update else "CREATE"
 
-        # Build table data first to calculate column widths
-        table_rows = []
+            # Build table data first to calculate column widths
+            table_rows = []
 
-        # Name row (always mapped)
-        table_rows.append(("Name", "Name", source_item['name']))
+            # Name row (always mapped)
+            table_rows.append(("Name", "Name", source_item.name))
 
-        # Other columns
-        for source_col_id, dest_col_id in column_mapping.items():
-            if source_col_id in source_columns:
-                col = source_columns[source_col_id]
+            # Other columns
+            for source_col_id, dest_col_id in column_mapping.items():
+                if source_col_id in source_columns:
+                    col = source_columns[source_col_id]
 
-                # Skip empty values
-                if not col["value"] or col["value"] == "null":
-                    continue
+                    # Skip empty values and columns dropped by validation
+                    if col.is_empty() or dest_col_id not in mapped_values:
+                        continue
 
-                # Get friendly names
-                source_name = column_names.get(source_col_id, source_col_id)
-                dest_name = column_names.get(dest_col_id, dest_col_id)
+                    # Get friendly names
+                    source_name = column_names.get(source_col_id, source_col_id)
+                    dest_name = column_names.get(dest_col_id, dest_col_id)
 
-                # Get display value
-                try:
-                    value_data = json.loads(col["value"])
+                    # Get display value
+                    try:
+                        value_data = json_codec.loads(col.value)
 
-                    if col["type"] == "link":
-                        display_value = value_data.get("url", "")
-                    elif col["type"] == "board-relation":
-                        linked_items = value_data.get("linkedPulseIds", [])
-                        display_value = f"{len(linked_items)} linked item(s)" if linked_items else ""
-                    else:
-                        display_value = col["text"] or ""
-                except:
-                    display_value = col["text"] or ""
+                        if col.type == "link":
+                            display_value = value_data.get("url", "")
+                        elif is_relation_column(col.type):
+                            linked_items = mapped_values[dest_col_id]["item_ids"]
+                            display_value = f"{len(linked_items)} linked item(s)" if linked_items else ""
+                        else:
+                            display_value = col.text or ""
+                    except:
+                        display_value = col.text or ""
+
+                    table_rows.append((source_name, dest_name, display_value))
+
+            # Calculate maximum widths for each column
+            max_source = max(len(row[0]) for row in table_rows) if table_rows else 20
+            max_dest = max(len(row[1]) for row in table_rows) if table_rows else 20
+            max_value = max(len(str(row[2])) for row in table_rows) if table_rows else 20
 
-                table_rows.append((source_name, dest_name, display_value))
+            # Create header text with board names
+            source_header = f"Source Column: ({source_board_name})"
+            dest_header = f"Destination Column: ({dest_board_name})"
 
-        # Calculate maximum widths for each column
-        max_source = max(len(row[0]) for row in table_rows) if table_rows else 20
-        max_dest = max(len(row[1]) for row in table_rows) if table_rows else 20
-        max_value = max(len(str(row[2])) for row in table_rows) if table_rows else 20
+            # Add some padding and account for header text
+            max_source = max(max_source, len(source_header))
+            max_dest = max(max_dest, len(dest_header))
+            max_value = max(max_value, len("Value"))
 
-        # Create header text with board names
-        source_header = f"Source Column: ({source_board_name})"
-        dest_header = f"Destination Column: ({dest_board_name})"
+            total_width = max_source + max_dest + max_value + 6  # 6 for separators
 
-        # Add some padding and account for header text
-        max_source = max(max_source, len(source_header))
-        max_dest = max(max_dest, len(dest_header))
-        max_value = max(max_value, len("Value"))
+            print("=" * total_width)
+            print(f"📋 PREVIEW - Ready to {action_text}")
+            print("=" * total_width)
 
-        total_width = max_source + max_dest + max_value + 6  # 6 for separators
+            print(f"\n✅ Will Map ({len(table_rows)} columns):\n")
 
-        print("=" * total_width)
-        print(f"📋 PREVIEW - Ready to {action_text}")
-        print("=" * total_width)
+            # Print table header
+            print(f"{source_header:<{max_source}} | {dest_header:<{max_dest}} | Value")
+            print(f"{'-' * max_source} | {'-' * max_dest} | {'-' * max_value}")
 
-        print(f"\n✅ Will Map ({len(table_rows)} columns):\n")
+            # Print table rows
+            for source_col, dest_col, value in table_rows:
+                print(f"{source_col:<{max_source}} | {dest_col:<{max_dest}} | {value}")
 
-        # Print table header
-        print(f"{source_header:<{max_source}} | {dest_header:<{max_dest}} | Value")
-        print(f"{'-' * max_source} | {'-' * max_dest} | {'-' * max_value}")
+            if unmapped_summary:
+                print(f"\n⚠️  Will Skip ({len(unmapped_summary)} columns rejected by destination schema):")
+                for problem in unmapped_summary:
+                    print(f"  • {problem}")
 
-        # Print table rows
-        for source_col, dest_col, value in table_rows:
-            print(f"{source_col:<{max_source}} | {dest_col:<{max_dest}} | {value}")
+            if subitem_mapping is not None and source_item.subitems:
+                print(f"\n🌿 Will also copy {len(source_item.subitems)} subitem(s) "
+                      f"({len(subitem_mapping)} subitem column(s) mapped)")
 
-        print("\n" + "=" * total_width)
+            if copy_updates and source_item.updates:
+                print(f"\n💬 Will also copy up to {len(source_item.updates)} update(s) "
+                      f"(updates copied before are skipped)")
+
+            print("\n" + "=" * total_width)
 
         # Get user confirmation
-        print(f"\n⚠️  Ready to {action_text} this item in the destination board.")
-        response = input(f"   Continue with {action_text.lower()}? (y/n): ").strip().lower()
+        if confirm:
+            print(f"\n⚠️  Ready to {action_text} this item in the destination board.")
+            with self.profiler.phase("input wait"):
+                response = input(f"   Continue with {action_text.lower()}? (y/n): ").strip().lower()
+        else:
+            response = 'y'
 
         if response != 'y':
             print(f"❌ {action_text} cancelled by user.")
             return {
-                "source_item_id": source_item["id"],
+                "source_item_id": source_item.id,
                 "dest_item_id": None,
-                "item_name": source_item["name"],
+                "item_name": source_item.name,
                 "action": "CANCELLED",
                 "was_updated": False,
                 "mapped_columns": 0,
@@ -463,40 +2043,81 @@ class MondayItemDuplicator:
             }
 
         # Create or update item
-        if is_update:
-            print(f"\n📝 Updating existing item {dest_item_id} in board {dest_board_id}...")
-            result_item = self.update_item_column_values(
-                dest_board_id,
-                dest_item_id,
-                mapped_values
-            )
-            print(f"✅ Item updated successfully! Item ID: {result_item['id']}\n")
-            action = "UPDATED"
-        else:
-            print(f"\n📊 Creating new item in board {dest_board_id}, group {dest_group_id}...")
-            result_item = self.create_item_with_values(
+        with self.profiler.phase("mutation"):
+            if is_update:
+                print(f"\n📝 Updating existing item {dest_item_id} in board {dest_board_id}...")
+                result_item = self.update_item_column_values(
+                    dest_board_id,
+                    dest_item_id,
+                    mapped_values,
+                    create_labels_if_missing=create_labels,
+                    item_name=source_item.name
+                )
+                print(f"✅ Item updated successfully! Item ID: {result_item['id']}\n")
+                action = "UPDATED"
+            else:
+                print(f"\n📊 Creating new item in board {dest_board_id}, group {dest_group_id}...")
+                result_item = self.create_item_safely(
+                    dest_board_id,
+                    dest_group_id,
+                    source_item.name,
+                    mapped_values,
+                    create_labels_if_missing=create_labels,
+                    source_item_id=source_item.id
+                )
+                self.remember_item(
+                    dest_board_id,
+                    Item(result_item["id"], result_item["name"], dest_group_id, dest_group_id),
+                    source_item_id=source_item.id
+                )
+                print(f"✅ Item created successfully! New Item ID: {result_item['id']}\n")
+                action = "CREATED"
+
+        subitems = None
+        if subitem_mapping is not None and source_item.subitems:
+            subitems = self.duplicate_subitems(
+                [(source_item, result_item["id"], is_update)],
                 dest_board_id,
-                dest_group_id,
-                source_item["name"],
-                mapped_values
-            )
-            print(f"✅ Item created successfully! New Item ID: {result_item['id']}\n")
-            action = "CREATED"
+                subitem_mapping,
+                column_names,
+                source_board_id=source_board_id,
+                unknown_labels=unknown_labels
+            ).get(str(result_item["id"]))
+
+        updates = None
+        if copy_updates and source_item.updates:
+            updates = self.duplicate_updates(
+                [(source_item, result_item["id"])], dest_board_id
+            ).get(str(result_item["id"]))
 
         # Print final summary
-        print("=" * 70)
-        print(f"📋 FINAL SUMMARY ({action})")
-        print("=" * 70)
-
-        print(f"\n✅ Successfully Mapped ({len(mapped_summary)} columns):")
-        print(f"  • Name: '{result_item['name']}'")
-        for item in mapped_summary:
-            print(f"  • {item}")
-
-        print("\n" + "=" * 70)
+        with self.profiler.phase("preview"):
+            print("=" * 70)
+            print(f"📋 FINAL SUMMARY ({action})")
+            print("=" * 70)
+
+            print(f"\n✅ Successfully Mapped ({len(mapped_summary)} columns):")
+            print(f"  • Name: '{result_item['name']}'")
+            for item in mapped_summary.values():
+                print(f"  • {item}")
+
+            if unmapped_summary:
+                print(f"\n⚠️  Skipped ({len(unmapped_summary)} columns):")
+                for problem in unmapped_summary:
+                    print(f"  • {problem}")
+
+            if subitems:
+                failed = f", {subitems['failed']} failed" if subitems["failed"] else ""
+                print(f"\n🌿 Subitems: {subitems['created']} created, {subitems['updated']} updated{failed}")
+
+            if updates:
+                failed = f", {updates['failed']} failed" if updates["failed"] else ""
+                print(f"\n💬 Updates: {updates['copied']} copied, {updates['skipped']} already copied{failed}")
+
+            print("\n" + "=" * 70)
         
-        return {
-            "source_item_id": source_item["id"],
+        result = {
+            "source_item_id": source_item.id,
             "dest_item_id": result_item["id"],
             "item_name": result_item["name"],
             "action": action,
@@ -504,10 +2125,19 @@ class MondayItemDuplicator:
             "mapped_columns": len(mapped_summary),
             "unmapped_columns": len(unmapped_summary)
         }
+        if subitems:
+            result["subitems"] = subitems
+        if updates:
+            result["updates"] = updates
+        return result
 
 
 def main():
     """Main function to run the duplicator"""
+    from dotenv import load_dotenv
+
+    # Load environment variables from .env file
+    load_dotenv()
 
     # ============================================================================
     # Configuration - Load from .env file
@@ -647,7 +2277,7 @@ def main():
             
             # Get all items from source group
             print(f"🔍 Fetching items from {SOURCE_BOARD_NAME}...")
-            items = duplicator.get_items_from_group(SOURCE_BOARD_ID, SOURCE_GROUP_ID)
+            items = duplicator.get_items_from_group(SOURCE_BOARD_ID, SOURCE_GROUP_ID, list(COLUMN_MAPPING))
             
             if not items:
                 print(f"⚠️  No items found in group '{SOURCE_GROUP_ID}'")
@@ -690,7 +2320,7 @@ def main():
                         created_count += 1
 
                 except Exception as e:
-                    print(f"❌ Failed to process '{item['name']}': {str(e)}")
+                    print(f"❌ Failed to process '{item.name}': {str(e)}")
                     continue
 
             # Print summary
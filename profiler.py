@@ -0,0 +1,203 @@
+"""
+Profiler for Monday.com Item Duplicator
+Per-phase timing of a run (network, CPU work, console output, waiting for input)
+"""
+
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Tuple
+
+# Phases in report order
+PHASES = [
+    "source fetch",
+    "destination lookup",
+    "transform",
+    "preview",
+    "input wait",
+    "mutation",
+    "console output",
+    "other",
+]
+
+
+class PhaseProfiler:
+    """
+    Attributes wall-clock time to named phases, per item and in aggregate
+
+    Phases nest: time is charged to the innermost active phase only, so the
+    phase totals add up to the profiled wall time. Meant for single-threaded
+    runs (run.py); when disabled, phase() costs one attribute check.
+    """
+
+    def __init__(self, enabled: bool = True):
+        """
+        Initialize profiler
+
+        Args:
+            enabled: Record timings (False makes every method a no-op)
+        """
+        self.enabled = enabled
+        self.totals: Dict[str, float] = {}
+        self.items: List[Tuple[str, Dict[str, float]]] = []
+
+        self._stack: List[str] = []
+        self._mark = 0.0
+        self._item: Optional[Dict[str, float]] = None
+        self._started_at: Optional[float] = None
+        self._stdout = None
+
+    def _charge(self, now: float):
+        """Charge the time since the last mark to the innermost phase"""
+        phase = self._stack[-1] if self._stack else "other"
+        elapsed = now - self._mark
+        self.totals[phase] = self.totals.get(phase, 0.0) + elapsed
+        if self._item is not None:
+            self._item[phase] = self._item.get(phase, 0.0) + elapsed
+        self._mark = now
+
+    def start(self):
+        """Start profiling and time console output through sys.stdout"""
+        if not self.enabled:
+            return
+        self._started_at = self._mark = time.perf_counter()
+        self._stdout = sys.stdout
+        sys.stdout = _TimedStream(sys.stdout, self)
+
+    def stop(self):
+        """Stop profiling and restore sys.stdout"""
+        if not self.enabled or self._started_at is None:
+            return
+        self._charge(time.perf_counter())
+        if self._stdout is not None:
+            sys.stdout = self._stdout
+            self._stdout = None
+
+    @contextmanager
+    def phase(self, name: str):
+        """Charge the time spent in the block to a phase"""
+        if not self.enabled or self._started_at is None:
+            yield
+            return
+
+        self._charge(time.perf_counter())
+        self._stack.append(name)
+        try:
+            yield
+        finally:
+            self._charge(time.perf_counter())
+            self._stack.pop()
+
+    @contextmanager
+    def item(self, name: str):
+        """Collect the phases of one item separately as well"""
+        if not self.enabled or self._started_at is None:
+            yield
+            return
+
+        self._charge(time.perf_counter())
+        self._item = {}
+        try:
+            yield
+        finally:
+            self._charge(time.perf_counter())
+            self.items.append((name, self._item))
+            self._item = None
+
+    def report(self, max_items: int = 20):
+        """Print the aggregate and per-item breakdown"""
+        if not self.enabled or self._started_at is None:
+            return
+
+        total = sum(self.totals.values()) or 1e-9
+        phases = [p for p in PHASES if p in self.totals] + [p for p in self.totals if p not in PHASES]
+
+        print(f"\n{'=' * 80}")
+        print(f"⏱️  PROFILE - {total:.2f}s total, {len(self.items)} item(s)")
+        print(f"{'=' * 80}")
+        print(f"\n{'Phase':<20} | {'Seconds':>9} | {'Share':>6} | {'Per item':>9}")
+        print(f"{'-' * 20} | {'-' * 9} | {'-' * 6} | {'-' * 9}")
+        for phase in phases:
+            seconds = self.totals[phase]
+            per_item = f"{seconds / len(self.items):.3f}" if self.items else "-"
+            print(f"{phase:<20} | {seconds:>9.3f} | {seconds / total:>6.1%} | {per_item:>9}")
+
+        if self.items:
+            slowest = sorted(self.items, key=lambda entry: -sum(entry[1].values()))[:max_items]
+            title = "Items" if len(self.items) <= max_items else f"Slowest {max_items} items"
+            print(f"\n{title}:")
+            for name, item_phases in slowest:
+                breakdown = ", ".join(
+                    f"{phase} {seconds:.3f}s"
+                    for phase, seconds in sorted(item_phases.items(), key=lambda kv: -kv[1])
+                    if seconds >= 0.0005
+                )
+                print(f"  • {name}: {sum(item_phases.values()):.3f}s ({breakdown})")
+
+
+class _TimedStream:
+    """sys.stdout wrapper charging writes to the "console output" phase"""
+
+    def __init__(self, stream, profiler: PhaseProfiler):
+        self._stream = stream
+        self._profiler = profiler
+
+    def write(self, text):
+        with self._profiler.phase("console output"):
+            return self._stream.write(text)
+
+    def flush(self):
+        with self._profiler.phase("console output"):
+            return self._stream.flush()
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+
+class StackSampler:
+    """Samples the main thread's stack and writes collapsed stacks (flamegraph input)"""
+
+    def __init__(self, interval: float = 0.005):
+        """
+        Initialize sampler
+
+        Args:
+            interval: Seconds between samples
+        """
+        self.interval = interval
+        self.counts: Dict[str, int] = {}
+        self._thread_id = threading.get_ident()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _run(self):
+        """Sampling loop"""
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self._thread_id)
+            frames = []
+            while frame is not None:
+                code = frame.f_code
+                frames.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                frame = frame.f_back
+            if frames:
+                stack = ";".join(reversed(frames))
+                self.counts[stack] = self.counts.get(stack, 0) + 1
+
+    def start(self):
+        """Start sampling in a background thread"""
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop sampling"""
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+
+    def write(self, path: str):
+        """Write `stack;frames count` lines (flamegraph.pl / speedscope format)"""
+        with open(path, "w", encoding="utf-8") as f:
+            for stack, count in sorted(self.counts.items()):
+                f.write(f"{stack} {count}\n")
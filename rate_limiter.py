@@ -0,0 +1,103 @@
+"""
+Rate Limiter for Monday.com Item Duplicator
+Token bucket shared by every caller of one MondayItemDuplicator client
+"""
+
+import threading
+import time
+
+
+class RateLimiter:
+    """Thread-safe token bucket limiting API requests per minute"""
+
+    def __init__(self, requests_per_minute: int = 300, burst: int = None):
+        """
+        Initialize rate limiter
+
+        Args:
+            requests_per_minute: Sustained request budget
+            burst: Maximum tokens that can accumulate (defaults to 1/10 of the budget)
+        """
+        if requests_per_minute <= 0:
+            raise ValueError("requests_per_minute must be positive")
+
+        self.rate = requests_per_minute / 60.0
+        self.capacity = float(burst or max(1, requests_per_minute // 10))
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        """Add the tokens earned since the last refill"""
+        elapsed = now - self.updated_at
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+        self.updated_at = now
+
+    def acquire(self, cost: float = 1.0):
+        """
+        Block until `cost` tokens are available and consume them
+
+        Args:
+            cost: Number of tokens this request spends
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self.tokens >= cost:
+                    self.tokens -= cost
+                    return
+                wait = (cost - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+class SharedRateLimiter(RateLimiter):
+    """
+    Token bucket shared by several processes
+
+    The bucket lives in shared memory, so every worker process started with
+    this limiter (e.g. through a multiprocessing.Pool initializer) spends
+    the same budget.
+    """
+
+    def __init__(self, requests_per_minute: int = 300, burst: int = None):
+        """
+        Initialize shared rate limiter
+
+        Args:
+            requests_per_minute: Sustained request budget of all processes together
+            burst: Maximum tokens that can accumulate (defaults to 1/10 of the budget)
+        """
+        import multiprocessing
+
+        super().__init__(requests_per_minute, burst)
+
+        # [tokens, updated_at, spent] - time.monotonic() is system-wide, so one clock serves every process
+        self._state = multiprocessing.Array("d", [self.capacity, time.monotonic(), 0.0])
+        self._lock = self._state.get_lock()
+
+    @property
+    def spent(self) -> float:
+        """Tokens spent by all processes so far"""
+        with self._lock:
+            return self._state[2]
+
+    def acquire(self, cost: float = 1.0):
+        """
+        Block until `cost` tokens are available in the shared bucket and consume them
+
+        Args:
+            cost: Number of tokens this request spends
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                tokens = min(self.capacity, self._state[0] + (now - self._state[1]) * self.rate)
+                self._state[1] = now
+                if tokens >= cost:
+                    self._state[0] = tokens - cost
+                    self._state[2] += cost
+                    return
+                self._state[0] = tokens
+                wait = (cost - tokens) / self.rate
+            time.sleep(wait)
@@ -0,0 +1,158 @@
+"""
+Board Relation Remapping for Monday.com Item Duplicator
+Resolves linked item IDs to their counterparts on the destination's linked board
+"""
+
+import json_codec
+import threading
+from typing import Dict, List, Optional, Tuple
+from item_model import Item
+
+# The API has reported connect-boards columns under both spellings
+RELATION_TYPES = ("board-relation", "board_relation")
+
+
+def is_relation_column(column_type: str) -> bool:
+    """Check whether a column value's type is a board relation (connect boards) column"""
+    return column_type in RELATION_TYPES
+
+
+class RelationRemapper:
+    """Maps linked source items to items on the boards a destination column links to"""
+
+    def __init__(self, duplicator):
+        """
+        Initialize relation remapper
+
+        Args:
+            duplicator: MondayItemDuplicator used for lookups (shares its schema cache and indexes)
+        """
+        self.duplicator = duplicator
+
+        # Linked item ID -> (board ID, item name), filled in bulk
+        self.linked_items: Dict[int, Tuple[int, str]] = {}
+        # (linked item ID, target board IDs) -> remapped item ID or None
+        self.item_map: Dict[tuple, Optional[int]] = {}
+        self._lock = threading.Lock()
+
+    def target_boards(self, dest_board_id: int, dest_column_id: str) -> List[int]:
+        """Get the boards a destination relation column links to"""
+        column = self.duplicator.schema_cache.get(dest_board_id).columns.get(dest_column_id)
+        return column.linked_board_ids if column else []
+
+    def fetch_linked_items(self, item_ids: List[int]):
+        """Fetch board and name of linked items not seen yet (100 IDs per request)"""
+        query = """
+        query ($itemIds: [ID!]) {
+            items(ids: $itemIds, limit: 100) {
+                id
+                name
+                board {
+                    id
+                }
+            }
+        }
+        """
+
+        missing = [item_id for item_id in dict.fromkeys(item_ids) if item_id not in self.linked_items]
+
+        for start in range(0, len(missing), 100):
+            chunk = missing[start:start + 100]
+            data = self.duplicator.execute_query(query, {"itemIds": [str(item_id) for item_id in chunk]})
+
+            with self._lock:
+                for item in data["items"]:
+                    self.linked_items[int(item["id"])] = (int(item["board"]["id"]), item["name"])
+
+    def remap(self, item_ids: List[int], target_board_ids: List[int]) -> Tuple[List[int], List[int]]:
+        """
+        Remap linked item IDs onto the target boards
+
+        Items that already live on a target board keep their ID; others are
+        matched by name on the target boards with batched name lookups.
+
+        Args:
+            item_ids: Linked item IDs from the source column
+            target_board_ids: Boards the destination column links to
+
+        Returns:
+            Tuple of (remapped item IDs, item IDs that could not be resolved)
+        """
+        if not target_board_ids:
+            return list(item_ids), []
+
+        targets = tuple(sorted(target_board_ids))
+        pending = [item_id for item_id in item_ids if (item_id, targets) not in self.item_map]
+
+        if pending:
+            self.fetch_linked_items(pending)
+
+            resolved_ids: Dict[int, Optional[int]] = {}
+            by_name: Dict[str, List[int]] = {}
+
+            for item_id in pending:
+                linked = self.linked_items.get(item_id)
+                if linked and linked[0] in targets:
+                    resolved_ids[item_id] = item_id
+                elif linked:
+                    by_name.setdefault(linked[1], []).append(item_id)
+
+            # Match the remaining items by name, one batched lookup per target board
+            for target_board_id in targets:
+                if not by_name:
+                    break
+
+                index = self.duplicator.destination_indexes.get(target_board_id)
+                if index is not None:
+                    matches = {name: index[name] for name in by_name if name in index}
+                else:
+                    matches = self.duplicator.get_items_by_names(target_board_id, list(by_name), column_ids=[])
+
+                for name, match in matches.items():
+                    for item_id in by_name.pop(name, []):
+                        resolved_ids[item_id] = int(match.id)
+
+            with self._lock:
+                for item_id in pending:
+                    self.item_map[(item_id, targets)] = resolved_ids.get(item_id)
+
+        remapped = []
+        unresolved = []
+        for item_id in item_ids:
+            resolved = self.item_map[(item_id, targets)]
+            if resolved is None:
+                unresolved.append(item_id)
+            elif resolved not in remapped:
+                remapped.append(resolved)
+
+        return remapped, unresolved
+
+    def prefetch(self, items: List[Item], column_mapping: Dict[str, str], dest_board_id: int):
+        """
+        Resolve every linked item referenced by a batch of source items up front
+
+        Args:
+            items: Source items about to be duplicated
+            column_mapping: Dict mapping source column IDs to destination column IDs
+            dest_board_id: Destination board ID
+        """
+        by_targets: Dict[tuple, List[int]] = {}
+
+        for item in items:
+            for col in item.columns.values():
+                if not is_relation_column(col.type) or col.id not in column_mapping:
+                    continue
+                if col.is_empty():
+                    continue
+
+                try:
+                    linked = json_codec.loads(col.value).get("linkedPulseIds", [])
+                except json_codec.JSONDecodeError:
+                    continue
+
+                targets = tuple(self.target_boards(dest_board_id, column_mapping[col.id]))
+                by_targets.setdefault(targets, []).extend(int(link["linkedPulseId"]) for link in linked)
+
+        for targets, item_ids in by_targets.items():
+            self.fetch_linked_items(item_ids)
+            self.remap(item_ids, list(targets))
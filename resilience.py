@@ -0,0 +1,298 @@
+"""
+Resilience for Monday.com Item Duplicator
+Request deadlines, hedged reads and a circuit breaker for the API client
+"""
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Optional
+
+import requests
+
+# Server errors, matched in the "Query failed with status ..." errors raised by the client
+UNHEALTHY_STATUS_MARKERS = ("status 500", "status 502", "status 503", "status 504")
+
+
+class DeadlineExceeded(TimeoutError):
+    """A request did not complete within its deadline"""
+
+
+# Errors after which a request may or may not have been applied by Monday.com
+# (TimeoutError covers DeadlineExceeded; ChunkedEncodingError is a cut-off response)
+AMBIGUOUS_ERRORS = (
+    requests.exceptions.Timeout,
+    requests.exceptions.ConnectionError,
+    requests.exceptions.ChunkedEncodingError,
+    TimeoutError,
+    ConnectionError,
+)
+
+
+class CircuitOpen(Exception):
+    """The API has been failing and requests are refused until the cooldown ends"""
+
+
+def is_ambiguous(error: BaseException) -> bool:
+    """
+    Check whether a failed request might still have been applied
+
+    Timeouts, dropped connections and gateway errors are ambiguous; GraphQL
+    errors, validation errors and rate limiting are definite rejections, and
+    so is a connect timeout, which fails before anything is sent.
+    """
+    if isinstance(error, requests.exceptions.ConnectTimeout):
+        return False
+    if isinstance(error, AMBIGUOUS_ERRORS):
+        return True
+    message = str(error).lower()
+    return any(marker in message for marker in UNHEALTHY_STATUS_MARKERS)
+
+
+def is_unhealthy(error: BaseException) -> bool:
+    """Check whether a failed request says the API is unreachable or failing (see CircuitBreaker)"""
+    return isinstance(error, requests.exceptions.ConnectTimeout) or is_ambiguous(error)
+
+
+def call_with_deadline(fn: Callable[[], Any], deadline: float, description: str = "Request") -> Any:
+    """
+    Run fn, giving up on it after deadline seconds
+
+    fn runs on a daemon thread. If it is still running at the deadline it is
+    left to finish in the background (its result is dropped), because a
+    blocked socket read can't be interrupted from another thread.
+
+    Raises:
+        DeadlineExceeded: If fn did not return in time (errors of fn are re-raised)
+    """
+    outcome = {}
+    done = threading.Event()
+
+    def run():
+        try:
+            outcome["result"] = fn()
+        except BaseException as e:
+            outcome["error"] = e
+        finally:
+            done.set()
+
+    threading.Thread(target=run, name="deadline", daemon=True).start()
+    if not done.wait(deadline):
+        raise DeadlineExceeded(f"{description} timed out: no complete response within {deadline:g}s")
+    if "error" in outcome:
+        raise outcome["error"]
+    return outcome["result"]
+
+
+class CircuitBreaker:
+    """
+    Stops sending requests while the API is failing
+
+    Only failures that say the API is unhealthy count (timeouts, missed
+    deadlines, dropped connections, 5xx), not GraphQL or validation errors.
+    The circuit opens when at least failure_threshold of the last window
+    requests failed and they make up at least half of them, so a run of
+    timed-out writes trips it even when the reads between them succeed.
+    While open, every request fails at once with CircuitOpen. Once the
+    cooldown has passed, one trial request is let through: success closes
+    the circuit, failure reopens it.
+    """
+
+    def __init__(self, failure_threshold: int = 5, window: int = 20, cooldown: float = 60.0):
+        """
+        Initialize circuit breaker
+
+        Args:
+            failure_threshold: Failures among recent requests that open the circuit
+            window: Recent requests the failures are counted over
+            cooldown: Seconds the circuit stays open before a trial request
+        """
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+
+        # True for each recent request that failed
+        self.outcomes = deque(maxlen=window)
+        self.last_error: Optional[str] = None
+        self.opened_at: Optional[float] = None
+        self.trips = 0
+        self._trial = False
+        self._trial_started = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def failures(self) -> int:
+        """Failed requests among the recent ones"""
+        return sum(self.outcomes)
+
+    @property
+    def is_open(self) -> bool:
+        """Check whether requests are currently refused"""
+        return self.opened_at is not None
+
+    def remaining(self) -> float:
+        """Seconds until the next trial request is allowed (0 if closed)"""
+        with self._lock:
+            if self.opened_at is None:
+                return 0.0
+            return max(0.0, self.opened_at + self.cooldown - time.monotonic())
+
+    def before_call(self):
+        """
+        Check a request may be sent
+
+        Raises:
+            CircuitOpen: While the circuit is open (or its trial request is in flight)
+        """
+        with self._lock:
+            if self.opened_at is None:
+                return
+            now = time.monotonic()
+            remaining = self.opened_at + self.cooldown - now
+            # A trial that never reported back (e.g. an abandoned stream) expires after a cooldown
+            if remaining <= 0 and (not self._trial or now - self._trial_started > self.cooldown):
+                self._trial = True
+                self._trial_started = now
+                return
+            raise CircuitOpen(
+                f"Circuit breaker open after {self.failures} failed API requests of the last "
+                f"{len(self.outcomes)} (last: {self.last_error}); next attempt in {max(0, remaining):.0f}s"
+            )
+
+    def record_success(self):
+        """Record a request that reached a healthy API"""
+        with self._lock:
+            if self.opened_at is not None:
+                # The trial request succeeded - start counting afresh
+                self.outcomes.clear()
+                self.opened_at = None
+                self._trial = False
+            self.outcomes.append(False)
+
+    def record_failure(self, error: BaseException):
+        """
+        Record a failed request
+
+        Errors that don't point at API health (GraphQL errors, 4xx such as
+        429) don't count toward opening the circuit, but they still end a
+        trial request: the API answered, so the circuit closes.
+        """
+        if not is_unhealthy(error):
+            with self._lock:
+                if self._trial:
+                    self.outcomes.clear()
+                    self.opened_at = None
+                    self._trial = False
+            return
+
+        with self._lock:
+            self.outcomes.append(True)
+            self.last_error = str(error)[:200]
+            failures = sum(self.outcomes)
+            if self._trial:
+                # The trial failed - stay open for another cooldown
+                self.opened_at = time.monotonic()
+                self._trial = False
+            elif self.opened_at is None and failures >= self.failure_threshold and failures * 2 >= len(self.outcomes):
+                self.opened_at = time.monotonic()
+                self.trips += 1
+
+
+class HedgedReader:
+    """
+    Sends a duplicate of a slow read and returns whichever response comes first
+
+    The duplicate is fired once a read has taken longer than the 95th
+    percentile of recent read latencies, so about one read in twenty is
+    hedged when the API behaves and a single stalled connection no longer
+    holds up the run. Only use it for idempotent requests.
+    """
+
+    def __init__(
+        self,
+        min_delay: float = 0.5,
+        max_delay: float = 10.0,
+        min_samples: int = 20,
+        window: int = 200,
+        max_workers: int = 32
+    ):
+        """
+        Initialize hedged reader
+
+        Args:
+            min_delay: Shortest wait before hedging, in seconds
+            max_delay: Longest wait before hedging, in seconds
+            min_samples: Latencies to measure before hedging starts
+            window: Recent latencies the percentile is taken over
+            max_workers: Threads running reads and their duplicates
+        """
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.min_samples = min_samples
+        self.max_workers = max_workers
+        self.latencies = deque(maxlen=window)
+
+        # Reads that were hedged, and how many of those the duplicate won
+        self.hedged = 0
+        self.hedge_wins = 0
+
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def delay(self) -> Optional[float]:
+        """Wait before hedging a read (None until enough latencies are measured)"""
+        with self._lock:
+            if len(self.latencies) < self.min_samples:
+                return None
+            ordered = sorted(self.latencies)
+        p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+        return min(self.max_delay, max(self.min_delay, p95))
+
+    def call(self, fn: Callable[[], Any]) -> Any:
+        """
+        Run a read, hedging it if it is slower than usual
+
+        Returns:
+            The first successful result (if both attempts fail, the first
+            error is raised)
+        """
+        delay = self.delay()
+        if delay is None:
+            return self._timed(fn)
+
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="hedge")
+            executor = self._executor
+
+        first = executor.submit(self._timed, fn)
+        done, _ = wait([first], timeout=delay)
+        if done:
+            return first.result()
+
+        with self._lock:
+            self.hedged += 1
+        second = executor.submit(self._timed, fn)
+
+        # The loser keeps running in the background; its response is dropped
+        futures = [first, second]
+        errors = []
+        while futures:
+            done, pending = wait(futures, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    if future is second:
+                        with self._lock:
+                            self.hedge_wins += 1
+                    return future.result()
+                errors.append(future.exception())
+            futures = list(pending)
+        raise errors[0]
+
+    def _timed(self, fn: Callable[[], Any]) -> Any:
+        """Run fn and record its latency if it succeeds"""
+        started = time.monotonic()
+        result = fn()
+        with self._lock:
+            self.latencies.append(time.monotonic() - started)
+        return result
@@ -7,12 +7,14 @@ Interactive menu and CLI interface for workflow-based duplication
 import sys
 import os
 import argparse
-from dotenv import load_dotenv
 from config_loader import ConfigLoader
-from monday_item_duplicator import MondayItemDuplicator
 
-# Load environment variables
-load_dotenv()
+# Heavy modules (requests, dotenv, monday_item_duplicator, sqlite3) are imported
+# only by the code paths that need them, so --list and the menus start fast.
+# benchmarks/startup_budget.py checks this stays true.
+
+# Most recent updates copied per item when a destination has copy_updates
+UPDATES_LIMIT = 100
 
 
 def print_banner():
@@ -106,7 +108,10 @@ def run_workflow(
     destination,
     column_mapping,
     column_names,
-    item_name=None
+    item_names=None,
+    assume_yes=False,
+    subitem_mapping=None,
+    checkpoint=None
 ):
     """
     Run duplication workflow for a single destination
@@ -117,90 +122,187 @@ def run_workflow(
         destination: Destination configuration
         column_mapping: Resolved column mapping dict
         column_names: Resolved column names dict
-        item_name: Item to process (None for batch mode)
+        item_names: Items to process (None for batch mode)
+        assume_yes: Skip confirmations (batch mode then writes items in batches)
+        subitem_mapping: Resolved subitem column mapping (None skips subitems)
+        checkpoint: Called with the source item IDs a batch left unsynced
+                    because the circuit breaker opened
     """
+    from resilience import CircuitOpen
+
     source = workflow.source
+    profiler = duplicator.profiler
+
+    # Subitems and updates are read in the same paginated queries as their parents
+    subitem_column_ids = list(subitem_mapping) if subitem_mapping is not None else None
+    updates_limit = UPDATES_LIMIT if destination.copy_updates else 0
 
-    if item_name:
-        # Single item mode
-        print(f"\n📌 Processing: '{item_name}'")
+    # Mirrored destinations route each item to the group titled like its source group
+    group_map = None
+    if destination.mirror_groups:
+        with profiler.phase("destination lookup"):
+            group_map = duplicator.groups.group_map(source.board_id, destination.board_id)
+        print(f"📁 Mirroring {len(group_map)} group(s) by title")
+
+    def dest_group(item):
+        """Destination group of a source item"""
+        if group_map:
+            return group_map.get(item.group_id, destination.group_id)
+        return destination.group_id
+
+    if item_names:
+        # Single item mode (one or more named items)
+        print(f"\n📌 Processing: {', '.join(repr(name) for name in item_names)}")
         print(f"   Source: {source.board_name}")
         print(f"   Destination: {destination.board_name}")
         print()
 
-        # Get source item
-        source_item = duplicator.get_item_by_name(source.board_id, item_name)
+        # Get source items - all names in as few requests as possible
+        with profiler.phase("source fetch"):
+            found = duplicator.get_items_by_names(
+                source.board_id, item_names, list(column_mapping),
+                subitem_column_ids=subitem_column_ids, updates_limit=updates_limit
+            )
 
-        if not source_item:
-            print(f"❌ Item '{item_name}' not found in {source.board_name}")
+        for item_name in item_names:
+            if item_name not in found:
+                print(f"❌ Item '{item_name}' not found in {source.board_name}")
+
+        source_items = [found[name] for name in dict.fromkeys(item_names) if name in found]
+        if not source_items:
             return
 
-        # Duplicate the item
-        result = duplicator.duplicate_item_from_data(
-            source_item=source_item,
-            dest_board_id=destination.board_id,
-            dest_group_id=destination.group_id,
-            column_mapping=column_mapping,
-            column_names=column_names,
-            source_board_name=source.board_name,
-            dest_board_name=destination.board_name
-        )
+        # Check which items already exist in the destination with batched lookups
+        with profiler.phase("destination lookup"):
+            duplicator.lookup_existing_items(destination.board_id, source_items)
+            duplicator.relations.prefetch(source_items, column_mapping, destination.board_id)
+
+        for source_item in source_items:
+            # Duplicate the item
+            with profiler.item(source_item.name):
+                result = duplicator.duplicate_item_from_data(
+                    source_item=source_item,
+                    dest_board_id=destination.board_id,
+                    dest_group_id=dest_group(source_item),
+                    column_mapping=column_mapping,
+                    column_names=column_names,
+                    source_board_name=source.board_name,
+                    dest_board_name=destination.board_name,
+                    confirm=not assume_yes,
+                    source_board_id=source.board_id,
+                    unknown_labels=destination.unknown_labels,
+                    subitem_mapping=subitem_mapping,
+                    copy_updates=destination.copy_updates
+                )
 
-        print(f"\n🎉 Process complete!")
-        print(f"   Action: {result['action']}")
-        if result['dest_item_id']:
-            print(f"   Item URL: https://your-account.monday.com/boards/{destination.board_id}/pulses/{result['dest_item_id']}")
+            print(f"\n🎉 Process complete!")
+            print(f"   Action: {result['action']}")
+            if result['dest_item_id']:
+                print(f"   Item URL: https://your-account.monday.com/boards/{destination.board_id}/pulses/{result['dest_item_id']}")
 
     else:
-        # Batch mode
+        # Batch mode - mirrored destinations sync every group of the source board in one pass
+        source_group_id = None if group_map else source.group_id
         print(f"\n📦 Batch Mode")
-        print(f"   Source: {source.board_name} / {source.group_id}")
-        print(f"   Destination: {destination.board_name} / {destination.group_id}")
+        print(f"   Source: {source.board_name} / {source_group_id or 'all groups'}")
+        print(f"   Destination: {destination.board_name} / {'mirrored groups' if group_map else destination.group_id}")
         print()
 
-        # Get all items from source group
+        # Get all items from source group (only the mapped columns, as compact Items)
         print(f"🔍 Fetching items from {source.board_name}...")
-        items = duplicator.get_items_from_group(source.board_id, source.group_id)
+        with profiler.phase("source fetch"):
+            items = duplicator.get_items_from_group(
+                source.board_id, source_group_id, list(column_mapping),
+                subitem_column_ids=subitem_column_ids, updates_limit=updates_limit
+            )
 
         if not items:
-            print(f"⚠️  No items found in group '{source.group_id}'")
+            print(f"⚠️  No items found in group '{source_group_id or 'any group'}'")
             return
 
         print(f"✅ Found {len(items)} item(s) to process\n")
 
+        with profiler.phase("destination lookup"):
+            # Check which items already exist in the destination with batched lookups
+            duplicator.lookup_existing_items(destination.board_id, items)
+
+            # Resolve linked items of board relation columns for the whole batch at once
+            duplicator.relations.prefetch(items, column_mapping, destination.board_id)
+
         # Process each item
         results = []
         created_count = 0
         updated_count = 0
         cancelled_count = 0
+        failed_count = 0
+        unsynced = []
 
-        for idx, item in enumerate(items, 1):
-            print(f"\n{'=' * 80}")
-            print(f"Processing Item {idx}/{len(items)}")
-            print(f"{'=' * 80}\n")
-
-            try:
-                result = duplicator.duplicate_item_from_data(
-                    source_item=item,
-                    dest_board_id=destination.board_id,
-                    dest_group_id=destination.group_id,
-                    column_mapping=column_mapping,
-                    column_names=column_names,
-                    source_board_name=source.board_name,
-                    dest_board_name=destination.board_name
-                )
-                results.append(result)
+        if assume_yes:
+            # No confirmation needed - write in adaptively sized batches
+            results = duplicator.duplicate_items(
+                source_items=items,
+                dest_board_id=destination.board_id,
+                dest_group_id=destination.group_id,
+                column_mapping=column_mapping,
+                column_names=column_names,
+                source_board_name=source.board_name,
+                dest_board_name=destination.board_name,
+                source_board_id=source.board_id,
+                unknown_labels=destination.unknown_labels,
+                subitem_mapping=subitem_mapping,
+                copy_updates=destination.copy_updates,
+                group_map=group_map
+            )
 
-                if result['action'] == 'CANCELLED':
-                    cancelled_count += 1
+            for result in results:
+                if result['action'] == 'FAILED':
+                    failed_count += 1
+                    if result['circuit_open']:
+                        unsynced.append(result['source_item_id'])
                 elif result['was_updated']:
                     updated_count += 1
                 else:
                     created_count += 1
+        else:
+            for idx, item in enumerate(items, 1):
+                print(f"\n{'=' * 80}")
+                print(f"Processing Item {idx}/{len(items)}")
+                print(f"{'=' * 80}\n")
 
-            except Exception as e:
-                print(f"❌ Failed to process '{item['name']}': {str(e)}")
-                continue
+                try:
+                    with profiler.item(item.name):
+                        result = duplicator.duplicate_item_from_data(
+                            source_item=item,
+                            dest_board_id=destination.board_id,
+                            dest_group_id=dest_group(item),
+                            column_mapping=column_mapping,
+                            column_names=column_names,
+                            source_board_name=source.board_name,
+                            dest_board_name=destination.board_name,
+                            source_board_id=source.board_id,
+                            unknown_labels=destination.unknown_labels,
+                            subitem_mapping=subitem_mapping,
+                            copy_updates=destination.copy_updates
+                        )
+                    results.append(result)
+
+                    if result['action'] == 'CANCELLED':
+                        cancelled_count += 1
+                    elif result['was_updated']:
+                        updated_count += 1
+                    else:
+                        created_count += 1
+
+                except CircuitOpen as e:
+                    # The API is failing - stop instead of grinding through the rest
+                    print(f"🔌 {e}")
+                    unsynced = [remaining.id for remaining in items[idx - 1:]]
+                    failed_count += len(unsynced)
+                    break
+                except Exception as e:
+                    print(f"❌ Failed to process '{item.name}': {str(e)}")
+                    failed_count += 1
+                    continue
 
         # Print summary
         print(f"\n{'=' * 80}")
@@ -211,6 +313,546 @@ def run_workflow(
         print(f"   • Updated: {updated_count}")
         if cancelled_count > 0:
             print(f"   • Cancelled: {cancelled_count}")
+        if failed_count > 0:
+            print(f"   • Failed: {failed_count}")
+
+        if unsynced and checkpoint:
+            checkpoint(unsynced)
+
+
+def run_mirror(
+    duplicator,
+    workflow,
+    destination,
+    column_mapping,
+    column_names,
+    assume_yes=False,
+    subitem_mapping=None,
+    max_archive="10%"
+):
+    """
+    Mirror the source group onto the destination group
+
+    Both groups are read into keyed indexes and compared in one pass:
+    missing items are created, changed items updated and items no longer
+    in the source archived, all with batched mutations. Items already in
+    sync cost no request.
+
+    Args:
+        duplicator: MondayItemDuplicator instance
+        workflow: Workflow configuration
+        destination: Destination configuration
+        column_mapping: Resolved column mapping dict
+        column_names: Resolved column names dict
+        assume_yes: Skip the confirmation
+        subitem_mapping: Resolved subitem column mapping (None skips subitems)
+        max_archive: Most items to archive ("50" or "10%" of the destination);
+                     above it nothing is archived
+    """
+    from mirror_sync import MirrorSync, archive_limit
+
+    source = workflow.source
+    profiler = duplicator.profiler
+
+    subitem_column_ids = list(subitem_mapping) if subitem_mapping is not None else None
+    updates_limit = UPDATES_LIMIT if destination.copy_updates else 0
+
+    # Mirrored groups compare whole boards, otherwise the two configured groups
+    group_map = None
+    if destination.mirror_groups:
+        with profiler.phase("destination lookup"):
+            group_map = duplicator.groups.group_map(source.board_id, destination.board_id)
+    source_group_id = None if group_map else source.group_id
+    dest_group_id = None if group_map else destination.group_id
+
+    print(f"\n🪞 Mirror Mode")
+    print(f"   Source: {source.board_name} / {source_group_id or 'all groups'}")
+    print(f"   Destination: {destination.board_name} / {dest_group_id or 'all groups'}")
+    print()
+
+    print(f"🔍 Fetching items from {source.board_name} and {destination.board_name}...")
+    with profiler.phase("source fetch"):
+        source_items = duplicator.get_items_from_group(
+            source.board_id, source_group_id, list(column_mapping),
+            subitem_column_ids=subitem_column_ids, updates_limit=updates_limit
+        )
+    with profiler.phase("destination lookup"):
+        dest_column_ids = list(column_mapping.values())
+        if destination.identity_column:
+            dest_column_ids.append(destination.identity_column)
+        dest_items = duplicator.get_items_from_group(
+            destination.board_id, dest_group_id, list(dict.fromkeys(dest_column_ids))
+        )
+        duplicator.relations.prefetch(source_items, column_mapping, destination.board_id)
+
+    mirror = MirrorSync(duplicator)
+    plan = mirror.plan(
+        source_items,
+        dest_items,
+        destination.board_id,
+        column_mapping,
+        column_names,
+        source_board_id=source.board_id,
+        unknown_labels=destination.unknown_labels
+    )
+
+    print(f"✅ {len(source_items)} source item(s), {len(dest_items)} destination item(s)")
+    print(f"   • Create: {len(plan.create)}")
+    print(f"   • Update: {len(plan.update)}")
+    print(f"   • Unchanged: {len(plan.unchanged)}")
+    print(f"   • Archive: {len(plan.archive)}")
+
+    archive = plan.archive
+    limit = archive_limit(max_archive, len(dest_items))
+    if len(archive) > limit:
+        print(f"\n⚠️  Not archiving {len(archive)} item(s): above --max-archive {max_archive} "
+              f"({limit} of {len(dest_items)} destination items)")
+        print("   Check the source group, or raise --max-archive to allow it")
+        archive = []
+    elif archive:
+        names = ", ".join(f"'{item.name}'" for item in archive[:10])
+        more = f" and {len(archive) - 10} more" if len(archive) > 10 else ""
+        print(f"\n🗄️  Will archive: {names}{more}")
+
+    writes = plan.create + [source_item for source_item, _ in plan.update]
+    if not writes and not archive and not (destination.copy_updates and plan.unchanged):
+        print("\n✅ Destination is already in sync")
+        return
+
+    if not assume_yes:
+        response = input(f"\n   Continue with mirror? (y/n): ").strip().lower()
+        if response not in ["y", "yes"]:
+            print("❌ Mirror cancelled")
+            return
+
+    results = []
+    if writes:
+        results = duplicator.duplicate_items(
+            source_items=writes,
+            dest_board_id=destination.board_id,
+            dest_group_id=destination.group_id,
+            column_mapping=column_mapping,
+            column_names=column_names,
+            source_board_name=source.board_name,
+            dest_board_name=destination.board_name,
+            source_board_id=source.board_id,
+            unknown_labels=destination.unknown_labels,
+            subitem_mapping=subitem_mapping,
+            copy_updates=destination.copy_updates,
+            group_map=group_map,
+            existing_items=[None] * len(plan.create) + [dest_item for _, dest_item in plan.update],
+            # Updates were already mapped by the plan
+            prepared=[None] * len(plan.create) + [plan.prepared[source_item.id] for source_item, _ in plan.update]
+        )
+
+    # Unchanged items may still have new updates (only those are posted)
+    if destination.copy_updates and plan.unchanged:
+        duplicator.duplicate_updates(
+            [(source_item, dest_item.id) for source_item, dest_item in plan.unchanged],
+            destination.board_id
+        )
+
+    archived = mirror.archive(destination.board_id, archive) if archive else []
+
+    failed_count = sum(1 for result in results if result['action'] == 'FAILED')
+    archive_failed = sum(1 for result in archived if isinstance(result, Exception))
+
+    print(f"\n{'=' * 80}")
+    print(f"📊 MIRROR SUMMARY")
+    print(f"{'=' * 80}")
+    print(f"   • Created: {sum(1 for result in results if result['action'] == 'CREATED')}")
+    print(f"   • Updated: {sum(1 for result in results if result['action'] == 'UPDATED')}")
+    print(f"   • Unchanged: {len(plan.unchanged)}")
+    print(f"   • Archived: {len(archived) - archive_failed}")
+    if failed_count or archive_failed:
+        print(f"   • Failed: {failed_count + archive_failed}")
+
+
+def run_sharded(
+    duplicator,
+    workflow,
+    destination,
+    dest_index,
+    column_mapping,
+    column_names,
+    subitem_mapping,
+    args
+):
+    """
+    Run batch mode for one destination on a pool of worker processes
+
+    The source group is listed once (IDs and names only) and split into
+    shards by item name. Each worker process fetches, maps and writes its
+    shards, and all workers spend one shared rate-limit budget.
+
+    Args:
+        duplicator: MondayItemDuplicator instance (lists the source items)
+        workflow: Workflow configuration
+        destination: Destination configuration
+        dest_index: Position of the destination in the workflow (for checkpointed jobs)
+        column_mapping: Resolved column mapping dict
+        column_names: Resolved column names dict
+        subitem_mapping: Resolved subitem column mapping (None skips subitems)
+        args: Command line arguments (processes, validation, log paths)
+    """
+    from sharded_runner import ShardJob, run_shards, shard_items
+
+    source = workflow.source
+
+    group_map = None
+    if destination.mirror_groups:
+        group_map = duplicator.groups.group_map(source.board_id, destination.board_id)
+    source_group_id = None if group_map else source.group_id
+
+    print(f"\n📦 Sharded Batch Mode ({args.processes} processes)")
+    print(f"   Source: {source.board_name} / {source_group_id or 'all groups'}")
+    print(f"   Destination: {destination.board_name} / {'mirrored groups' if group_map else destination.group_id}")
+    print()
+
+    import time
+
+    rate_limiter = duplicator.rate_limiter
+    rate_limited = args.rate_limit > 0
+
+    print(f"🔍 Listing items in {source.board_name}...")
+    spent_before = rate_limiter.spent if rate_limited else 0
+    started = time.monotonic()
+    items = list(duplicator.iter_group_items(source.board_id, source_group_id, column_ids=[]))
+    listing_time = time.monotonic() - started
+    listing_requests = rate_limiter.spent - spent_before if rate_limited else 0
+    if not items:
+        print(f"⚠️  No items found in group '{source_group_id or 'any group'}'")
+        return
+
+    # More shards than processes keeps the workers evenly loaded
+    shards = shard_items(items, args.processes * 4)
+    print(f"✅ Found {len(items)} item(s), split into {len(shards)} shard(s)\n")
+
+    # All processes share one budget: once a single process can spend it, more add nothing
+    if rate_limited and listing_requests:
+        one_process_rate = 60 * listing_requests / max(listing_time, 0.001)
+        if one_process_rate >= args.rate_limit:
+            print(f"⚠️  One process already sends about {one_process_rate:.0f} requests/minute here "
+                  f"(--rate-limit {args.rate_limit})")
+            print(f"   The shared budget will limit this run, so {args.processes} processes are unlikely "
+                  f"to be faster than one\n")
+
+    jobs = [
+        ShardJob(
+            api_key=duplicator.api_key,
+            source_board_id=source.board_id,
+            source_board_name=source.board_name,
+            dest_board_id=destination.board_id,
+            dest_board_name=destination.board_name,
+            dest_group_id=destination.group_id,
+            column_mapping=column_mapping,
+            column_names=column_names,
+            item_ids=shard,
+            unknown_labels=destination.unknown_labels,
+            validation=args.validation,
+            subitem_mapping=subitem_mapping,
+            copy_updates=destination.copy_updates,
+            updates_limit=UPDATES_LIMIT if destination.copy_updates else 0,
+            group_map=group_map,
+            identity_column=destination.identity_column,
+            intents_path=args.intents,
+            updates_log_path=args.updates_log,
+            read_deadline=args.read_deadline,
+            write_deadline=args.write_deadline,
+            hedge_reads=not args.no_hedge
+        )
+        for shard in shards
+    ]
+    # The workers share the intent log, so stale creates are settled here, before any of them writes
+    duplicator.recover_pending_creates()
+
+    spent_before = rate_limiter.spent if rate_limited else 0
+    started = time.monotonic()
+    totals = run_shards(jobs, args.processes, rate_limiter=rate_limiter)
+    elapsed = time.monotonic() - started
+
+    print(f"\n{'=' * 80}")
+    print(f"📊 BATCH PROCESSING SUMMARY")
+    print(f"{'=' * 80}")
+    print(f"\n✅ Successfully processed: {totals['created'] + totals['updated']}/{totals['items']} items")
+    print(f"   • Created: {totals['created']}")
+    print(f"   • Updated: {totals['updated']}")
+    if totals['failed'] > 0:
+        print(f"   • Failed: {totals['failed']}")
+        for error in totals['errors'][:10]:
+            print(f"     ❌ {error}")
+        if len(totals['errors']) > 10:
+            print(f"     ... and {len(totals['errors']) - 10} more")
+
+    if rate_limited:
+        # The initial burst doesn't count towards the sustained rate
+        used = max(0.0, rate_limiter.spent - spent_before - rate_limiter.capacity) * 60 / max(elapsed, 0.001)
+        if used >= 0.9 * args.rate_limit:
+            print(f"\n⚠️  The workers spent the whole --rate-limit budget ({used:.0f} of {args.rate_limit} requests/minute)")
+            print(f"   The budget, not the process count, set the pace: one process would have been as fast")
+
+    if totals['unsynced']:
+        print(f"\n🔌 Circuit breaker opened in a worker - {len(totals['unsynced'])} item(s) not synced")
+        checkpoint_unsynced(workflow, dest_index, totals['unsynced'], args)
+
+
+def enqueue_jobs(duplicator, config_loader, args):
+    """Add sync jobs for a workflow to the durable job queue"""
+    from job_queue import JobQueue
+
+    workflow = config_loader.get_workflow(args.workflow) if args.workflow else None
+    if not workflow:
+        print(f"❌ Workflow '{args.workflow}' not found (use --workflow)")
+        sys.exit(1)
+
+    source = workflow.source
+    if args.item_id:
+        jobs = [
+            (workflow.id, dest_index, item_id)
+            for item_id in args.item_id
+            for dest_index in range(len(workflow.destinations))
+        ]
+    elif args.batch:
+        # Mirrored destinations take every group of the source board, the others only the source group
+        mirrored = any(destination.mirror_groups for destination in workflow.destinations)
+        print(f"🔍 Fetching items from {source.board_name}...")
+        items = list(duplicator.iter_group_items(
+            source.board_id, None if mirrored else source.group_id, column_ids=[]
+        ))
+        jobs = [
+            (workflow.id, dest_index, item.id)
+            for item in items
+            for dest_index, destination in enumerate(workflow.destinations)
+            if destination.mirror_groups or item.group_id == source.group_id
+        ]
+    else:
+        print("❌ Specify --item-id or --batch to choose the items to enqueue")
+        sys.exit(1)
+
+    queue = JobQueue(args.queue)
+    added = queue.enqueue_many(jobs)
+    queue.close()
+
+    print(f"✅ Enqueued {added} job(s) ({len(jobs) - added} already queued)")
+
+
+def serve(duplicator, config_loader, args):
+    """Run the long-lived worker daemon"""
+    from job_queue import JobQueue
+    from sync_daemon import SyncDaemon
+
+    print_banner()
+    daemon = SyncDaemon(
+        config_loader=config_loader,
+        duplicator=duplicator,
+        queue=JobQueue(args.queue),
+        workers=args.workers,
+        write_window=args.write_window,
+        cache_ttl=args.cache_ttl
+    )
+    daemon.serve_forever()
+
+
+def create_duplicator(args):
+    """Load the API key from .env and create the API client"""
+    from dotenv import load_dotenv
+    from intent_log import IntentLog
+    from monday_item_duplicator import MondayItemDuplicator
+    from rate_limiter import RateLimiter, SharedRateLimiter
+    from update_log import UpdateLog
+
+    load_dotenv()
+
+    api_key = os.getenv("MONDAY_API_KEY")
+    if not api_key and not args.replay:
+        print("❌ MONDAY_API_KEY not found in .env file")
+        sys.exit(1)
+
+    # Worker processes of a sharded run spend one budget kept in shared memory
+    rate_limiter = None
+    if args.rate_limit > 0:
+        if args.processes > 1:
+            rate_limiter = SharedRateLimiter(args.rate_limit)
+        else:
+            rate_limiter = RateLimiter(args.rate_limit)
+
+    # Replayed runs never touch the real intent and update logs. Creates left
+    # unconfirmed by an earlier run are settled before this run's first create.
+    duplicator = MondayItemDuplicator(
+        api_key or "replay",
+        rate_limiter=rate_limiter,
+        validation=args.validation,
+        intent_log=IntentLog(":memory:" if args.replay else args.intents),
+        update_log=UpdateLog(":memory:" if args.replay else args.updates_log),
+        read_deadline=args.read_deadline,
+        write_deadline=args.write_deadline,
+        hedge_reads=not args.no_hedge
+    )
+
+    if args.replay:
+        from cassette import ReplayTransport
+        duplicator.transport = ReplayTransport(args.replay, latency_scale=args.replay_latency)
+        print(f"📼 Replaying API traffic from {args.replay} (latency x{args.replay_latency:g})")
+    elif args.record:
+        from cassette import RecordingTransport
+        duplicator.transport = RecordingTransport(duplicator.http_post, args.record, api_key=api_key)
+        print(f"📼 Recording API traffic to {args.record}")
+
+    return duplicator
+
+
+def checkpoint_unsynced(workflow, dest_index, item_ids, args):
+    """Queue items a run left unsynced as jobs, so `serve` (or enqueue + serve) finishes them"""
+    from job_queue import JobQueue
+
+    if args.replay:
+        return
+
+    queue = JobQueue(args.queue)
+    added = queue.enqueue_many([(workflow.id, dest_index, item_id) for item_id in item_ids])
+    queue.close()
+    print(f"💾 Checkpointed {added} unsynced item(s) to {args.queue} - run `python run.py serve` to resume")
+
+
+def run_destinations(duplicator, config_loader, workflow, item_names, args):
+    """Run a workflow for each of its destinations"""
+    from resilience import CircuitOpen
+
+    # Process each destination
+    print(f"\n{'=' * 80}")
+    print(f"🚀 Running Workflow: {workflow.name}")
+    print(f"{'=' * 80}")
+
+    # Fetch the source and every destination schema in one request
+    if args.validation != "off":
+        with duplicator.profiler.phase("destination lookup"):
+            duplicator.schema_cache.prefetch(
+                [workflow.source.board_id] + [d.board_id for d in workflow.destinations]
+            )
+
+    for dest_idx, destination in enumerate(workflow.destinations, 1):
+        if duplicator.breaker.is_open:
+            print(f"\n🔌 Circuit breaker open - stopping before destination {dest_idx}/{len(workflow.destinations)}")
+            break
+
+        print(f"\n{'=' * 80}")
+        print(f"📍 Destination {dest_idx}/{len(workflow.destinations)}: {destination.board_name}")
+        print(f"{'=' * 80}")
+
+        # Resolve column mappings and names
+        column_mapping = config_loader.resolve_column_mappings(destination)
+        column_names = config_loader.resolve_column_names(destination)
+        subitem_mapping = config_loader.resolve_subitem_mappings(destination)
+
+        print(f"\n✓ Template: {destination.template or 'None'}")
+        print(f"✓ Column Mappings: {len(column_mapping)} columns")
+        if subitem_mapping is not None:
+            print(f"✓ Subitem Mappings: {len(subitem_mapping)} columns")
+
+        if destination.identity_column:
+            duplicator.identities.set_column(destination.board_id, destination.identity_column)
+            print(f"✓ Matching items by source item ID in column '{destination.identity_column}'")
+
+        if args.validation != "off":
+            schema = duplicator.schema_cache.get(destination.board_id)
+            mapped = list(column_mapping.values())
+            if destination.identity_column:
+                mapped.append(destination.identity_column)
+            for problem in schema.check_mapping(mapped):
+                print(f"⚠️  Mapping problem: {problem}")
+
+        # Run workflow for this destination
+        try:
+            if args.mirror:
+                run_mirror(
+                    duplicator=duplicator,
+                    workflow=workflow,
+                    destination=destination,
+                    column_mapping=column_mapping,
+                    column_names=column_names,
+                    assume_yes=args.yes,
+                    subitem_mapping=subitem_mapping,
+                    max_archive=args.max_archive
+                )
+                continue
+
+            if args.processes > 1 and item_names is None:
+                run_sharded(
+                    duplicator=duplicator,
+                    workflow=workflow,
+                    destination=destination,
+                    dest_index=dest_idx - 1,
+                    column_mapping=column_mapping,
+                    column_names=column_names,
+                    subitem_mapping=subitem_mapping,
+                    args=args
+                )
+                continue
+
+            run_workflow(
+                duplicator=duplicator,
+                workflow=workflow,
+                destination=destination,
+                column_mapping=column_mapping,
+                column_names=column_names,
+                item_names=item_names,
+                assume_yes=args.yes,
+                subitem_mapping=subitem_mapping,
+                checkpoint=lambda item_ids, dest_index=dest_idx - 1: checkpoint_unsynced(
+                    workflow, dest_index, item_ids, args
+                )
+            )
+        except CircuitOpen as e:
+            print(f"\n🔌 Stopping: {e}")
+            break
+        except Exception as e:
+            print(f"\n❌ Error processing destination '{destination.board_name}': {e}")
+            import traceback
+            traceback.print_exc()
+            continue
+
+    print(f"\n{'=' * 80}")
+    print("🎉 All destinations processed!")
+    print(f"{'=' * 80}")
+
+
+def profile_run(duplicator, config_loader, workflow, item_names, args):
+    """Run a workflow with per-phase timing and an optional profile file"""
+    from profiler import PhaseProfiler, StackSampler
+
+    profiler = PhaseProfiler()
+    duplicator.profiler = profiler
+
+    # .prof files get cProfile stats; anything else gets collapsed stacks
+    output = args.profile_output
+    cprofile = None
+    sampler = None
+    if output and output.endswith(".prof"):
+        import cProfile
+        cprofile = cProfile.Profile()
+    elif output:
+        sampler = StackSampler()
+
+    profiler.start()
+    if cprofile:
+        cprofile.enable()
+    if sampler:
+        sampler.start()
+
+    try:
+        run_destinations(duplicator, config_loader, workflow, item_names, args)
+    finally:
+        if cprofile:
+            cprofile.disable()
+            cprofile.dump_stats(output)
+        if sampler:
+            sampler.stop()
+            sampler.write(output)
+
+        profiler.stop()
+        profiler.report()
+        if output:
+            print(f"\n📝 Profile written to {output}")
 
 
 def main():
@@ -218,6 +860,20 @@ def main():
     parser = argparse.ArgumentParser(
         description="Monday.com Item Duplicator - Multi-Workflow Edition"
     )
+    parser.add_argument(
+        "command",
+        nargs="?",
+        choices=["run", "serve", "enqueue"],
+        default="run",
+        help="run: process a workflow now (default); serve: start the worker daemon; "
+             "enqueue: add jobs for the daemon"
+    )
+    parser.add_argument(
+        "--config",
+        type=str,
+        default="config/workflows.json",
+        help="Path to the workflow configuration file"
+    )
     parser.add_argument(
         "--workflow",
         type=str,
@@ -226,24 +882,143 @@ def main():
     parser.add_argument(
         "--item",
         type=str,
-        help="Item name to process (omit for batch mode)"
+        action="append",
+        help="Item name to process (repeatable; omit for batch mode)"
     )
     parser.add_argument(
         "--batch",
         action="store_true",
         help="Process all items in batch mode"
     )
+    parser.add_argument(
+        "--yes",
+        action="store_true",
+        help="Don't ask for confirmation; batch mode writes items in adaptively sized batches"
+    )
+    parser.add_argument(
+        "--mirror",
+        action="store_true",
+        help="Make the destination group mirror the source group: create, update and archive items"
+    )
+    parser.add_argument(
+        "--max-archive",
+        type=str,
+        default="10%",
+        help="With --mirror, most items to archive as a count or share of the destination (default 10%%)"
+    )
+    parser.add_argument(
+        "--processes",
+        type=int,
+        default=1,
+        help="With --batch --yes, sync shards of the source group in this many worker processes"
+    )
     parser.add_argument(
         "--list",
         action="store_true",
         help="List all available workflows and exit"
     )
+    parser.add_argument(
+        "--item-id",
+        action="append",
+        help="Source item ID to enqueue (repeatable, enqueue only)"
+    )
+    parser.add_argument(
+        "--queue",
+        type=str,
+        default="data/jobs.sqlite3",
+        help="Path to the job queue database (serve/enqueue)"
+    )
+    parser.add_argument(
+        "--intents",
+        type=str,
+        default="data/intents.sqlite3",
+        help="Path to the create intent log used to retry creates without duplicates"
+    )
+    parser.add_argument(
+        "--updates-log",
+        type=str,
+        default="data/updates.sqlite3",
+        help="Path to the log of copied updates, so re-runs only copy new ones"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=4,
+        help="Number of worker threads (serve only)"
+    )
+    parser.add_argument(
+        "--write-window",
+        type=float,
+        default=0.0,
+        help="Seconds to combine updates of the same destination item before sending them (serve only, 0 = off)"
+    )
+    parser.add_argument(
+        "--cache-ttl",
+        type=float,
+        default=300.0,
+        help="Seconds the daemon trusts a destination board's item index and schema before reloading them (serve only)"
+    )
+    parser.add_argument(
+        "--validation",
+        choices=["drop", "strict", "off"],
+        default="drop",
+        help="Columns failing the destination schema: drop them (default), fail the item, or send unchecked"
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Time each phase (fetch, lookup, transform, preview, input, mutation, output) per item"
+    )
+    parser.add_argument(
+        "--profile-output",
+        type=str,
+        help="With --profile, also write cProfile stats (*.prof) or collapsed stacks (any other name)"
+    )
+    parser.add_argument(
+        "--record",
+        type=str,
+        help="Record every API request and response to this cassette file (API key scrubbed)"
+    )
+    parser.add_argument(
+        "--replay",
+        type=str,
+        help="Serve API responses from this cassette file instead of calling Monday.com"
+    )
+    parser.add_argument(
+        "--replay-latency",
+        type=float,
+        default=1.0,
+        help="With --replay, multiply recorded latencies by this factor (0 = instant)"
+    )
+    parser.add_argument(
+        "--rate-limit",
+        type=int,
+        default=0,
+        help="Maximum API requests per minute shared by all workers (0 = unlimited)"
+    )
+    parser.add_argument(
+        "--read-deadline",
+        type=float,
+        default=60.0,
+        help="Seconds a query may take before it is abandoned as timed out (default 60)"
+    )
+    parser.add_argument(
+        "--write-deadline",
+        type=float,
+        default=120.0,
+        help="Seconds a mutation may take before it is abandoned as timed out (default 120)"
+    )
+    parser.add_argument(
+        "--no-hedge",
+        action="store_true",
+        help="Don't send a duplicate of reads that are slower than the recent 95th percentile"
+    )
 
     args = parser.parse_args()
 
     # Load configuration
     try:
-        config_loader = ConfigLoader()
+        config_loader = ConfigLoader(args.config)
     except FileNotFoundError as e:
         print(f"❌ {e}")
         sys.exit(1)
@@ -263,14 +1038,13 @@ def main():
             print()
         sys.exit(0)
 
-    # Get API key
-    api_key = os.getenv("MONDAY_API_KEY")
-    if not api_key:
-        print("❌ MONDAY_API_KEY not found in .env file")
-        sys.exit(1)
+    if args.command == "serve":
+        serve(create_duplicator(args), config_loader, args)
+        sys.exit(0)
 
-    # Initialize duplicator
-    duplicator = MondayItemDuplicator(api_key)
+    if args.command == "enqueue":
+        enqueue_jobs(create_duplicator(args), config_loader, args)
+        sys.exit(0)
 
     # Select workflow
     if args.workflow:
@@ -285,50 +1059,41 @@ def main():
         print_banner()
         workflow = select_workflow_interactive(config_loader)
 
-    # Determine item name (single or batch mode)
-    if args.batch:
-        item_name = None
+    # Determine item names (single or batch mode)
+    if args.mirror:
+        if args.item:
+            print("❌ --mirror syncs whole groups and can't be combined with --item")
+            sys.exit(1)
+        from mirror_sync import archive_limit
+        try:
+            archive_limit(args.max_archive, 0)
+        except ValueError:
+            print(f"❌ Invalid --max-archive '{args.max_archive}' (use a count like 50 or a share like 10%)")
+            sys.exit(1)
+        item_names = None
+    elif args.batch:
+        item_names = None
     elif args.item:
-        item_name = args.item
+        item_names = args.item
     else:
         item_name = get_item_name_interactive()
+        item_names = [item_name] if item_name else None
 
-    # Process each destination
-    print(f"\n{'=' * 80}")
-    print(f"🚀 Running Workflow: {workflow.name}")
-    print(f"{'=' * 80}")
-
-    for dest_idx, destination in enumerate(workflow.destinations, 1):
-        print(f"\n{'=' * 80}")
-        print(f"📍 Destination {dest_idx}/{len(workflow.destinations)}: {destination.board_name}")
-        print(f"{'=' * 80}")
-
-        # Resolve column mappings and names
-        column_mapping = config_loader.resolve_column_mappings(destination)
-        column_names = config_loader.resolve_column_names(destination)
-
-        print(f"\n✓ Template: {destination.template or 'None'}")
-        print(f"✓ Column Mappings: {len(column_mapping)} columns")
+    if args.processes > 1:
+        if item_names is not None or args.mirror or not args.yes:
+            print("❌ --processes needs batch mode with --yes (and no --mirror)")
+            sys.exit(1)
+        if args.record or args.replay:
+            print("❌ --processes can't be combined with --record or --replay")
+            sys.exit(1)
 
-        # Run workflow for this destination
-        try:
-            run_workflow(
-                duplicator=duplicator,
-                workflow=workflow,
-                destination=destination,
-                column_mapping=column_mapping,
-                column_names=column_names,
-                item_name=item_name
-            )
-        except Exception as e:
-            print(f"\n❌ Error processing destination '{destination.board_name}': {e}")
-            import traceback
-            traceback.print_exc()
-            continue
+    # Initialize duplicator (first network-related import)
+    duplicator = create_duplicator(args)
 
-    print(f"\n{'=' * 80}")
-    print("🎉 All destinations processed!")
-    print(f"{'=' * 80}")
+    if args.profile:
+        profile_run(duplicator, config_loader, workflow, item_names, args)
+    else:
+        run_destinations(duplicator, config_loader, workflow, item_names, args)
 
 
 if __name__ == "__main__":
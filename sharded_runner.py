@@ -0,0 +1,209 @@
+"""
+Sharded Runner for Monday.com Item Duplicator
+Splits a batch run across worker processes that share one rate-limit budget
+"""
+
+import os
+import sys
+import zlib
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from item_model import Item
+from resilience import CircuitOpen
+
+# Shared rate limiter and batch sizer of the worker process (set by _init_worker)
+_rate_limiter = None
+_batch_sizer = None
+
+# Client of the worker process, kept across shards so batch sizes and caches stay warm
+_duplicator = None
+
+
+@dataclass
+class ShardJob:
+    """One shard of a batch run, as sent to a worker process"""
+    api_key: str
+    source_board_id: int
+    source_board_name: str
+    dest_board_id: int
+    dest_board_name: str
+    dest_group_id: Optional[str]
+    column_mapping: Dict[str, str]
+    column_names: Dict[str, str]
+    item_ids: List[str]
+    unknown_labels: str = "skip"
+    validation: str = "drop"
+    subitem_mapping: Optional[Dict[str, str]] = None
+    copy_updates: bool = False
+    updates_limit: int = 0
+    group_map: Optional[Dict[str, str]] = None
+    identity_column: Optional[str] = None
+    intents_path: str = "data/intents.sqlite3"
+    updates_log_path: str = "data/updates.sqlite3"
+    chunk_size: int = 500
+    read_deadline: float = 60.0
+    write_deadline: float = 120.0
+    hedge_reads: bool = True
+    transport: object = None  # Replaces HTTP in the worker (used by benchmarks)
+
+
+def shard_of(item_name: str, shards: int) -> int:
+    """
+    Shard an item belongs to
+
+    Items are sharded by a stable hash of their name rather than their ID:
+    duplicate detection matches by name, so items sharing a name always land
+    in the same process and two processes never both create the same item.
+    """
+    return zlib.crc32(item_name.encode("utf-8")) % shards
+
+
+def shard_items(items: List[Item], shards: int) -> List[List[str]]:
+    """Split items into shards of item IDs (empty shards are dropped)"""
+    buckets: List[List[str]] = [[] for _ in range(shards)]
+    for item in items:
+        buckets[shard_of(item.name, shards)].append(item.id)
+    return [bucket for bucket in buckets if bucket]
+
+
+def _init_worker(rate_limiter, batch_sizer, quiet: bool):
+    """Pool initializer: keep the shared rate limiter and batch sizer and silence per-item output"""
+    global _rate_limiter, _batch_sizer
+    _rate_limiter = rate_limiter
+    _batch_sizer = batch_sizer
+    if quiet:
+        sys.stdout = open(os.devnull, "w")
+
+
+def run_shard(job: ShardJob) -> Dict:
+    """
+    Sync one shard in a worker process
+
+    Items are fetched by ID chunk_size at a time, mapped and written with
+    duplicate_items(), so fetching, JSON work and transforms all happen in
+    the worker. The process's client is created by its first shard and
+    reused by the next ones (jobs of one run share their settings).
+
+    Once the process's circuit breaker opens, the rest of the shard is
+    skipped and returned as unsynced rather than sent to a failing API.
+
+    Returns:
+        Summary dict with items, created, updated and failed counts, the
+        error messages of failed items and the IDs of unsynced items
+    """
+    global _duplicator
+    if _duplicator is None:
+        from intent_log import IntentLog
+        from monday_item_duplicator import MondayItemDuplicator
+        from update_log import UpdateLog
+
+        _duplicator = MondayItemDuplicator(
+            job.api_key,
+            rate_limiter=_rate_limiter,
+            validation=job.validation,
+            intent_log=IntentLog(job.intents_path),
+            update_log=UpdateLog(job.updates_log_path),
+            transport=job.transport,
+            read_deadline=job.read_deadline,
+            write_deadline=job.write_deadline,
+            hedge_reads=job.hedge_reads,
+            recover_intents=False
+        )
+    duplicator = _duplicator
+    if _batch_sizer is not None:
+        # Every worker writes with the batch size learned by all of them so far
+        duplicator.writer.sizers[job.dest_board_id] = _batch_sizer
+    if job.identity_column:
+        duplicator.identities.set_column(job.dest_board_id, job.identity_column)
+
+    subitem_column_ids = list(job.subitem_mapping) if job.subitem_mapping is not None else None
+    summary = {"items": len(job.item_ids), "created": 0, "updated": 0, "failed": 0, "errors": [], "unsynced": []}
+
+    for start in range(0, len(job.item_ids), job.chunk_size):
+        chunk = job.item_ids[start:start + job.chunk_size]
+        if duplicator.breaker.is_open:
+            summary["failed"] += len(chunk)
+            summary["unsynced"].extend(chunk)
+            continue
+
+        try:
+            items = duplicator.get_items_by_ids(
+                [int(item_id) for item_id in chunk],
+                list(job.column_mapping),
+                subitem_column_ids=subitem_column_ids,
+                updates_limit=job.updates_limit
+            )
+            duplicator.lookup_existing_items(job.dest_board_id, items)
+            duplicator.relations.prefetch(items, job.column_mapping, job.dest_board_id)
+
+            results = duplicator.duplicate_items(
+                source_items=items,
+                dest_board_id=job.dest_board_id,
+                dest_group_id=job.dest_group_id,
+                column_mapping=job.column_mapping,
+                column_names=job.column_names,
+                source_board_name=job.source_board_name,
+                dest_board_name=job.dest_board_name,
+                source_board_id=job.source_board_id,
+                unknown_labels=job.unknown_labels,
+                subitem_mapping=job.subitem_mapping,
+                copy_updates=job.copy_updates,
+                group_map=job.group_map
+            )
+        except Exception as e:
+            summary["failed"] += len(chunk)
+            if isinstance(e, CircuitOpen):
+                summary["unsynced"].extend(chunk)
+            summary["errors"].append(f"{len(chunk)} item(s) starting at ID {chunk[0]}: {e}")
+            continue
+
+        for result in results:
+            if result["action"] == "FAILED":
+                summary["failed"] += 1
+                if result["circuit_open"]:
+                    summary["unsynced"].append(result["source_item_id"])
+                else:
+                    summary["errors"].append(f"'{result['item_name']}': {result.get('error')}")
+            elif result["was_updated"]:
+                summary["updated"] += 1
+            else:
+                summary["created"] += 1
+
+        # Items deleted since the listing are not returned
+        summary["failed"] += len(chunk) - len(items)
+
+    return summary
+
+
+def run_shards(jobs: List[ShardJob], processes: int, rate_limiter=None, quiet: bool = True) -> Dict:
+    """
+    Run shard jobs on a pool of worker processes and merge their summaries
+
+    The workers share one batch size for the destination board, so adding
+    processes doesn't mean relearning it from the initial size in each one.
+
+    Args:
+        jobs: Shards to sync
+        processes: Worker processes
+        rate_limiter: SharedRateLimiter whose budget all workers spend (None for unlimited)
+        quiet: Hide the workers' per-item output
+
+    Returns:
+        Merged summary dict (see run_shard)
+    """
+    import multiprocessing
+
+    from batch_writer import SharedBatchSizer
+
+    totals = {"items": 0, "created": 0, "updated": 0, "failed": 0, "errors": [], "unsynced": []}
+    initargs = (rate_limiter, SharedBatchSizer(), quiet)
+    with multiprocessing.Pool(processes, initializer=_init_worker, initargs=initargs) as pool:
+        for done, summary in enumerate(pool.imap_unordered(run_shard, jobs), 1):
+            for key in ("items", "created", "updated", "failed"):
+                totals[key] += summary[key]
+            totals["errors"].extend(summary["errors"])
+            totals["unsynced"].extend(summary["unsynced"])
+            print(f"✅ Shard {done}/{len(jobs)} done: {summary['items']} item(s), {summary['failed']} failed")
+
+    return totals
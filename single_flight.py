@@ -0,0 +1,71 @@
+"""
+Single-Flight for Monday.com Item Duplicator
+Lets concurrent callers of an identical read share one in-flight request
+"""
+
+import threading
+from typing import Any, Callable, Dict, Hashable
+
+
+class _Call:
+    """One in-flight call and its outcome"""
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """Deduplicates concurrent calls that share a key"""
+
+    def __init__(self):
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+
+        # Calls answered by another caller's request
+        self.shared = 0
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """
+        Run fn, or wait for the identical call already in flight
+
+        Only calls that overlap in time are shared; once a call finishes the
+        next caller with the same key runs fn again, so results never go stale.
+
+        Args:
+            key: Identity of the call (e.g. query text and variables)
+            fn: Function performing the call
+
+        Returns:
+            The result of fn, shared by every caller - treat it as read-only
+            (an exception raised by fn is raised to every caller)
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                self.shared += 1
+                leader = False
+            else:
+                call = _Call()
+                self._calls[key] = call
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+        return call.result
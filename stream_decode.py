@@ -0,0 +1,205 @@
+"""
+Streaming Decode for Monday.com Item Duplicator
+Decodes the items of an items_page response one at a time while the body downloads
+"""
+
+import codecs
+import itertools
+import json
+from typing import Dict, Iterable, Iterator, List, Optional, Union
+
+import json_codec
+
+_decoder = json.JSONDecoder()
+_SEPARATORS = " \t\n\r,"
+
+
+class ItemsPageStream:
+    """
+    Iterates over the items array of a GraphQL response as its chunks arrive
+
+    Bodies up to buffer_limit bytes are read whole and decoded in one call
+    through json_codec (orjson when installed), which is the fastest way to
+    decode them. Larger bodies are streamed: each item is decoded with the
+    stdlib decoder as soon as its closing brace has been received and is not
+    kept afterwards, so at most one undecoded item is buffered and the page
+    is never held as a whole. Streaming costs some decode speed (the stdlib
+    finds where each item ends) in exchange for memory that stays flat and
+    a first item before the download ends. Everything outside the items
+    array (the cursor, the enclosing boards/groups and any errors) is small
+    and is kept as text, then decoded once the body is complete, with
+    "items" left empty.
+    """
+
+    def __init__(self, chunks: Iterable[Union[bytes, str]], buffer_limit: int = 1 << 20):
+        """
+        Initialize streaming decode
+
+        Args:
+            chunks: Response body in pieces (UTF-8 bytes or text); a generator
+                    is closed when iteration stops early
+            buffer_limit: Largest body decoded in one call; larger ones are streamed
+        """
+        self.chunks = chunks
+        self.buffer_limit = buffer_limit
+
+        # Response "data" with an empty items array (set once the body has been read)
+        self.data: Optional[Dict] = None
+
+        # Scanner state for the text before the items array
+        self._in_string = False
+        self._escape = False
+        self._string = []
+        self._key_state = 0
+
+    def __iter__(self) -> Iterator[Dict]:
+        try:
+            chunks = iter(self.chunks)
+            head = []
+            size = 0
+            for chunk in chunks:
+                head.append(chunk)
+                size += len(chunk)
+                if size > self.buffer_limit:
+                    break
+            else:
+                yield from self._decode_buffered(head)
+                return
+            # Let the head go once the streamed decoder has consumed it
+            rest = itertools.chain(head, chunks)
+            del head
+            yield from self._decode_streamed(rest)
+        finally:
+            close = getattr(self.chunks, "close", None)
+            if close:
+                close()
+
+    def _decode_buffered(self, chunks: List[Union[bytes, str]]) -> Iterator[Dict]:
+        """Decode a complete small body in one call"""
+        body = b"".join(chunks) if chunks and isinstance(chunks[0], bytes) else "".join(chunks)
+        result = json_codec.loads(body)
+        yield from _take_items(result) or []
+
+        if "errors" in result:
+            raise Exception(f"GraphQL errors: {result['errors']}")
+        self.data = result["data"]
+
+    def _decode_streamed(self, chunks: Iterable[Union[bytes, str]]) -> Iterator[Dict]:
+        """Decode a large body item by item as its chunks arrive"""
+        decode = codecs.getincrementaldecoder("utf-8")().decode
+        skeleton = []
+        buffer = ""
+        state = "before"
+        retry_at = 0
+
+        # A final None flushes the decoder and the last items
+        for chunk in itertools.chain(chunks, [None]):
+            final = chunk is None
+            if final:
+                text = decode(b"", final=True)
+            else:
+                text = decode(chunk) if isinstance(chunk, bytes) else chunk
+
+            if state == "before":
+                start = self._find_items(text)
+                if start < 0:
+                    skeleton.append(text)
+                    continue
+                skeleton.append(text[:start])
+                text = text[start:]
+                state = "items"
+            elif state == "after":
+                skeleton.append(text)
+                continue
+
+            buffer += text
+            if len(buffer) < retry_at and not final:
+                continue
+
+            # Decode every complete item in the buffer, keep the incomplete tail
+            pos = 0
+            while True:
+                while pos < len(buffer) and buffer[pos] in _SEPARATORS:
+                    pos += 1
+                if pos == len(buffer):
+                    buffer = ""
+                    break
+                if buffer[pos] == "]":
+                    skeleton.append(buffer[pos:])
+                    buffer = ""
+                    state = "after"
+                    break
+                try:
+                    item, pos = _decoder.raw_decode(buffer, pos)
+                except json.JSONDecodeError:
+                    if final:
+                        raise json.JSONDecodeError("Response ended inside the items array", buffer, pos)
+                    # Item not complete yet - retry once the tail has doubled,
+                    # so items larger than a chunk are not re-decoded per chunk
+                    buffer = buffer[pos:]
+                    retry_at = 2 * len(buffer)
+                    break
+                retry_at = 0
+                yield item
+
+        if state == "items":
+            raise json.JSONDecodeError("Response ended inside the items array", buffer, len(buffer))
+
+        result = json_codec.loads("".join(skeleton))
+        if "errors" in result:
+            raise Exception(f"GraphQL errors: {result['errors']}")
+        self.data = result["data"]
+
+    def _find_items(self, text: str) -> int:
+        """
+        Scan skeleton text for the start of the "items" array (state carries across chunks)
+
+        Returns:
+            Index just past the '[' opening the items array ("[]" stays in the
+            skeleton), or -1 if it doesn't start in this chunk
+        """
+        for index, char in enumerate(text):
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+                    self._key_state = 1 if "".join(self._string) == "items" else 0
+                elif len(self._string) <= 5:
+                    self._string.append(char)
+            elif char == '"':
+                self._in_string = True
+                self._string = []
+            elif char in " \t\n\r":
+                continue
+            elif char == ":" and self._key_state == 1:
+                self._key_state = 2
+            elif char == "[" and self._key_state == 2:
+                return index + 1
+            else:
+                self._key_state = 0
+        return -1
+
+
+def _take_items(value) -> Optional[List[Dict]]:
+    """
+    Remove the first "items" array (in document order) from a decoded response
+
+    The array is left empty in the response, as on the streamed path.
+    """
+    if isinstance(value, dict):
+        for key, child in value.items():
+            if key == "items" and isinstance(child, list):
+                value[key] = []
+                return child
+            items = _take_items(child)
+            if items is not None:
+                return items
+    elif isinstance(value, list):
+        for child in value:
+            items = _take_items(child)
+            if items is not None:
+                return items
+    return None
@@ -0,0 +1,268 @@
+"""
+Sync Daemon for Monday.com Item Duplicator
+Long-running worker pool that drains the durable job queue
+"""
+
+import contextlib
+import threading
+import time
+from typing import Dict, List, Optional
+
+from config_loader import ConfigLoader
+from job_queue import Job, JobQueue
+from monday_item_duplicator import MondayItemDuplicator
+from resilience import CircuitOpen
+from write_buffer import PendingWrite, WriteBuffer
+
+# Locks serializing creates, picked by hashing the destination item's match key
+CREATE_LOCK_STRIPES = 64
+
+
+class SyncDaemon:
+    """Pool of worker threads sharing one client, one rate limit and warm caches"""
+
+    def __init__(
+        self,
+        config_loader: ConfigLoader,
+        duplicator: MondayItemDuplicator,
+        queue: JobQueue,
+        workers: int = 4,
+        poll_interval: float = 1.0,
+        max_attempts: int = 5,
+        backoff_seconds: float = 30.0,
+        updates_limit: int = 100,
+        write_window: float = 0.0,
+        cache_ttl: float = 300.0
+    ):
+        """
+        Initialize the daemon
+
+        Args:
+            config_loader: Loaded workflow configuration
+            duplicator: Client shared by all workers (carries the rate limiter and caches)
+            queue: Durable job queue to drain
+            workers: Number of worker threads
+            poll_interval: Seconds an idle worker waits before polling again
+            max_attempts: Attempts before a job is marked failed
+            backoff_seconds: Delay before the first retry of a failed job
+            updates_limit: Most recent updates copied per item for destinations with copy_updates
+            write_window: Seconds updates of the same destination item are combined for (0 = off)
+            cache_ttl: Seconds a destination board's item index and schema are trusted before reloading
+        """
+        self.config_loader = config_loader
+        self.duplicator = duplicator
+        self.queue = queue
+        self.workers = workers
+        self.poll_interval = poll_interval
+        self.max_attempts = max_attempts
+        self.backoff_seconds = backoff_seconds
+        self.updates_limit = updates_limit
+        self.cache_ttl = cache_ttl
+
+        # Destination board ID -> when its index and schema were loaded (time.monotonic())
+        self._loaded_at: Dict[int, float] = {}
+        self._cache_lock = threading.Lock()
+        self._create_locks = [threading.Lock() for _ in range(CREATE_LOCK_STRIPES)]
+
+        # Jobs fanning in on one destination item share a single update per window
+        if write_window > 0:
+            self.duplicator.write_buffer = WriteBuffer(duplicator, window=write_window)
+
+        self._stop = threading.Event()
+        self._threads = []
+
+    def _resolve(self, job: Job):
+        """Get the workflow, destination and resolved mappings for a job"""
+        workflow = self.config_loader.get_workflow(job.workflow_id)
+        if not workflow:
+            raise ValueError(f"Workflow '{job.workflow_id}' not found")
+        if not 0 <= job.dest_index < len(workflow.destinations):
+            raise ValueError(f"Workflow '{job.workflow_id}' has no destination {job.dest_index + 1}")
+
+        destination = workflow.destinations[job.dest_index]
+
+        # Precompiled by the config loader - no per-job merging
+        column_mapping = self.config_loader.resolve_column_mappings(destination)
+        column_names = self.config_loader.resolve_column_names(destination)
+        subitem_mapping = self.config_loader.resolve_subitem_mappings(destination)
+
+        return workflow, destination, column_mapping, column_names, subitem_mapping
+
+    def _load_destination(self, board_id: int):
+        """Build a destination board's index, reloading it and the board's schema once older than cache_ttl"""
+        now = time.monotonic()
+        with self._cache_lock:
+            loaded_at = self._loaded_at.get(board_id)
+            expired = loaded_at is not None and now - loaded_at >= self.cache_ttl
+            if loaded_at is None or expired:
+                self._loaded_at[board_id] = now
+
+        if expired:
+            # Columns and labels may have changed as well as items
+            self.duplicator.schema_cache.invalidate(board_id)
+            self.duplicator.translations.invalidate(board_id)
+        self.duplicator.build_destination_index(board_id, refresh=expired)
+
+    def process_job(self, job: Job) -> Dict:
+        """Sync one source item to one destination"""
+        workflow, destination, column_mapping, column_names, subitem_mapping = self._resolve(job)
+
+        items = self.duplicator.get_items_by_ids(
+            [int(job.item_id)],
+            list(column_mapping),
+            subitem_column_ids=list(subitem_mapping) if subitem_mapping is not None else None,
+            updates_limit=self.updates_limit if destination.copy_updates else 0
+        )
+        if not items:
+            raise ValueError(f"Item {job.item_id} not found")
+
+        # Warm the destination index; later jobs for the board are dict lookups until it expires
+        if destination.identity_column:
+            self.duplicator.identities.set_column(destination.board_id, destination.identity_column)
+        self._load_destination(destination.board_id)
+
+        # The index may predate an item created elsewhere since (e.g. by a batch run),
+        # so a miss is checked on the board before it turns into a create
+        create_lock = contextlib.nullcontext()
+        if self.duplicator.find_existing_item(destination.board_id, items[0]) is None:
+            if self.duplicator.recheck_existing_item(destination.board_id, items[0]) is None:
+                # Jobs fanning in on one new item take turns: the first creates it,
+                # the others then find it in the index and update it
+                create_lock = self._create_lock(destination.board_id, items[0])
+
+        dest_group_id = destination.group_id
+        if destination.mirror_groups:
+            group_map = self.duplicator.groups.group_map(workflow.source.board_id, destination.board_id)
+            dest_group_id = group_map.get(items[0].group_id, dest_group_id)
+
+        with create_lock:
+            return self.duplicator.duplicate_item_from_data(
+                source_item=items[0],
+                dest_board_id=destination.board_id,
+                dest_group_id=dest_group_id,
+                column_mapping=column_mapping,
+                column_names=column_names,
+                source_board_name=workflow.source.board_name,
+                dest_board_name=destination.board_name,
+                confirm=False,
+                source_board_id=workflow.source.board_id,
+                unknown_labels=destination.unknown_labels,
+                subitem_mapping=subitem_mapping,
+                copy_updates=destination.copy_updates
+            )
+
+    def _create_lock(self, board_id: int, source_item) -> threading.Lock:
+        """Get the lock serializing creates of a source item's destination item"""
+        key = source_item.id if self.duplicator.identities.column(board_id) else source_item.name
+        return self._create_locks[hash((board_id, key)) % CREATE_LOCK_STRIPES]
+
+    def _worker(self, worker_id: int):
+        """Claim and process jobs until stopped"""
+        breaker = self.duplicator.breaker
+        while not self._stop.is_set():
+            # Leave jobs queued while the API is failing instead of burning their attempts
+            if breaker.is_open and breaker.remaining() > 0:
+                self._stop.wait(min(breaker.remaining(), self.poll_interval * 10))
+                continue
+
+            job = self.queue.claim()
+            if not job:
+                self._stop.wait(self.poll_interval)
+                continue
+
+            buffer = self.duplicator.write_buffer
+            if buffer is not None:
+                buffer.take_added()
+
+            try:
+                result = self.process_job(job)
+                writes = buffer.take_added() if buffer is not None else []
+                if writes:
+                    # Settled by the flush of the buffered update; the worker moves on
+                    self._complete_after(job, worker_id, result, writes)
+                else:
+                    self._complete(job, worker_id, result)
+            except CircuitOpen as e:
+                self.queue.release(job, max(breaker.remaining(), self.poll_interval), str(e))
+                print(f"🔌 [worker {worker_id}] Job {job.id} postponed: circuit breaker open")
+            except Exception as e:
+                self._fail(job, worker_id, e)
+
+    def _complete(self, job: Job, worker_id: int, result: Dict):
+        """Mark a job done"""
+        self.queue.complete(job)
+        print(f"✅ [worker {worker_id}] Job {job.id}: {result['action']} '{result['item_name']}'")
+
+    def _fail(self, job: Job, worker_id: int, error: Exception):
+        """Mark a job failed, to be retried with backoff until max_attempts"""
+        self.queue.fail(job, str(error), self.max_attempts, self.backoff_seconds)
+        print(f"❌ [worker {worker_id}] Job {job.id} failed (attempt {job.attempts + 1}): {error}")
+
+    def _complete_after(self, job: Job, worker_id: int, result: Dict, writes: List[PendingWrite]):
+        """
+        Settle a job once its buffered writes are sent
+
+        The job stays running until then, so a crash before the flush leaves
+        it to be recovered, and a failed flush retries it like any failure.
+        """
+        lock = threading.Lock()
+        remaining = [len(writes)]
+        errors = []
+
+        def settle(write: PendingWrite):
+            with lock:
+                if write.error is not None:
+                    errors.append(write.error)
+                remaining[0] -= 1
+                if remaining[0]:
+                    return
+            if errors:
+                self._fail(job, worker_id, errors[0])
+            else:
+                self._complete(job, worker_id, result)
+
+        for write in writes:
+            write.add_done_callback(settle)
+
+    def start(self):
+        """Recover interrupted jobs and start the worker threads"""
+        recovered = self.queue.recover()
+        if recovered:
+            print(f"♻️  Recovered {recovered} interrupted job(s)")
+
+        for worker_id in range(1, self.workers + 1):
+            thread = threading.Thread(target=self._worker, args=(worker_id,), daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self, timeout: Optional[float] = None):
+        """Ask the workers to stop after their current job and wait for them"""
+        self._stop.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+        # Send updates still waiting for their flush window
+        if self.duplicator.write_buffer is not None:
+            self.duplicator.write_buffer.close()
+
+    def serve_forever(self, status_interval: float = 60.0):
+        """Run until interrupted, printing queue status periodically"""
+        self.start()
+        print(f"🛰️  Serving with {self.workers} worker(s) - press Ctrl+C to stop")
+
+        try:
+            while True:
+                time.sleep(status_interval)
+                counts = self.queue.counts()
+                print(
+                    f"📊 Queue: {counts['pending']} pending, {counts['running']} running, "
+                    f"{counts['done']} done, {counts['failed']} failed"
+                )
+                buffer = self.duplicator.write_buffer
+                if buffer is not None:
+                    print(f"📦 Write buffer: {buffer.sent} update(s) sent, {buffer.merged} combined into them")
+        except KeyboardInterrupt:
+            print("\n⏹️  Stopping workers...")
+            self.stop()
+            print("👋 Goodbye!")
@@ -102,8 +102,15 @@ def test_config_file():
         print_error(f"{template_path} not found")
         return False
 
-    # Check workflows.json
+    # Check workflows.json (or the sharded workflows.d/ directory)
     config_path = "config/workflows.json"
+    sharded_path = "config/workflows.d"
+    if os.path.isdir(sharded_path) and not os.path.exists(config_path):
+        print_success(f"{sharded_path}/ exists (sharded configuration)")
+        if not os.path.exists(os.path.join(sharded_path, "manifest.json")):
+            print_warning("No manifest.json - workflow IDs are taken from file names", 1)
+        return True
+
     if not os.path.exists(config_path):
         print_error(f"{config_path} not found")
         print_info(f"Create it from {template_path}", 1)
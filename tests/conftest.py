@@ -0,0 +1,9 @@
+"""
+Test configuration for Monday.com Item Duplicator
+Makes the flat root modules importable from the tests directory
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,75 @@
+"""Tests for batch_transform.ColumnarTransform"""
+
+from batch_transform import ColumnarTransform
+from item_model import Item
+from monday_item_duplicator import MondayItemDuplicator
+
+
+def make_item(item_id, column_values):
+    return Item.from_api({
+        "id": str(item_id),
+        "name": f"Item {item_id}",
+        "column_values": [
+            {"id": column_id, "type": column_type, "text": text, "value": value}
+            for column_id, column_type, text, value in column_values
+        ]
+    })
+
+
+def test_matches_per_item_mapping_including_invalid_values():
+    items = [
+        make_item(1, [
+            ("text", "text", "Hello", '"Hello"'),
+            ("link", "link", "https://a.example", '{"url": "https://a.example", "text": "a"}'),
+            ("status", "status", "Done", '{"index": 1}'),
+            ("dropdown", "dropdown", "SEO", '{"ids": [3]}'),
+            ("numbers", "numbers", "12", '"12"'),
+        ]),
+        make_item(2, [
+            ("text", "text", "", None),
+            ("link", "link", "broken", "{not json"),
+            ("status", "status", "Stuck", "{not json"),
+            ("dropdown", "dropdown", "", "null"),
+            ("numbers", "numbers", "7", "7"),
+        ]),
+        make_item(3, [
+            ("status", "status", "Done", '{"index": 1}'),
+            ("link", "link", "", '"just a string"'),
+        ]),
+    ]
+    duplicator = MondayItemDuplicator("test", validation="off")
+    mapping = {column_id: column_id for column_id in ("text", "link", "status", "dropdown", "numbers")}
+
+    expected = []
+    for item in items:
+        try:
+            expected.append(duplicator.map_column_values(item, mapping, {}))
+        except Exception as e:
+            expected.append(type(e))
+
+    results = ColumnarTransform(duplicator, mapping, {}).transform(items)
+    results = [type(result) if isinstance(result, Exception) else result for result in results]
+
+    assert results == expected
+    assert expected[2] is AttributeError
+
+
+def test_both_relation_spellings_are_remapped_on_both_paths(monkeypatch):
+    linked = '{"linkedPulseIds": [{"linkedPulseId": 11}, {"linkedPulseId": 12}]}'
+    items = [
+        make_item(1, [("relation", "board-relation", "A, B", linked)]),
+        make_item(2, [("relation", "board_relation", "A, B", linked)]),
+    ]
+    duplicator = MondayItemDuplicator("test", validation="off")
+    monkeypatch.setattr(duplicator.relations, "target_boards", lambda board_id, column_id: [99])
+    monkeypatch.setattr(duplicator.relations, "remap", lambda item_ids, targets: ([item_id + 100 for item_id in item_ids], []))
+    mapping = {"relation": "relation"}
+
+    expected = [duplicator.map_column_values(item, mapping, {}, dest_board_id=2) for item in items]
+    columnar = [
+        ColumnarTransform(duplicator, mapping, {}, dest_board_id=2).transform([item])[0]
+        for item in items
+    ]
+
+    assert columnar == expected
+    assert expected[0][0] == expected[1][0] == {"relation": {"item_ids": [111, 112]}}
@@ -0,0 +1,64 @@
+"""Tests for batch_writer batch sizing and retries"""
+
+import copy
+
+from batch_writer import AdaptiveBatchSizer, BatchWriter, SharedBatchSizer, WriteOp
+
+
+def test_shared_sizer_grows_once_per_full_batch_in_any_process():
+    first = SharedBatchSizer(initial=5)
+    # A copy shares the size in memory, like a worker started with the sizer
+    second = copy.copy(first)
+
+    for sizer in (first, second, first):
+        size = sizer.next_size()
+        sizer.record_success(size, latency=0.1)
+
+    assert second.next_size() == 8
+    assert first.next_size() == 8
+
+
+def test_shared_sizer_publishes_throttling():
+    first = SharedBatchSizer(initial=20)
+    second = copy.copy(first)
+
+    first.record_throttle(first.next_size())
+    assert first.next_size() == 10
+
+    # Each process halves on its own throttling, but shards started later begin at 10
+    assert second.next_size() == 20
+    assert first._shared.value == 10
+
+
+class ThrottlingDuplicator:
+    """Answers batches from a script: an exception to raise, or a response body"""
+
+    def __init__(self, script):
+        self.script = script
+        self.sent = []
+        self.intent_log = None
+
+    def execute_query_raw(self, query, variables):
+        self.sent.append(variables["name0"])
+        answer = self.script.pop(0)
+        if isinstance(answer, Exception):
+            raise answer
+        return answer
+
+
+def test_retries_restart_for_each_batch():
+    throttled = Exception("Complexity budget exhausted")
+    duplicator = ThrottlingDuplicator([
+        throttled, throttled, throttled,
+        throttled, {"data": {"op0": {"id": "2", "name": "Second"}}},
+    ])
+    writer = BatchWriter(duplicator, max_retries=2, backoff_seconds=0)
+    writer.sizers[1] = AdaptiveBatchSizer(initial=1, maximum=1)
+    ops = [WriteOp(kind="create", column_values={}, item_name=name, group_id="topics") for name in ("First", "Second")]
+
+    results = writer.write(1, ops)
+
+    # The first batch gives up after its retries; the second still gets its own
+    assert results[0] is throttled
+    assert results[1] == {"id": "2", "name": "Second"}
+    assert duplicator.sent == ["First"] * 3 + ["Second"] * 2
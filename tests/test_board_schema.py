@@ -0,0 +1,90 @@
+"""Tests for board_schema payload validation"""
+
+import json
+
+import pytest
+
+from board_schema import BoardSchema, ColumnSchema, SchemaCache
+
+
+def make_schema():
+    columns = [
+        {"id": "status", "title": "Status", "type": "color",
+         "settings_str": json.dumps({"labels": {"0": "Working on it", "1": "Done", "5": ""}})},
+        {"id": "dropdown", "title": "Tags", "type": "dropdown",
+         "settings_str": json.dumps({"labels": [{"id": 1, "name": "SEO"}, {"id": 2, "name": "Blog"}]})},
+        {"id": "text", "title": "Notes", "type": "text", "settings_str": "{}"},
+        {"id": "link", "title": "Link", "type": "link", "settings_str": "not json"},
+        {"id": "formula", "title": "Total", "type": "formula", "settings_str": "{}"},
+    ]
+    return BoardSchema(board_id=2, columns={column["id"]: ColumnSchema.from_api(column) for column in columns})
+
+
+def test_from_api_reads_labels_and_options():
+    schema = make_schema()
+
+    # "color" is the older name of status columns; empty labels are unused slots
+    assert schema.columns["status"].type == "status"
+    assert schema.columns["status"].status_labels == {"Working on it": 0, "Done": 1}
+    assert schema.columns["dropdown"].dropdown_options == {1: "SEO", 2: "Blog"}
+    # Unreadable settings leave the column without labels instead of failing
+    assert schema.columns["link"].type == "link"
+
+
+def test_validate_splits_valid_values_from_problems():
+    payload = {
+        "status": {"label": "Done"},
+        "dropdown": {"ids": [1, 3]},
+        "text": "Hello",
+        "link": {"url": "", "text": ""},
+        "formula": "1",
+        "missing": "x",
+    }
+
+    valid, problems = make_schema().validate(payload)
+
+    assert valid == {"status": {"label": "Done"}, "text": "Hello"}
+    assert [column_id for column_id, _ in problems] == ["dropdown", "link", "formula", "missing"]
+    assert "[3]" in dict(problems)["dropdown"]
+
+
+@pytest.mark.parametrize("value", [{"label": "Stuck"}, {"index": 7}, 3])
+def test_validate_rejects_unknown_status_values(value):
+    valid, problems = make_schema().validate({"status": value})
+    assert valid == {} and len(problems) == 1
+
+
+def test_validate_allows_new_labels_when_they_will_be_created():
+    payload = {"status": {"label": "Stuck"}, "dropdown": {"labels": ["SEO", "News"]}}
+
+    assert make_schema().validate(payload)[1] != []
+    assert make_schema().validate(payload, allow_new_labels=True) == (payload, [])
+
+
+def test_check_mapping_reports_missing_and_read_only_columns():
+    problems = make_schema().check_mapping(["text", "formula", "missing"])
+
+    assert len(problems) == 2
+    assert problems[0].startswith("formula: 'Total' is a read-only formula column")
+    assert problems[1] == "missing: column does not exist on board 2"
+
+
+class FakeDuplicator:
+    def __init__(self):
+        self.queries = []
+
+    def execute_query(self, query, variables):
+        self.queries.append(variables["boardIds"])
+        return {"boards": [{"id": "2", "columns": [{"id": "text", "title": "Notes", "type": "text"}]}]}
+
+
+def test_schema_cache_fetches_each_board_once():
+    duplicator = FakeDuplicator()
+    cache = SchemaCache(duplicator)
+
+    assert cache.get(2).columns["text"].title == "Notes"
+    cache.get("2")
+    assert duplicator.queries == [["2"]]
+
+    with pytest.raises(ValueError, match="Board 3 not found"):
+        cache.prefetch([2, 3])
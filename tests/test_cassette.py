@@ -0,0 +1,72 @@
+"""Tests for cassette recording and replay"""
+
+import json
+
+import pytest
+from requests.exceptions import ReadTimeout
+
+from cassette import CassetteMiss, RecordingTransport, ReplayTransport
+
+API_KEY = "secret-key-123"
+
+
+def make_send(responses):
+    def send(payload):
+        response = responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+    return send
+
+
+def test_recorded_traffic_replays_in_order_without_the_api_key(tmp_path):
+    path = str(tmp_path / "cassettes" / "run.jsonl")
+    query = {"query": "query { me { id } }", "variables": {"token": API_KEY}}
+    other = {"query": "query { boards { id } }"}
+    recorder = RecordingTransport(make_send([
+        (200, '{"data": {"me": {"id": "1"}}}'),
+        ReadTimeout(f"timed out for {API_KEY}"),
+        (200, '{"data": {"boards": []}}'),
+    ]), path, api_key=API_KEY)
+
+    assert recorder.post(query) == (200, '{"data": {"me": {"id": "1"}}}')
+    with pytest.raises(ReadTimeout):
+        recorder.post(query)
+    recorder.post(other)
+
+    with open(path, encoding="utf-8") as f:
+        text = f.read()
+    assert API_KEY not in text
+    assert json.loads(text.splitlines()[1])["request"]["variables"] == {"token": "<API_KEY>"}
+
+    # Replayed requests are matched on the scrubbed payload
+    replay = ReplayTransport(path, latency_scale=0)
+    scrubbed = {"query": query["query"], "variables": {"token": "<API_KEY>"}}
+    assert replay.post(scrubbed) == (200, '{"data": {"me": {"id": "1"}}}')
+    with pytest.raises(Exception, match="timed out for <API_KEY>") as error:
+        replay.post(scrubbed)
+    # Errors come back as their recorded class, so retries and the breaker treat them the same
+    assert type(error.value) is ReadTimeout
+    # The last answer for a request repeats once the recorded ones are used up
+    with pytest.raises(Exception, match="timed out"):
+        replay.post(scrubbed)
+
+    assert replay.unused() == 1
+    assert replay.post(dict(reversed(list(other.items())))) == (200, '{"data": {"boards": []}}')
+    assert replay.unused() == 0
+
+
+def test_unrecorded_request_is_a_miss(tmp_path):
+    path = str(tmp_path / "run.jsonl")
+    RecordingTransport(make_send([]), path)
+
+    with pytest.raises(CassetteMiss, match="query { items"):
+        ReplayTransport(path).post({"query": "query {\n  items { id }\n}"})
+
+
+def test_file_that_is_not_a_cassette_is_rejected(tmp_path):
+    path = tmp_path / "run.jsonl"
+    path.write_text('{"request": {}}\n')
+
+    with pytest.raises(ValueError, match="not a version 1 cassette"):
+        ReplayTransport(str(path))
@@ -0,0 +1,76 @@
+"""Tests for config_loader compiled configuration cache"""
+
+import hashlib
+import os
+import shutil
+
+import config_loader
+from config_loader import ConfigLoader
+
+TEMPLATE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "config", "workflows.template.json")
+
+
+def test_same_size_edit_within_timestamp_is_not_served_from_cache(tmp_path):
+    path = str(tmp_path / "workflows.json")
+    shutil.copy(TEMPLATE, path)
+    assert ConfigLoader(path).get_workflow("multi_dest") is not None
+
+    # Rename a workflow without changing the file's size or modification time
+    stat = os.stat(path)
+    with open(path) as f:
+        raw = f.read()
+    with open(path, "w") as f:
+        f.write(raw.replace('"multi_dest"', '"multi_desX"'))
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    loader = ConfigLoader(path)
+    assert loader.get_workflow("multi_dest") is None
+    assert loader.get_workflow("multi_desX") is not None
+
+
+def test_cache_for_another_file_is_ignored(tmp_path):
+    first = str(tmp_path / "first.json")
+    second = str(tmp_path / "second.json")
+    shutil.copy(TEMPLATE, first)
+    ConfigLoader(first)
+
+    with open(TEMPLATE) as f:
+        raw = f.read()
+    with open(second, "w") as f:
+        f.write(raw.replace('"multi_dest"', '"other"'))
+    shutil.copy(first + ".cache", second + ".cache")
+
+    assert ConfigLoader(second).get_workflow("other") is not None
+
+
+def test_unchanged_file_is_not_read_again(tmp_path, monkeypatch):
+    path = str(tmp_path / "workflows.json")
+    shutil.copy(TEMPLATE, path)
+    # Last modified well before the cache is written
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns - 3600 * 10**9))
+    ConfigLoader(path)
+
+    def fail(*args):
+        raise AssertionError("config file hashed again")
+
+    monkeypatch.setattr(hashlib, "sha256", fail)
+    assert ConfigLoader(path).get_workflow("multi_dest") is not None
+
+
+def test_recently_modified_file_is_hashed_until_its_timestamp_can_be_trusted(tmp_path, monkeypatch):
+    path = str(tmp_path / "workflows.json")
+    shutil.copy(TEMPLATE, path)
+    ConfigLoader(path)
+
+    hashed = []
+    sha256 = hashlib.sha256
+    monkeypatch.setattr(hashlib, "sha256", lambda data: hashed.append(len(data)) or sha256(data))
+    ConfigLoader(path)
+    ConfigLoader(path)
+    assert len(hashed) == 2
+
+    # Once the last check is past the timestamp resolution, the stat is enough
+    monkeypatch.setattr(config_loader, "MTIME_RESOLUTION_NS", 0)
+    ConfigLoader(path)
+    assert len(hashed) == 2
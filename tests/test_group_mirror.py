@@ -0,0 +1,31 @@
+"""Tests for group_mirror.GroupMirror"""
+
+from group_mirror import GroupMirror
+
+
+class FakeDuplicator:
+    def __init__(self, boards):
+        self.boards = boards
+        self.created = []
+
+    def execute_query(self, query, variables):
+        if query.lstrip().startswith("mutation"):
+            names = [value for name, value in variables.items() if name.startswith("name")]
+            self.created.append(names)
+            return {f"group{index}": {"id": f"new{index}"} for index in range(len(names))}
+        return {"boards": [
+            {"id": board_id, "groups": [{"id": group_id, "title": title} for group_id, title in self.boards[board_id]]}
+            for board_id in variables["boardIds"]
+        ]}
+
+
+def test_titles_differing_in_case_and_spacing_create_one_group():
+    duplicator = FakeDuplicator({
+        "1": [("a", "In  Progress"), ("b", "in progress"), ("c", "Done")],
+        "2": [("x", "done")],
+    })
+
+    group_map = GroupMirror(duplicator).group_map(1, 2)
+
+    assert duplicator.created == [["In  Progress"]]
+    assert group_map == {"a": "new0", "b": "new0", "c": "x"}
@@ -0,0 +1,102 @@
+"""Tests for identity_match.IdentityMatcher"""
+
+from identity_match import IdentityMatcher
+from item_model import Item
+
+BOARD = 2
+COLUMN = "source_id"
+
+
+def make_item(item_id, name, identity=None):
+    column_values = []
+    if identity is not None:
+        column_values.append({"id": COLUMN, "type": "text", "text": identity, "value": f'"{identity}"' if identity else None})
+    return Item.from_api({"id": str(item_id), "name": name, "column_values": column_values})
+
+
+class FakeDuplicator:
+    """Answers the matcher's two lookups from a list of destination items"""
+
+    def __init__(self, dest_items):
+        self.dest_items = dest_items
+        self.calls = []
+
+    def get_items_by_column_values(self, board_id, column_id, values, column_ids=None):
+        self.calls.append(("identity", list(values)))
+        by_identity = {item.columns[column_id].text: item for item in self.dest_items if column_id in item.columns}
+        return {value: by_identity[value] for value in values if value in by_identity}
+
+    def get_items_by_names(self, board_id, names, column_ids=None):
+        self.calls.append(("name", list(names)))
+        found = {}
+        for item in self.dest_items:
+            if item.name in names:
+                found.setdefault(item.name, item)
+        return found
+
+
+def make_matcher(dest_items):
+    matcher = IdentityMatcher(FakeDuplicator(dest_items))
+    matcher.set_column(BOARD, COLUMN)
+    return matcher
+
+
+def test_index_matches_by_identity_and_keeps_same_names_apart():
+    dest = [make_item(10, "Topic", "1"), make_item(11, "Topic", "2")]
+    matcher = make_matcher(dest)
+    matcher.build_index(BOARD, dest)
+
+    assert matcher.find(BOARD, make_item(2, "Topic")).id == "11"
+    assert matcher.find(BOARD, make_item(1, "Topic")).id == "10"
+    assert matcher.find(BOARD, make_item(3, "Topic")) is None
+
+
+def test_index_adopts_each_unclaimed_item_once():
+    dest = [make_item(10, "Renamed later", "1"), make_item(11, "Topic", ""), make_item(12, "Topic")]
+    matcher = make_matcher(dest)
+    matcher.build_index(BOARD, dest)
+
+    # A renamed source item still finds its item by ID
+    assert matcher.find(BOARD, make_item(1, "New name")).id == "10"
+    # Items synced by name before the column existed are adopted in board order, once each
+    assert matcher.find(BOARD, make_item(2, "Topic")).id == "11"
+    assert matcher.find(BOARD, make_item(3, "Topic")).id == "12"
+    assert matcher.find(BOARD, make_item(4, "Topic")) is None
+    # An adopted item stays with the source item that adopted it
+    assert matcher.find(BOARD, make_item(2, "Topic")).id == "11"
+
+
+def test_lookup_resolves_a_batch_and_adopts_an_unclaimed_item_once():
+    dest = [make_item(10, "Renamed later", "1"), make_item(11, "Topic", "")]
+    matcher = make_matcher(dest)
+    source = [make_item(1, "New name"), make_item(2, "Topic"), make_item(3, "Topic")]
+
+    matcher.lookup(BOARD, source)
+    found = [matcher.find(BOARD, item) for item in source]
+
+    assert [item.id if item else None for item in found] == ["10", "11", None]
+    # One identity lookup for the batch, one name lookup for the IDs it missed
+    assert matcher.duplicator.calls == [("identity", ["1", "2", "3"]), ("name", ["Topic", "Topic"])]
+
+
+def test_lookup_does_not_adopt_an_item_claimed_by_another_source_item():
+    dest = [make_item(10, "Topic", "99")]
+    matcher = make_matcher(dest)
+
+    matcher.lookup(BOARD, [make_item(1, "Topic")])
+
+    assert matcher.find(BOARD, make_item(1, "Topic")) is None
+
+
+def test_stamp_writes_the_identity_and_renames_matched_items():
+    matcher = make_matcher([])
+    renamed = {}
+    matcher.stamp(BOARD, make_item(1, "New name"), make_item(10, "Old name", "1"), renamed)
+    created = {}
+    matcher.stamp(BOARD, make_item(2, "Topic"), None, created)
+    by_name = {}
+    matcher.stamp(1, make_item(3, "Topic"), None, by_name)
+
+    assert renamed == {COLUMN: "1", "name": "New name"}
+    assert created == {COLUMN: "2"}
+    assert by_name == {}
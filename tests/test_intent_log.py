@@ -0,0 +1,107 @@
+"""Tests for intent_log recovery and safe creates"""
+
+from types import SimpleNamespace
+
+import pytest
+from requests.exceptions import ReadTimeout
+
+from intent_log import Intent, IntentLog
+from monday_item_duplicator import MondayItemDuplicator
+
+
+class FakeBoard:
+    """Answers get_items_by_column_values() from a fixed set of items"""
+
+    def __init__(self, items):
+        self.items = items
+        self.lookups = []
+
+    def get_items_by_column_values(self, board_id, column_id, values, column_ids=None):
+        self.lookups.append((board_id, column_id, list(values)))
+        return {
+            value: SimpleNamespace(id=self.items[(board_id, column_id, value)])
+            for value in values if (board_id, column_id, value) in self.items
+        }
+
+
+def test_recover_settles_intents_left_pending_by_an_earlier_run(tmp_path):
+    path = str(tmp_path / "intents.sqlite3")
+    earlier = IntentLog(path)
+    earlier.record_many([
+        Intent(id=0, board_id=1, group_id="topics", item_name="Applied"),
+        Intent(id=0, board_id=1, group_id="topics", item_name="Lost"),
+        Intent(id=0, board_id=1, group_id="topics", item_name="Renamed",
+               source_item_id="42", identity_column="text_source", identity_value="42"),
+    ])
+    earlier.close()
+
+    log = IntentLog(path)
+    board = FakeBoard({(1, "name", "Applied"): "100", (1, "text_source", "42"): "101"})
+
+    assert log.recover(board) == {"committed": 2, "abandoned": 1}
+    # One batched read per board and column
+    assert sorted(board.lookups) == [(1, "name", ["Applied", "Lost"]), (1, "text_source", ["42"])]
+    assert log.pending() == []
+    assert log.recover(board) == {"committed": 0, "abandoned": 0}
+
+
+def make_duplicator(tmp_path, create_results, items):
+    duplicator = MondayItemDuplicator("test", validation="off", intent_log=IntentLog(str(tmp_path / "intents.sqlite3")))
+    board = FakeBoard(items)
+    creates = []
+
+    def create_item_with_values(board_id, group_id, item_name, column_values, create_labels_if_missing=False):
+        creates.append(item_name)
+        result = create_results.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    duplicator.create_item_with_values = create_item_with_values
+    duplicator.get_items_by_column_values = board.get_items_by_column_values
+    return duplicator, creates
+
+
+def test_ambiguous_failure_is_not_resent_when_the_item_exists(tmp_path):
+    duplicator, creates = make_duplicator(tmp_path, [ReadTimeout("read timed out")], {(1, "name", "Topic"): "100"})
+
+    assert duplicator.create_item_safely(1, "topics", "Topic", {}) == {"id": "100", "name": "Topic"}
+    assert creates == ["Topic"]
+    assert duplicator.intent_log.pending() == []
+
+
+def test_ambiguous_failure_is_resent_when_the_item_is_missing(tmp_path):
+    duplicator, creates = make_duplicator(tmp_path, [ReadTimeout("read timed out"), {"id": "100", "name": "Topic"}], {})
+
+    assert duplicator.create_item_safely(1, "topics", "Topic", {}) == {"id": "100", "name": "Topic"}
+    assert creates == ["Topic", "Topic"]
+    assert duplicator.intent_log.pending() == []
+
+
+def test_definite_rejection_is_abandoned_without_a_resend(tmp_path):
+    duplicator, creates = make_duplicator(tmp_path, [Exception("GraphQL errors: invalid column")], {})
+
+    with pytest.raises(Exception, match="invalid column"):
+        duplicator.create_item_safely(1, "topics", "Topic", {})
+
+    assert creates == ["Topic"]
+    assert duplicator.intent_log.pending() == []
+
+
+def test_earlier_pending_creates_are_settled_before_the_first_create(tmp_path):
+    earlier = IntentLog(str(tmp_path / "intents.sqlite3"))
+    earlier.record(Intent(id=0, board_id=1, group_id="topics", item_name="Lost"))
+    earlier.close()
+
+    duplicator, creates = make_duplicator(tmp_path, [{"id": "100", "name": "Topic"}], {})
+    # Nothing is read or settled until something is created
+    assert [intent.item_name for intent in duplicator.intent_log.pending()] == ["Lost"]
+
+    duplicator.create_item_safely(1, "topics", "Topic", {})
+
+    assert creates == ["Topic"]
+    assert duplicator.intent_log.pending() == []
+    # Settled once per client
+    duplicator.intent_log.record(Intent(id=0, board_id=1, group_id="topics", item_name="In flight"))
+    duplicator.recover_pending_creates()
+    assert [intent.item_name for intent in duplicator.intent_log.pending()] == ["In flight"]
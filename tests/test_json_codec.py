@@ -0,0 +1,68 @@
+"""Tests for json_codec"""
+
+import pytest
+
+import json_codec
+
+BACKENDS = ["json"] + (["orjson"] if json_codec.orjson is not None else [])
+
+
+@pytest.fixture(params=BACKENDS)
+def codec(request, monkeypatch):
+    """json_codec running on one backend"""
+    if request.param == "json":
+        monkeypatch.setattr(json_codec, "orjson", None)
+    return json_codec
+
+
+def test_dumps_is_compact_utf8(codec):
+    payload = {"name": "Ünïcödé ✅", "ids": [1, 2], "nested": {"url": "https://a.example/?q=\"x\""}}
+    assert codec.dumps(payload) == '{"name":"Ünïcödé ✅","ids":[1,2],"nested":{"url":"https://a.example/?q=\\"x\\""}}'
+
+
+def test_dumps_sorts_keys_for_cache_keys(codec):
+    assert codec.dumps({"b": 1, "a": {"d": 2, "c": 3}}, sort_keys=True) == '{"a":{"c":3,"d":2},"b":1}'
+
+
+def test_loads_accepts_str_and_utf8_bytes(codec):
+    assert codec.loads('{"a": [1, "✅"]}') == {"a": [1, "✅"]}
+    assert codec.loads('{"a": [1, "✅"]}'.encode("utf-8")) == {"a": [1, "✅"]}
+
+
+@pytest.mark.parametrize("text", ["{not json", "", '{"a": 1'])
+def test_invalid_json_raises_the_shared_error(codec, text):
+    with pytest.raises(json_codec.JSONDecodeError):
+        codec.loads(text)
+
+
+PAYLOADS = [
+    {"status": {"label": "Done"}, "dropdown": {"ids": [3, 1]}, "link": {"url": "https://a.example", "text": "a"}},
+    {"text": "Ünïcödé ✅ \"quoted\" \\ \n\t", "numbers": "12", "empty": None, "checked": True},
+    {"item_ids": [123456789012, 0, -1], "ratio": 0.1, "half": 1.5, "zero": -0.0, "big": 2 ** 70},
+    # Non-string keys are coerced like the json module does (orjson alone would refuse them)
+    {1: "one", 20: "twenty", 3: {True: "yes"}},
+]
+
+
+@pytest.mark.skipif(json_codec.orjson is None, reason="orjson is not installed")
+@pytest.mark.parametrize("payload", PAYLOADS)
+@pytest.mark.parametrize("sort_keys", [False, True])
+def test_backends_write_the_same_text(monkeypatch, payload, sort_keys):
+    with_orjson = json_codec.dumps(payload, sort_keys=sort_keys)
+    monkeypatch.setattr(json_codec, "orjson", None)
+
+    assert with_orjson == json_codec.dumps(payload, sort_keys=sort_keys)
+
+
+@pytest.mark.skipif(json_codec.orjson is None, reason="orjson is not installed")
+def test_documented_backend_differences(monkeypatch):
+    floats = [1e20, 1e-7]
+    with_orjson = json_codec.dumps(floats)
+    assert json_codec.dumps(float("nan")) == "null"
+    monkeypatch.setattr(json_codec, "orjson", None)
+
+    # Exponents are written differently but decode to the same numbers
+    assert (with_orjson, json_codec.dumps(floats)) == ("[1e20,1e-7]", "[1e+20,1e-07]")
+    assert json_codec.loads(with_orjson) == json_codec.loads(json_codec.dumps(floats)) == floats
+    with pytest.raises(ValueError):
+        json_codec.dumps({"value": float("inf")})
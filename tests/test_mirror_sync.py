@@ -0,0 +1,132 @@
+"""Tests for mirror_sync set-difference reconciliation"""
+
+import pytest
+
+from item_model import Item
+from mirror_sync import MirrorSync, archive_limit, match_items, values_match
+from monday_item_duplicator import MondayItemDuplicator
+
+
+def make_item(item_id, name, columns=()):
+    return Item.from_api({
+        "id": str(item_id),
+        "name": name,
+        "column_values": [
+            {"id": column_id, "type": column_type, "text": text, "value": value}
+            for column_id, column_type, text, value in columns
+        ]
+    })
+
+
+def ids(items):
+    return [item.id for item in items]
+
+
+def pairs(matched):
+    return [(source.id, dest.id) for source, dest in matched]
+
+
+def test_duplicate_names_are_matched_once_each():
+    source = [make_item(1, "Topic"), make_item(2, "Topic"), make_item(3, "New")]
+    dest = [make_item(10, "Topic"), make_item(11, "Gone"), make_item(12, "Topic"), make_item(13, "Topic")]
+
+    plan = match_items(source, dest)
+
+    # The n-th source "Topic" pairs with the n-th destination "Topic", in board order
+    assert pairs(plan.update) == [("1", "10"), ("2", "12")]
+    assert ids(plan.create) == ["3"]
+    assert ids(plan.archive) == ["11", "13"]
+
+
+def test_identity_column_matches_renamed_items_before_names():
+    source = [make_item(1, "Renamed"), make_item(2, "Untracked"), make_item(3, "Fresh")]
+    dest = [
+        make_item(10, "Old name", [("source_id", "text", "1", '"1"')]),
+        make_item(11, "Untracked", [("source_id", "text", "", None)]),
+        make_item(12, "Copy", [("source_id", "text", "1", '"1"')]),
+        # Carries another source item's ID, so its name alone must not match it
+        make_item(13, "Fresh", [("source_id", "text", "99", '"99"')]),
+    ]
+
+    plan = match_items(source, dest, identity_column="source_id")
+
+    assert pairs(plan.update) == [("1", "10"), ("2", "11")]
+    assert ids(plan.create) == ["3"]
+    assert ids(plan.archive) == ["12", "13"]
+
+
+def test_values_match_compares_written_values_with_current_columns():
+    item = make_item(10, "Topic", [
+        ("text", "text", "Hello", '"Hello"'),
+        ("status", "status", "Done", '{"index": 1}'),
+        ("dropdown", "dropdown", "SEO, Blog", '{"ids": [3, 1]}'),
+        ("relation", "board_relation", "A", '{"linkedPulseIds": [{"linkedPulseId": 7}]}'),
+    ])
+
+    assert values_match({
+        "text": "Hello",
+        "status": {"label": "Done"},
+        "dropdown": {"ids": [1, 3]},
+        "relation": {"item_ids": [7]},
+    }, item)
+    assert not values_match({"status": {"label": "Stuck"}}, item)
+    assert not values_match({"dropdown": {"labels": ["SEO"]}}, item)
+    assert not values_match({"missing": "x"}, item)
+
+
+@pytest.mark.parametrize("setting, expected", [("50", 50), ("10%", 3), ("0%", 0)])
+def test_archive_limit(setting, expected):
+    assert archive_limit(setting, 21) == expected
+
+
+def test_plan_skips_items_already_in_sync():
+    source = [make_item(1, "Same", [("text", "text", "a", '"a"')]), make_item(2, "Changed", [("text", "text", "b", '"b"')])]
+    dest = [make_item(10, "Same", [("text", "text", "a", '"a"')]), make_item(11, "Changed", [("text", "text", "old", '"old"')])]
+    duplicator = MondayItemDuplicator("test", validation="off")
+
+    plan = MirrorSync(duplicator).plan(source, dest, 2, {"text": "text"}, {})
+
+    assert pairs(plan.unchanged) == [("1", "10")]
+    assert pairs(plan.update) == [("2", "11")]
+    assert plan.create == [] and plan.archive == []
+
+
+def test_plan_clears_columns_emptied_in_the_source():
+    source = [
+        make_item(1, "Emptied", [("text", "text", "", None), ("status", "status", "", None)]),
+        make_item(2, "Both empty", [("text", "text", "", None), ("status", "status", "", None)]),
+        # Columns not read from the source are left alone
+        make_item(3, "Not read"),
+    ]
+    dest = [
+        make_item(10, "Emptied", [("text", "text", "old", '"old"'), ("status", "status", "Done", '{"index": 1}')]),
+        make_item(11, "Both empty", [("text", "text", "", None), ("status", "status", "", None)]),
+        make_item(12, "Not read", [("text", "text", "old", '"old"')]),
+    ]
+    duplicator = MondayItemDuplicator("test", validation="off")
+
+    plan = MirrorSync(duplicator).plan(source, dest, 2, {"text": "text", "status": "status"}, {})
+
+    assert pairs(plan.update) == [("1", "10")]
+    assert pairs(plan.unchanged) == [("2", "11"), ("3", "12")]
+    assert plan.prepared["1"]["mapped_values"] == {"text": "", "status": {}}
+
+
+def test_planned_payloads_are_written_without_mapping_again():
+    source = [make_item(1, "Changed", [("text", "text", "b", '"b"')])]
+    dest = [make_item(10, "Changed", [("text", "text", "old", '"old"')])]
+    duplicator = MondayItemDuplicator("test", validation="off")
+    plan = MirrorSync(duplicator).plan(source, dest, 2, {"text": "text"}, {})
+
+    sent = []
+    duplicator.writer.write = lambda board_id, ops: sent.extend(ops) or [{"id": op.item_id, "name": op.item_name} for op in ops]
+    duplicator.prepare_items = lambda *args, **kwargs: pytest.fail("payload mapped twice")
+
+    results = duplicator.duplicate_items(
+        [source_item for source_item, _ in plan.update], 2, "topics", {"text": "text"},
+        existing_items=[dest_item for _, dest_item in plan.update],
+        prepared=[plan.prepared[source_item.id] for source_item, _ in plan.update]
+    )
+
+    assert [result["action"] for result in results] == ["UPDATED"]
+    assert [(op.item_id, op.column_values) for op in sent] == [("10", {"text": "b"})]
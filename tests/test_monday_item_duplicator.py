@@ -0,0 +1,160 @@
+"""Tests for MondayItemDuplicator lookups, subitems and updates"""
+
+from board_schema import BoardSchema, ColumnSchema
+from item_model import ColumnValue, Item, Update
+from monday_item_duplicator import MondayItemDuplicator
+from update_log import UpdateLog
+
+
+def api_item(item_id, name, columns=()):
+    return {
+        "id": str(item_id),
+        "name": name,
+        "group": {"id": "topics", "title": "Topics"},
+        "column_values": [{"id": column_id, "type": "text", "text": text, "value": None} for column_id, text in columns],
+    }
+
+
+def make_duplicator(answer):
+    duplicator = MondayItemDuplicator("test", validation="off")
+    calls = []
+
+    def execute_query(query, variables=None):
+        calls.append((query, variables))
+        return answer(query, variables)
+
+    duplicator.execute_query = execute_query
+    return duplicator, calls
+
+
+def test_values_are_deduplicated_and_sent_as_variables_in_chunks():
+    names = [f'Item "{index}" \\ {{}}' for index in range(250)]
+
+    def answer(query, variables):
+        return {"boards": [{"items_page": {"cursor": None, "items": [
+            api_item(index, name) for index, name in enumerate(variables["values"])
+        ]}}]}
+
+    duplicator, calls = make_duplicator(answer)
+    found = duplicator.get_items_by_names(1, names + names[:10])
+
+    assert [len(variables["values"]) for _, variables in calls] == [100, 100, 50]
+    # One query text for every chunk: values never end up in the query itself
+    assert len({query for query, _ in calls}) == 1
+    assert "any_of" in calls[0][0] and names[0] not in calls[0][0]
+    assert calls[0][1]["values"][0] == names[0]
+    assert set(found) == set(names)
+
+
+def test_pages_are_followed_and_the_first_item_per_value_is_kept():
+    def answer(query, variables):
+        if "next_items_page" in query:
+            assert variables["cursor"] == "page2"
+            return {"next_items_page": {"cursor": None, "items": [api_item(3, "Third", [("source_id", "7")])]}}
+        assert variables["columnId"] == "source_id"
+        return {"boards": [{"items_page": {"cursor": "page2", "items": [
+            api_item(1, "First", [("source_id", "5")]),
+            api_item(2, "Duplicate", [("source_id", "5")]),
+        ]}}]}
+
+    duplicator, calls = make_duplicator(answer)
+    found = duplicator.get_items_by_column_values(1, "source_id", [5, "7", "9"], column_ids=[])
+
+    assert {value: item.id for value, item in found.items()} == {"5": "1", "7": "3"}
+    # The matched column is fetched so results can be keyed by it
+    assert calls[0][1]["columnIds"] == ["source_id"]
+    assert len(calls) == 2
+
+
+class FakeMutations:
+    """Answers aliased mutations, failing the operations on the listed names or item IDs"""
+
+    def __init__(self, failing=()):
+        self.failing = set(failing)
+        self.sent = []
+
+    def __call__(self, query, variables=None):
+        self.sent.append((query, variables))
+        data, errors = {}, []
+        for line in query.splitlines()[2:-1]:
+            alias, operation = line.strip().split(": ", 1)
+            index = alias[2:]
+            name = variables.get(f"name{index}")
+            if self.failing & {variables.get(f"{prefix}{index}") for prefix in ("name", "item", "parent")}:
+                errors.append({"message": f"{operation.split('(')[0]} rejected", "path": [alias]})
+                data[alias] = None
+            else:
+                data[alias] = {"id": f"new-{alias}", "name": name}
+        return {"data": data, "errors": errors} if errors else {"data": data}
+
+
+def subitem_board_duplicator(existing_subitems):
+    duplicator = MondayItemDuplicator("test", validation="off")
+    duplicator.schema_cache.schemas[2] = BoardSchema(2, {
+        "subitems": ColumnSchema("subitems", "Subitems", "subtasks", linked_board_ids=[3])
+    })
+    duplicator.get_items_by_ids = lambda item_ids, column_ids=None, subitem_column_ids=None, **kwargs: [
+        Item(str(item_id), "Parent", subitems=existing_subitems.get(str(item_id), [])) for item_id in item_ids
+    ]
+    return duplicator
+
+
+def text_column(text):
+    return {"text": ColumnValue("text", "text", text, f'"{text}"')}
+
+
+def test_subitems_of_every_parent_share_one_aliased_mutation():
+    duplicator = subitem_board_duplicator({"100": [Item("500", "Existing")]})
+    duplicator.execute_query_raw = mutations = FakeMutations(failing={"Broken"})
+
+    parents = [
+        (Item("1", "First", subitems=[Item("11", "Existing", columns=text_column("a")), Item("12", "New")]), "100", True),
+        (Item("2", "Second", subitems=[Item("21", "Broken"), Item("22", "Also new")]), "200", False),
+        (Item("3", "No subitems", subitems=[]), "300", False),
+    ]
+    outcome = duplicator.duplicate_subitems(parents, 2, {"text": "text"})
+
+    assert outcome == {
+        "100": {"created": 1, "updated": 1, "failed": 0},
+        "200": {"created": 1, "updated": 0, "failed": 1},
+    }
+    assert len(mutations.sent) == 1
+    query, variables = mutations.sent[0]
+    # Existing subitems are updated on the subitem board, new ones created under their parent
+    assert "op0: change_multiple_column_values(board_id: $boardId, item_id: $item0" in query
+    assert (variables["boardId"], variables["item0"]) == ("3", "500")
+    assert [variables[f"parent{index}"] for index in (1, 2, 3)] == ["100", "200", "200"]
+    # A created subitem is indexed, so a re-run updates it instead of creating it again
+    assert duplicator.subitem_indexes["200"]["Also new"].id == "new-op3"
+
+
+def make_update(update_id, body, creator="Dana"):
+    return Update(update_id, body, "2024-05-01T10:00:00Z", creator)
+
+
+def test_updates_are_copied_oldest_first_and_only_once(tmp_path):
+    duplicator = MondayItemDuplicator("test", validation="off", update_log=UpdateLog(str(tmp_path / "updates.sqlite3")))
+    duplicator.execute_query_raw = mutations = FakeMutations(failing={"200"})
+
+    # The API lists updates newest first
+    source = Item("1", "Topic", updates=[make_update("u2", "<p>Second</p>"), make_update("u1", "<p>First & <b>x</b></p>")])
+    failing = Item("2", "Other", updates=[make_update("u3", "Lost")])
+    outcome = duplicator.duplicate_updates([(source, "100"), (failing, "200"), (Item("3", "Quiet", updates=[]), "300")], 2)
+
+    assert outcome == {"100": {"copied": 2, "skipped": 0, "failed": 0}, "200": {"copied": 0, "skipped": 0, "failed": 1}}
+    query, variables = mutations.sent[0]
+    assert "$boardId" not in query
+    assert variables["body0"] == "<p><em>Dana · 2024-05-01</em></p><p>First & <b>x</b></p>"
+    assert variables["body1"].endswith("<p>Second</p>")
+
+    # A re-run copies only what is new, and retries what failed
+    source.updates.insert(0, make_update("u4", "Third"))
+    outcome = duplicator.duplicate_updates([(source, "100"), (failing, "200")], 2)
+
+    assert outcome == {"100": {"copied": 1, "skipped": 2, "failed": 0}, "200": {"copied": 0, "skipped": 0, "failed": 1}}
+    assert mutations.sent[1][1]["body0"].endswith("Third")
+
+
+def test_update_credit_is_escaped():
+    update = Update("u1", "Body", None, "<script>")
+    assert MondayItemDuplicator.format_update(update) == "<p><em>&lt;script&gt;</em></p>Body"
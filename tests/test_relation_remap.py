@@ -0,0 +1,75 @@
+"""Tests for relation_remap.RelationRemapper"""
+
+from types import SimpleNamespace
+
+from board_schema import BoardSchema, ColumnSchema
+from item_model import Item
+from relation_remap import RelationRemapper
+
+# Linked item ID -> (board ID, name) on the source side
+LINKED = {1: (10, "Alpha"), 2: (10, "Beta"), 3: (20, "Gamma"), 4: (10, "Orphan")}
+
+
+class FakeDuplicator:
+    def __init__(self, target_items, destination_indexes=None):
+        self.target_items = target_items
+        self.destination_indexes = destination_indexes or {}
+        self.queries = []
+        schema = BoardSchema(2, {"relation": ColumnSchema("relation", "Clients", "board_relation", linked_board_ids=[20])})
+        self.schema_cache = SimpleNamespace(get=lambda board_id: schema)
+
+    def execute_query(self, query, variables):
+        self.queries.append(("items", variables["itemIds"]))
+        return {"items": [
+            {"id": item_id, "name": LINKED[int(item_id)][1], "board": {"id": str(LINKED[int(item_id)][0])}}
+            for item_id in variables["itemIds"] if int(item_id) in LINKED
+        ]}
+
+    def get_items_by_names(self, board_id, names, column_ids=None):
+        self.queries.append(("names", board_id, sorted(names)))
+        return {name: SimpleNamespace(id=self.target_items[name]) for name in names if name in self.target_items}
+
+
+def test_remap_keeps_target_items_and_matches_the_rest_by_name():
+    duplicator = FakeDuplicator({"Alpha": "201", "Beta": "202"})
+    remapper = RelationRemapper(duplicator)
+
+    assert remapper.remap([1, 3, 4, 99], [20]) == ([201, 3], [4, 99])
+    assert duplicator.queries == [("items", ["1", "3", "4", "99"]), ("names", 20, ["Alpha", "Orphan"])]
+
+    # Answers, including misses, are cached for the run
+    assert remapper.remap([4, 1], [20]) == ([201], [4])
+    assert len(duplicator.queries) == 2
+
+
+def test_remap_without_target_boards_keeps_the_ids():
+    assert RelationRemapper(FakeDuplicator({})).remap([1, 2], []) == ([1, 2], [])
+
+
+def test_remap_uses_a_built_destination_index():
+    duplicator = FakeDuplicator({}, destination_indexes={20: {"Beta": SimpleNamespace(id="302")}})
+
+    assert RelationRemapper(duplicator).remap([2], [20]) == ([302], [])
+    assert duplicator.queries == [("items", ["2"])]
+
+
+def test_prefetch_resolves_a_batch_with_one_request_per_step():
+    duplicator = FakeDuplicator({"Alpha": "201", "Beta": "202"})
+    remapper = RelationRemapper(duplicator)
+    items = [
+        Item.from_api({"id": str(item_id), "name": f"Item {item_id}", "column_values": [
+            {"id": "relation", "type": column_type, "text": "", "value": value},
+            {"id": "unmapped", "type": "board-relation", "text": "", "value": '{"linkedPulseIds": [{"linkedPulseId": 4}]}'},
+        ]})
+        for item_id, column_type, value in [
+            (1, "board-relation", '{"linkedPulseIds": [{"linkedPulseId": 1}, {"linkedPulseId": 3}]}'),
+            (2, "board_relation", '{"linkedPulseIds": [{"linkedPulseId": 2}]}'),
+            (3, "board-relation", "{not json"),
+        ]
+    ]
+
+    remapper.prefetch(items, {"relation": "relation"}, 2)
+
+    assert duplicator.queries == [("items", ["1", "3", "2"]), ("names", 20, ["Alpha", "Beta"])]
+    assert remapper.remap([1, 2, 3], [20]) == ([201, 202, 3], [])
+    assert len(duplicator.queries) == 2
@@ -0,0 +1,90 @@
+"""Tests for resilience.CircuitBreaker and error classification"""
+
+import time
+
+import pytest
+import requests
+
+from resilience import CircuitBreaker, CircuitOpen, DeadlineExceeded, is_ambiguous, is_unhealthy
+
+
+def trip(breaker):
+    """Fail requests until the circuit opens"""
+    for _ in range(breaker.failure_threshold):
+        breaker.before_call()
+        breaker.record_failure(TimeoutError("timed out"))
+    assert breaker.is_open
+
+
+def test_opens_after_threshold_and_refuses():
+    breaker = CircuitBreaker(failure_threshold=2, cooldown=60)
+    trip(breaker)
+    with pytest.raises(CircuitOpen):
+        breaker.before_call()
+    assert breaker.trips == 1
+
+
+def test_non_health_errors_do_not_count():
+    breaker = CircuitBreaker(failure_threshold=2, cooldown=60)
+    for _ in range(5):
+        breaker.record_failure(Exception("Query failed with status 429: rate limited"))
+    assert not breaker.is_open
+
+
+def test_successful_trial_closes():
+    breaker = CircuitBreaker(failure_threshold=2, cooldown=0.05)
+    trip(breaker)
+    time.sleep(0.06)
+    breaker.before_call()
+    breaker.record_success()
+    assert not breaker.is_open
+    breaker.before_call()
+
+
+def test_failed_trial_reopens():
+    breaker = CircuitBreaker(failure_threshold=2, cooldown=0.05)
+    trip(breaker)
+    time.sleep(0.06)
+    breaker.before_call()
+    breaker.record_failure(TimeoutError("timed out"))
+    assert breaker.is_open
+    with pytest.raises(CircuitOpen):
+        breaker.before_call()
+
+
+def test_trial_ending_in_non_counting_error_closes():
+    breaker = CircuitBreaker(failure_threshold=2, cooldown=0.05)
+    trip(breaker)
+    time.sleep(0.06)
+    breaker.before_call()
+    breaker.record_failure(Exception("Query failed with status 429: rate limited"))
+    assert not breaker.is_open
+    for _ in range(3):
+        breaker.before_call()
+
+
+def test_abandoned_trial_expires():
+    breaker = CircuitBreaker(failure_threshold=2, cooldown=0.05)
+    trip(breaker)
+    time.sleep(0.06)
+    breaker.before_call()  # Trial that never reports back
+    with pytest.raises(CircuitOpen):
+        breaker.before_call()
+    time.sleep(0.06)
+    breaker.before_call()
+
+
+@pytest.mark.parametrize("error, ambiguous, unhealthy", [
+    # Refused before the request was sent: counts against the host but never applied
+    (requests.exceptions.ConnectTimeout("connect timed out"), False, True),
+    (requests.exceptions.ReadTimeout("read timed out"), True, True),
+    (requests.exceptions.ConnectionError("connection reset"), True, True),
+    (DeadlineExceeded("deadline exceeded"), True, True),
+    (Exception("HTTP error: status 503"), True, True),
+    (Exception("GraphQL errors: invalid column"), False, False),
+    # Only the class counts, not a name that looks like a timeout
+    (type("ReadTimeout", (Exception,), {})("read timed out"), False, False),
+])
+def test_error_classification(error, ambiguous, unhealthy):
+    assert is_ambiguous(error) is ambiguous
+    assert is_unhealthy(error) is unhealthy
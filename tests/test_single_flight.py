@@ -0,0 +1,81 @@
+"""Tests for single_flight.SingleFlight"""
+
+import threading
+import time
+
+import pytest
+
+from single_flight import SingleFlight
+
+
+def run_concurrently(flight, key, fn, callers):
+    """Start callers that all join the call fn is blocked in, and collect their outcomes"""
+    outcomes = [None] * callers
+
+    def caller(index):
+        try:
+            outcomes[index] = flight.do(key, fn)
+        except Exception as e:
+            outcomes[index] = e
+
+    threads = [threading.Thread(target=caller, args=(index,)) for index in range(callers)]
+    for thread in threads:
+        thread.start()
+    return threads, outcomes
+
+
+def wait_for_followers(flight, count):
+    while flight.shared < count:
+        time.sleep(0.001)
+
+
+def test_concurrent_identical_calls_share_one_request():
+    flight = SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def fetch():
+        calls.append(True)
+        release.wait(5)
+        return {"boards": []}
+
+    threads, outcomes = run_concurrently(flight, "query", fetch, 4)
+    wait_for_followers(flight, 3)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert all(outcome is outcomes[0] for outcome in outcomes)
+
+    # Finished calls are not cached: the next caller sends its own request
+    flight.do("query", fetch)
+    assert len(calls) == 2
+
+
+def test_error_is_raised_to_every_waiting_caller():
+    flight = SingleFlight()
+    release = threading.Event()
+
+    def fetch():
+        release.wait(5)
+        raise ConnectionError("connection reset")
+
+    threads, outcomes = run_concurrently(flight, "query", fetch, 3)
+    wait_for_followers(flight, 2)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert all(isinstance(outcome, ConnectionError) for outcome in outcomes)
+    # The failed call is forgotten, so a retry runs again
+    assert flight.do("query", lambda: "ok") == "ok"
+
+
+def test_calls_run_directly_when_nothing_is_in_flight():
+    flight = SingleFlight()
+    assert flight.do("a", lambda: 1) == 1
+    assert flight.do("b", lambda: 2) == 2
+    assert flight.shared == 0
+    with pytest.raises(ValueError):
+        flight.do("a", lambda: int("x"))
@@ -0,0 +1,58 @@
+"""Tests for stream_decode.ItemsPageStream"""
+
+import json
+
+import pytest
+
+from stream_decode import ItemsPageStream
+
+ITEMS = [
+    {"id": "1", "name": 'Quotes \\" and braces }{ ][ in "strings"', "column_values": [{"id": "a", "value": "{\"x\": [1]}"}]},
+    {"id": "2", "name": "Ünïcödé ✅ split across chunks", "column_values": []},
+    {"id": "3", "name": "items", "column_values": [{"id": "items", "value": None}]},
+]
+BODY = json.dumps({
+    "data": {"boards": [{"groups": [{"items_page": {"cursor": "MSw1MDA", "items": ITEMS}}]}]}
+}, ensure_ascii=False).encode("utf-8")
+
+
+def pieces(body: bytes, size: int):
+    return [body[start:start + size] for start in range(0, len(body), size)]
+
+
+# buffer_limit 0 streams every body; the default decodes these small ones in one call
+@pytest.mark.parametrize("buffer_limit", [0, 1 << 20])
+@pytest.mark.parametrize("size", [1, 7, 4096])
+def test_escaped_strings_and_split_characters(buffer_limit, size):
+    stream = ItemsPageStream(pieces(BODY, size), buffer_limit=buffer_limit)
+    assert list(stream) == ITEMS
+    assert stream.data == {"boards": [{"groups": [{"items_page": {"cursor": "MSw1MDA", "items": []}}]}]}
+
+
+@pytest.mark.parametrize("buffer_limit", [0, 1 << 20])
+@pytest.mark.parametrize("cut", [10, len(BODY) // 2, len(BODY) - 5])
+def test_truncated_body_raises(buffer_limit, cut):
+    with pytest.raises(json.JSONDecodeError):
+        list(ItemsPageStream(pieces(BODY[:cut], 16), buffer_limit=buffer_limit))
+
+
+@pytest.mark.parametrize("buffer_limit", [0, 1 << 20])
+def test_graphql_errors_raise(buffer_limit):
+    body = json.dumps({"data": None, "errors": [{"message": "Complexity budget exhausted"}]}).encode("utf-8")
+    with pytest.raises(Exception, match="Complexity budget exhausted"):
+        list(ItemsPageStream(pieces(body, 8), buffer_limit=buffer_limit))
+
+
+def test_generator_closed_when_iteration_stops_early():
+    closed = []
+
+    def chunks():
+        try:
+            yield from pieces(BODY, 16)
+        finally:
+            closed.append(True)
+
+    stream = iter(ItemsPageStream(chunks(), buffer_limit=0))
+    next(stream)
+    stream.close()
+    assert closed == [True]
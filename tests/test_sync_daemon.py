@@ -0,0 +1,108 @@
+"""Tests for sync_daemon.SyncDaemon destination caches and job settlement"""
+
+import json
+from types import SimpleNamespace
+
+from item_model import Item
+from monday_item_duplicator import MondayItemDuplicator
+from sync_daemon import SyncDaemon
+from write_buffer import PendingWrite
+
+
+class FakeDuplicator:
+    """Records destination cache loads"""
+
+    def __init__(self):
+        self.write_buffer = None
+        self.builds = []
+        self.invalidated = []
+        self.schema_cache = SimpleNamespace(invalidate=self.invalidated.append)
+        self.translations = SimpleNamespace(invalidate=lambda board_id: None)
+        self.identities = SimpleNamespace(column=lambda board_id: "source_id" if board_id == 8 else None)
+
+    def build_destination_index(self, board_id, refresh=False):
+        self.builds.append(refresh)
+        return {}
+
+
+def make_daemon(cache_ttl):
+    return SyncDaemon(config_loader=None, duplicator=FakeDuplicator(), queue=None, cache_ttl=cache_ttl)
+
+
+def test_destination_cache_expires():
+    daemon = make_daemon(cache_ttl=60)
+    daemon._load_destination(7)
+    daemon._load_destination(7)
+    assert daemon.duplicator.builds == [False, False]
+    assert daemon.duplicator.invalidated == []
+
+    daemon._loaded_at[7] -= 61
+    daemon._load_destination(7)
+    assert daemon.duplicator.builds == [False, False, True]
+    assert daemon.duplicator.invalidated == [7]
+
+
+class BoardAPI:
+    """Transport serving one board's items, with name lookups"""
+
+    def __init__(self):
+        self.items = []
+
+    def post(self, payload):
+        variables = payload.get("variables") or {}
+        items = self.items
+        if variables.get("columnId") == "name":
+            items = [item for item in items if item["name"] in variables["values"]]
+        page = {"cursor": None, "items": [dict(item, group={"id": "topics", "title": "Topics"}, column_values=[])
+                                          for item in items]}
+        return 200, json.dumps({"data": {"boards": [{"items_page": page}]}})
+
+
+def test_item_created_after_index_is_found_by_recheck():
+    api = BoardAPI()
+    duplicator = MondayItemDuplicator("test", transport=api, hedge_reads=False)
+    duplicator.build_destination_index(7)
+
+    # Created by another run after the index was built
+    api.items.append({"id": "99", "name": "Item A"})
+    source_item = Item("1", "Item A")
+    assert duplicator.find_existing_item(7, source_item) is None
+
+    assert duplicator.recheck_existing_item(7, source_item).id == "99"
+    assert duplicator.find_existing_item(7, source_item).id == "99"
+
+
+class FakeQueue:
+    """Records how jobs were settled"""
+
+    def __init__(self):
+        self.settled = []
+
+    def complete(self, job):
+        self.settled.append(("done", job.id))
+
+    def fail(self, job, error, max_attempts, backoff_seconds):
+        self.settled.append(("failed", job.id, error))
+
+
+def test_job_is_settled_when_its_buffered_writes_are_sent():
+    daemon = make_daemon(cache_ttl=60)
+    daemon.queue = FakeQueue()
+    job = SimpleNamespace(id=1, attempts=0)
+    writes = [PendingWrite("Topic", {}, False), PendingWrite("Topic", {}, False)]
+
+    daemon._complete_after(job, 1, {"action": "UPDATED", "item_name": "Topic"}, writes)
+    writes[0].finish({"id": "10", "name": "Topic"}, None)
+    assert daemon.queue.settled == []
+
+    writes[1].finish(None, ValueError("Complexity budget exhausted"))
+    assert daemon.queue.settled == [("failed", 1, "Complexity budget exhausted")]
+
+
+def test_creates_of_one_destination_item_share_a_lock():
+    daemon = make_daemon(cache_ttl=60)
+
+    # Matched by name, so different source items with one name create one item
+    assert daemon._create_lock(7, Item("1", "Topic")) is daemon._create_lock(7, Item("2", "Topic"))
+    # Matched by source item ID on boards with an identity column
+    assert daemon._create_lock(8, Item("1", "Topic")) is daemon._create_lock(8, Item("1", "Renamed"))
@@ -0,0 +1,73 @@
+"""Tests for value_translation label and option translation"""
+
+import pytest
+
+from board_schema import BoardSchema, ColumnSchema
+from value_translation import TranslationCache, TranslationTable
+
+
+def status_column(*labels):
+    return ColumnSchema(id="status", title="Status", type="status",
+                        status_labels={label: index for index, label in enumerate(labels)})
+
+
+def dropdown_column(options):
+    return ColumnSchema(id="dropdown", title="Tags", type="dropdown", dropdown_options=options)
+
+
+def test_status_labels_match_ignoring_case_and_spacing():
+    table = TranslationTable("status", status_column("Done"), status_column("Working  on it", "DONE"))
+
+    assert table.translate_label("done") == "DONE"
+    assert table.translate_label("Working on it") == "Working  on it"
+
+
+def test_unknown_status_label_follows_the_policy():
+    table = TranslationTable("status", status_column("Stuck"), status_column("Done"))
+
+    assert table.translate_label("Stuck") is None
+    assert table.translate_label("Stuck", policy="create") == "Stuck"
+    with pytest.raises(ValueError, match="Label 'Stuck' does not exist in 'Status'"):
+        table.translate_label("Stuck", policy="error")
+
+
+def test_dropdown_options_are_translated_by_name():
+    table = TranslationTable(
+        "dropdown",
+        dropdown_column({1: "SEO", 2: "Blog", 3: "News"}),
+        dropdown_column({10: "blog", 11: "seo"})
+    )
+
+    assert table.translate_ids([1, "2"]) == {"ids": [11, 10]}
+    # Unknown options are dropped, or written as labels so they can be created
+    assert table.translate_ids([2, 3]) == {"ids": [10]}
+    assert table.translate_ids([3]) is None
+    assert table.translate_ids([2, 3], policy="create") == {"labels": ["Blog", "News"]}
+    with pytest.raises(ValueError, match=r"\['News'\]"):
+        table.translate_ids([3], policy="error")
+
+
+class FakeSchemaCache:
+    def __init__(self, boards):
+        self.boards = boards
+        self.prefetched = []
+
+    def prefetch(self, board_ids):
+        self.prefetched.append(list(board_ids))
+
+    def get(self, board_id):
+        return self.boards[board_id]
+
+
+def test_cache_builds_each_table_once_and_only_for_matching_types():
+    source = BoardSchema(1, {"status": status_column("Done"), "text": ColumnSchema("text", "Notes", "text")})
+    dest = BoardSchema(2, {"status": status_column("Done"), "dropdown": dropdown_column({})})
+    schemas = FakeSchemaCache({1: source, 2: dest})
+    cache = TranslationCache(schemas)
+
+    table = cache.get(1, "status", 2, "status")
+    assert table.translate_label("done") == "Done"
+    assert cache.get(1, "status", 2, "status") is table
+    assert cache.get(1, "text", 2, "dropdown") is None
+    assert cache.get(1, "status", 2, "missing") is None
+    assert schemas.prefetched == [[1, 2], [1, 2], [1, 2]]
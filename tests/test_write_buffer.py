@@ -0,0 +1,112 @@
+"""Tests for write_buffer.WriteBuffer coalescing"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from write_buffer import WriteBuffer
+
+
+class FakeWriter:
+    """Records each batched write and answers every op with the item it updated"""
+
+    def __init__(self, error=None):
+        self.batches = []
+        self.error = error
+
+    def write(self, board_id, ops):
+        self.batches.append((board_id, [(op.item_id, op.column_values, op.create_labels) for op in ops]))
+        if self.error is not None:
+            raise self.error
+        return [{"id": op.item_id, "name": op.item_name} for op in ops]
+
+
+def make_buffer(writer):
+    # A long window, so only the explicit flush() or close() sends anything
+    return WriteBuffer(SimpleNamespace(writer=writer), window=60)
+
+
+def test_updates_of_one_item_are_combined_last_writer_wins():
+    writer = FakeWriter()
+    buffer = make_buffer(writer)
+
+    first = buffer.add(1, "10", {"status": {"label": "Done"}, "text": "a"}, item_name="Topic")
+    second = buffer.add(1, "10", {"text": "b"}, item_name="Topic", create_labels=True)
+    other = buffer.add(1, "11", {"text": "c"}, item_name="Other")
+    elsewhere = buffer.add(2, "10", {"text": "d"}, item_name="Topic")
+    buffer.close()
+
+    assert first is second
+    assert writer.batches == [
+        (1, [("10", {"status": {"label": "Done"}, "text": "b"}, True), ("11", {"text": "c"}, False)]),
+        (2, [("10", {"text": "d"}, False)]),
+    ]
+    assert first.wait(0) == {"id": "10", "name": "Topic"}
+    assert other.wait(0) == {"id": "11", "name": "Other"}
+    assert elsewhere.wait(0) == {"id": "10", "name": "Topic"}
+    assert (buffer.merged, buffer.sent) == (1, 3)
+
+
+def test_updates_after_a_flush_start_a_new_write():
+    writer = FakeWriter()
+    buffer = make_buffer(writer)
+
+    buffer.add(1, "10", {"text": "a"})
+    buffer.flush()
+    later = buffer.add(1, "10", {"text": "b"})
+    buffer.close()
+
+    assert [ops for _, ops in writer.batches] == [[("10", {"text": "a"}, False)], [("10", {"text": "b"}, False)]]
+    assert later.wait(0) == {"id": "10", "name": ""}
+    assert buffer.merged == 0
+
+
+def test_failed_write_is_raised_to_every_merged_writer():
+    buffer = make_buffer(FakeWriter(error=ValueError("Complexity budget exhausted")))
+
+    first = buffer.add(1, "10", {"text": "a"})
+    second = buffer.add(1, "10", {"text": "b"})
+    buffer.close()
+
+    for write in (first, second):
+        with pytest.raises(ValueError, match="Complexity budget exhausted"):
+            write.wait(0)
+
+
+def test_wait_times_out_while_pending():
+    buffer = make_buffer(FakeWriter())
+    write = buffer.add(1, "10", {"text": "a"})
+
+    with pytest.raises(TimeoutError):
+        write.wait(0)
+    buffer.close()
+
+
+def test_full_batch_is_flushed_before_the_window_ends():
+    writer = FakeWriter()
+    buffer = WriteBuffer(SimpleNamespace(writer=writer), window=60, batch_size=2)
+
+    first = buffer.add(1, "10", {"text": "a"})
+    second = buffer.add(1, "11", {"text": "b"})
+
+    assert first.wait(5) == {"id": "10", "name": ""}
+    assert second.wait(5) == {"id": "11", "name": ""}
+    assert len(writer.batches) == 1
+    buffer.close()
+
+
+def test_added_writes_are_handed_to_their_thread_and_call_back_when_sent():
+    buffer = make_buffer(FakeWriter())
+    write = buffer.add(1, "10", {"text": "a"})
+    settled = []
+    write.add_done_callback(settled.append)
+
+    assert buffer.take_added() == [write]
+    assert buffer.take_added() == []
+    assert settled == []
+
+    buffer.close()
+    assert settled == [write]
+    # Registered after the flush: called right away
+    write.add_done_callback(settled.append)
+    assert settled == [write, write]
@@ -0,0 +1,100 @@
+"""
+Update Log for Monday.com Item Duplicator
+Remembers which item updates (comments) were already copied to which destination item
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, List, Set, Tuple
+
+
+class UpdateLog:
+    """SQLite-backed record of copied updates"""
+
+    def __init__(self, path: str = "data/updates.sqlite3"):
+        """
+        Open (or create) the update log database
+
+        Args:
+            path: Path to the SQLite database file
+        """
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS copied_updates (
+                source_update_id TEXT NOT NULL,
+                dest_item_id TEXT NOT NULL,
+                dest_board_id INTEGER NOT NULL,
+                dest_update_id TEXT,
+                copied_at REAL NOT NULL,
+                PRIMARY KEY (dest_item_id, source_update_id)
+            )
+        """)
+
+    def copied(self, dest_item_ids: List[str], chunk_size: int = 500) -> Dict[str, Set[str]]:
+        """
+        Get the source updates already copied to destination items
+
+        Args:
+            dest_item_ids: Destination item IDs
+            chunk_size: Item IDs per SQL query
+
+        Returns:
+            Dictionary mapping each destination item ID to its copied source update IDs
+        """
+        wanted = list(dict.fromkeys(map(str, dest_item_ids)))
+        copied = {item_id: set() for item_id in wanted}
+
+        with self._lock:
+            for start in range(0, len(wanted), chunk_size):
+                chunk = wanted[start:start + chunk_size]
+                rows = self._conn.execute(
+                    "SELECT dest_item_id, source_update_id FROM copied_updates "
+                    f"WHERE dest_item_id IN ({', '.join('?' * len(chunk))})",
+                    chunk
+                ).fetchall()
+                for dest_item_id, source_update_id in rows:
+                    copied[dest_item_id].add(source_update_id)
+
+        return copied
+
+    def record_many(self, dest_board_id: int, copies: List[Tuple[str, str, str]]):
+        """
+        Record copied updates (one transaction)
+
+        Args:
+            dest_board_id: Destination board ID
+            copies: (source update ID, destination item ID, destination update ID) tuples
+        """
+        if not copies:
+            return
+
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO copied_updates (source_update_id, dest_item_id, dest_board_id, "
+                    "dest_update_id, copied_at) VALUES (?, ?, ?, ?, ?)",
+                    [
+                        (str(source_id), str(dest_item_id), dest_board_id, str(dest_update_id), now)
+                        for source_id, dest_item_id, dest_update_id in copies
+                    ]
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def close(self):
+        """Close the database connection"""
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,147 @@
+"""
+Value Translation for Monday.com Item Duplicator
+Cross-board translation tables for status labels and dropdown options
+"""
+
+import threading
+from typing import Dict, List, Optional
+
+from board_schema import SchemaCache
+
+# What to do with a label that has no counterpart on the destination column
+UNKNOWN_LABEL_POLICIES = ("skip", "create", "error")
+
+
+def _normalize(label: str) -> str:
+    """Normalize a label for matching across boards"""
+    return " ".join((label or "").split()).casefold()
+
+
+class TranslationTable:
+    """Translates status labels or dropdown options from one column to another"""
+
+    def __init__(self, kind: str, source_column, dest_column):
+        """
+        Build the table from both columns' settings
+
+        Args:
+            kind: "status" or "dropdown"
+            source_column: ColumnSchema of the source column
+            dest_column: ColumnSchema of the destination column
+        """
+        self.kind = kind
+        self.dest_title = dest_column.title
+
+        # Status: normalized label -> destination label
+        self.labels: Dict[str, str] = {}
+        # Dropdown: source option id -> destination option id
+        self.ids: Dict[int, int] = {}
+        # Dropdown: source option id -> source option name
+        self.source_names: Dict[int, str] = dict(source_column.dropdown_options)
+
+        if kind == "status":
+            self.labels = {_normalize(label): label for label in dest_column.status_labels}
+        else:
+            dest_ids = {_normalize(name): option_id for option_id, name in dest_column.dropdown_options.items()}
+            for option_id, name in source_column.dropdown_options.items():
+                if _normalize(name) in dest_ids:
+                    self.ids[option_id] = dest_ids[_normalize(name)]
+
+    def translate_label(self, label: str, policy: str = "skip") -> Optional[str]:
+        """
+        Translate a status label
+
+        Returns:
+            Destination label, or None if the value should be skipped
+        """
+        translated = self.labels.get(_normalize(label))
+        if translated is not None:
+            return translated
+
+        if policy == "create":
+            return label
+        if policy == "error":
+            raise ValueError(f"Label '{label}' does not exist in '{self.dest_title}'")
+        return None
+
+    def translate_ids(self, ids: List[int], policy: str = "skip") -> Optional[Dict]:
+        """
+        Translate dropdown option ids
+
+        Returns:
+            Destination dropdown value ({"ids": [...]} or {"labels": [...]} when
+            missing options are created), or None if nothing is left to write
+        """
+        translated = []
+        unknown = []
+        for option_id in ids:
+            option_id = int(option_id)
+            if option_id in self.ids:
+                translated.append(self.ids[option_id])
+            else:
+                unknown.append(option_id)
+
+        if unknown:
+            names = [self.source_names.get(option_id, str(option_id)) for option_id in unknown]
+            if policy == "error":
+                raise ValueError(f"Option(s) {names} do not exist in '{self.dest_title}'")
+            if policy == "create":
+                # Option ids cannot be created - switch to labels so they can be
+                labels = [self.source_names.get(option_id, str(option_id)) for option_id in ids]
+                return {"labels": labels}
+
+        return {"ids": translated} if translated else None
+
+
+class TranslationCache:
+    """Caches translation tables per (source column, destination column) for a run"""
+
+    def __init__(self, schema_cache: SchemaCache):
+        """
+        Initialize translation cache
+
+        Args:
+            schema_cache: Schema cache providing both boards' column settings
+        """
+        self.schema_cache = schema_cache
+        self.tables: Dict[tuple, Optional[TranslationTable]] = {}
+        self._lock = threading.Lock()
+
+    def get(
+        self,
+        source_board_id: int,
+        source_column_id: str,
+        dest_board_id: int,
+        dest_column_id: str
+    ) -> Optional[TranslationTable]:
+        """
+        Get the translation table for a column pair, building it on first use
+
+        Returns:
+            TranslationTable, or None if the columns are not a status or dropdown pair
+        """
+        key = (int(source_board_id), source_column_id, int(dest_board_id), dest_column_id)
+        if key in self.tables:
+            return self.tables[key]
+
+        with self._lock:
+            if key not in self.tables:
+                self.schema_cache.prefetch([source_board_id, dest_board_id])
+                source_column = self.schema_cache.get(source_board_id).columns.get(source_column_id)
+                dest_column = self.schema_cache.get(dest_board_id).columns.get(dest_column_id)
+
+                table = None
+                if source_column and dest_column and source_column.type == dest_column.type:
+                    if source_column.type in ("status", "dropdown"):
+                        table = TranslationTable(source_column.type, source_column, dest_column)
+
+                self.tables[key] = table
+
+        return self.tables[key]
+
+    def invalidate(self, board_id: int):
+        """Forget the tables translating from or to a board (its schema may have changed)"""
+        board_id = int(board_id)
+        with self._lock:
+            for key in [key for key in self.tables if board_id in (key[0], key[2])]:
+                del self.tables[key]
@@ -0,0 +1,204 @@
+"""
+Write Buffer for Monday.com Item Duplicator
+Combines column updates to the same destination item within a flush window
+"""
+
+import threading
+from typing import Callable, Dict, List, Optional, Tuple
+
+from batch_writer import WriteOp
+
+
+class PendingWrite:
+    """One buffered item update, shared by every write merged into it"""
+    __slots__ = ("item_name", "column_values", "create_labels", "done", "result", "error", "callbacks", "_lock")
+
+    def __init__(self, item_name: str, column_values: Dict, create_labels: bool):
+        self.item_name = item_name
+        self.column_values = dict(column_values)
+        self.create_labels = create_labels
+        self.done = threading.Event()
+        self.result: Optional[Dict] = None
+        self.error: Optional[Exception] = None
+        self.callbacks: List[Callable[["PendingWrite"], None]] = []
+        self._lock = threading.Lock()
+
+    def wait(self, timeout: Optional[float] = None) -> Dict:
+        """
+        Wait for the combined update to be sent
+
+        Returns:
+            The {"id", "name"} of the updated item (an exception that made the
+            combined update fail is raised to every writer merged into it)
+        """
+        if not self.done.wait(timeout):
+            raise TimeoutError(f"Buffered update of '{self.item_name}' was not flushed in time")
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+    def add_done_callback(self, callback: Callable[["PendingWrite"], None]):
+        """Call callback(write) once the combined update is sent (right away if it already was)"""
+        with self._lock:
+            if not self.done.is_set():
+                self.callbacks.append(callback)
+                return
+        callback(self)
+
+    def finish(self, result: Optional[Dict], error: Optional[Exception]):
+        """Record the outcome of the combined update and run the callbacks"""
+        with self._lock:
+            self.result = result
+            self.error = error
+            self.done.set()
+            callbacks, self.callbacks = self.callbacks, []
+
+        for callback in callbacks:
+            try:
+                callback(self)
+            except Exception as e:
+                print(f"⚠️  Callback for buffered update of '{self.item_name}' failed: {e}")
+
+
+class WriteBuffer:
+    """
+    Merges pending column updates per (board, item) and flushes them as batches
+
+    When several sources or workflows map onto the same destination item
+    (e.g. client rollup boards), their updates within one flush window are
+    combined into a single change_multiple_column_values, last writer wins
+    per column. Every flush sends the combined updates of a board as aliased
+    mutations through the duplicator's BatchWriter. A board with a full batch
+    pending is flushed without waiting for the end of the window.
+
+    add() does not wait for the flush. Callers learn the outcome from the
+    PendingWrite it returns, and take_added() hands a thread the writes it
+    added, so a worker can settle its job later and move on.
+
+    Only updates are buffered. Creates are sent directly, because an item has
+    no ID to merge on until it exists; callers that may create the same item
+    concurrently have to serialize those creates themselves.
+    """
+
+    def __init__(self, duplicator, window: float = 2.0, batch_size: int = 50):
+        """
+        Initialize write buffer
+
+        Args:
+            duplicator: MondayItemDuplicator whose BatchWriter sends the updates
+            window: Seconds between flushes (how long an update may wait for others)
+            batch_size: Pending updates of one board that trigger a flush before the window ends
+        """
+        self.duplicator = duplicator
+        self.window = window
+        self.batch_size = batch_size
+
+        # (board ID, item ID) -> pending update, in arrival order
+        self.pending: Dict[Tuple[int, str], PendingWrite] = {}
+        # Board ID -> number of pending updates
+        self._board_counts: Dict[int, int] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        # Updates folded into one already pending, and combined updates sent
+        self.merged = 0
+        self.sent = 0
+
+    def add(
+        self,
+        board_id: int,
+        item_id: str,
+        column_values: Dict,
+        item_name: str = "",
+        create_labels: bool = False
+    ) -> PendingWrite:
+        """
+        Buffer a column update of an item
+
+        Columns already pending for the item are overwritten by this update.
+
+        Returns:
+            PendingWrite to wait on for the outcome of the combined update
+        """
+        key = (int(board_id), str(item_id))
+        with self._lock:
+            write = self.pending.get(key)
+            if write is None:
+                write = PendingWrite(item_name, column_values, create_labels)
+                self.pending[key] = write
+                count = self._board_counts.get(key[0], 0) + 1
+                self._board_counts[key[0]] = count
+                if count >= self.batch_size:
+                    self._wake.set()
+            else:
+                write.column_values.update(column_values)
+                write.create_labels = write.create_labels or create_labels
+                self.merged += 1
+
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+
+        if not hasattr(self._local, "added"):
+            self._local.added = []
+        self._local.added.append(write)
+        return write
+
+    def take_added(self) -> List[PendingWrite]:
+        """Get (and forget) the writes the calling thread added since its last call"""
+        added = getattr(self._local, "added", [])
+        self._local.added = []
+        return added
+
+    def flush(self):
+        """Send every pending update now, one batched write per board"""
+        with self._lock:
+            pending, self.pending = self.pending, {}
+            self._board_counts = {}
+        if not pending:
+            return
+
+        boards: Dict[int, List[Tuple[str, PendingWrite]]] = {}
+        for (board_id, item_id), write in pending.items():
+            boards.setdefault(board_id, []).append((item_id, write))
+
+        for board_id, writes in boards.items():
+            ops = [
+                WriteOp(
+                    kind="update",
+                    column_values=write.column_values,
+                    item_name=write.item_name,
+                    item_id=item_id,
+                    create_labels=write.create_labels
+                )
+                for item_id, write in writes
+            ]
+            try:
+                results = self.duplicator.writer.write(board_id, ops)
+            except Exception as e:
+                results = [e] * len(ops)
+
+            self.sent += len(ops)
+            for (_, write), result in zip(writes, results):
+                if isinstance(result, Exception):
+                    write.finish(None, result)
+                else:
+                    write.finish(result, None)
+
+    def _run(self):
+        """Flush once per window, or as soon as a board has a full batch, until closed"""
+        while not self._stop.is_set():
+            self._wake.wait(self.window)
+            self._wake.clear()
+            self.flush()
+
+    def close(self):
+        """Stop the flush thread and send what is still pending"""
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.flush()